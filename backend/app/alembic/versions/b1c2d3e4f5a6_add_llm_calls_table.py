@@ -0,0 +1,48 @@
+"""add llm_calls telemetry table
+
+Revision ID: b1c2d3e4f5a6
+Revises: def789abc012
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'b1c2d3e4f5a6'
+down_revision: Union[str, Sequence[str], None] = 'def789abc012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_calls table."""
+    op.create_table(
+        'llm_calls',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('provider', sa.String(length=50), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('tool_name', sa.String(length=100), nullable=True),
+        sa.Column('caller', sa.String(length=100), nullable=True),
+        sa.Column('latency_ms', sa.Integer(), nullable=False),
+        sa.Column('total_ms', sa.Integer(), nullable=False),
+        sa.Column('retries', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('prompt_tokens', sa.Integer(), nullable=True),
+        sa.Column('completion_tokens', sa.Integer(), nullable=True),
+        sa.Column('cached_tokens', sa.Integer(), nullable=True),
+        sa.Column('cache_hit', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('cost_usd', sa.Float(), nullable=True),
+        sa.Column('outcome', sa.String(length=20), nullable=False),
+        sa.Column('error_type', sa.String(length=100), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_llm_calls_created_at'), 'llm_calls', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop llm_calls table."""
+    op.drop_index(op.f('ix_llm_calls_created_at'), table_name='llm_calls')
+    op.drop_table('llm_calls')
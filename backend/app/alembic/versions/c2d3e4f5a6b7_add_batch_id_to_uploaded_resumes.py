@@ -0,0 +1,30 @@
+"""add batch_id to uploaded_resumes
+
+Revision ID: c2d3e4f5a6b7
+Revises: b1c2d3e4f5a6
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'c2d3e4f5a6b7'
+down_revision: Union[str, Sequence[str], None] = 'b1c2d3e4f5a6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add nullable batch_id column with an index."""
+    op.add_column('uploaded_resumes', sa.Column('batch_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_index(op.f('ix_uploaded_resumes_batch_id'), 'uploaded_resumes', ['batch_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop batch_id column."""
+    op.drop_index(op.f('ix_uploaded_resumes_batch_id'), table_name='uploaded_resumes')
+    op.drop_column('uploaded_resumes', 'batch_id')
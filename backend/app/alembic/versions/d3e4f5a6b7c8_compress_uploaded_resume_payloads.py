@@ -0,0 +1,59 @@
+"""store uploaded resume payloads as compressed jsonb/text
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = 'd3e4f5a6b7c8'
+down_revision: Union[str, Sequence[str], None] = 'c2d3e4f5a6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert extracted_data to JSONB and add raw_markdown, both TOAST-compressed."""
+    op.alter_column(
+        'uploaded_resumes',
+        'extracted_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=False,
+        postgresql_using='extracted_data::jsonb',
+    )
+    op.add_column('uploaded_resumes', sa.Column('raw_markdown', sa.Text(), nullable=True))
+    # EXTENDED = compress, then move out of line; lz4 (PostgreSQL 14+, when
+    # compiled in) is much faster than the default pglz
+    op.execute("ALTER TABLE uploaded_resumes ALTER COLUMN extracted_data SET STORAGE EXTENDED")
+    op.execute("ALTER TABLE uploaded_resumes ALTER COLUMN raw_markdown SET STORAGE EXTENDED")
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE uploaded_resumes ALTER COLUMN extracted_data SET COMPRESSION lz4;
+            ALTER TABLE uploaded_resumes ALTER COLUMN raw_markdown SET COMPRESSION lz4;
+        EXCEPTION WHEN others THEN
+            RAISE NOTICE 'lz4 column compression unavailable, keeping pglz';
+        END $$;
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop raw_markdown and convert extracted_data back to JSON."""
+    op.drop_column('uploaded_resumes', 'raw_markdown')
+    op.alter_column(
+        'uploaded_resumes',
+        'extracted_data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='extracted_data::json',
+    )
@@ -0,0 +1,41 @@
+"""add composite indexes for keyset pagination
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e4f5a6b7c8d9'
+down_revision: Union[str, Sequence[str], None] = 'd3e4f5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns): each matches the ORDER BY of a paginated listing
+INDEXES = [
+    ('ix_users_created_at_id', 'users', ['created_at', 'id']),
+    ('ix_work_experiences_profile_start_date', 'work_experiences', ['profile_id', 'start_date', 'id']),
+    ('ix_education_profile_end_date', 'education', ['profile_id', 'end_date', 'id']),
+    ('ix_certificates_profile_issue_date', 'certificates', ['profile_id', 'issue_date', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Create the indexes without locking the tables against writes."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the keyset pagination indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -1,4 +1,5 @@
 """Celery application initialization and configuration."""
+import asyncio
 import logging
 import os
 
@@ -27,12 +28,40 @@ def _init_worker_logging():
     )
 
 
-from celery.signals import worker_process_init
+from celery.signals import worker_process_init, worker_ready
+
+
+def _warm_up_docling():
+    """Load the Docling models in the background so the first CV is not slow."""
+    from core.config import get_settings
+
+    settings = get_settings()
+    if not settings.DOCLING_WARMUP_ON_START:
+        return
+    if settings.DOCLING_PROCESS_POOL_ENABLED:
+        from features.resume_import.conversion_pool import get_conversion_pool
+
+        # Conversions run in the pool: start its processes (they load the models)
+        get_conversion_pool().warm_up()
+    else:
+        from core.docling_converter import start_background_warmup
+
+        start_background_warmup()
 
 
 @worker_process_init.connect(weak=False)
 def on_worker_process_init(**kwargs):
     _init_worker_logging()
+    _warm_up_docling()
+
+
+@worker_ready.connect(weak=False)
+def on_worker_ready(sender=None, **kwargs):
+    # threads/solo pools run tasks in the main worker process, where
+    # worker_process_init never fires
+    pool_cls = getattr(getattr(sender, "controller", None), "pool_cls", None)
+    if pool_cls is not None and "prefork" not in getattr(pool_cls, "__module__", ""):
+        _warm_up_docling()
 
 
 # Create Celery app
@@ -40,6 +69,10 @@ celery_app = Celery(
     'caiv',
     broker=os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
     backend=os.getenv('REDIS_BACKEND_URL', 'redis://localhost:6379/1'),
+    include=[
+        'features.vector_embeddings.tasks',
+        'features.resume_import.tasks',
+    ],
 )
 
 # Configure Celery
@@ -61,10 +94,21 @@ celery_app.conf.update(
     task_default_queue='default',
     task_routes={
         'embedding.*': {'queue': 'embeddings'},
+        # CV parsing is slow (Docling + LLM): keep it off the default queue so it
+        # can be scaled with its own workers
+        'resume_import.*': {'queue': 'resume_parsing'},
     },
     task_queues={
         'default': {'exchange': 'default', 'routing_key': 'default'},
         'embeddings': {'exchange': 'embeddings', 'routing_key': 'embeddings'},
+        'resume_parsing': {'exchange': 'resume_parsing', 'routing_key': 'resume_parsing'},
+    },
+    # Periodic tasks (run `celery beat` next to the workers)
+    beat_schedule={
+        'fail-stale-resume-imports': {
+            'task': 'resume_import.fail_stale_imports',
+            'schedule': crontab(minute='*/5'),
+        },
     },
 )
 
@@ -72,3 +116,16 @@ celery_app.conf.update(
 def get_celery_app():
     """Return the Celery app instance."""
     return celery_app
+
+
+def run_async(coro):
+    """Run an async coroutine from a Celery task, handling event loop conflicts."""
+    try:
+        loop = asyncio.get_running_loop()
+        if loop.is_running():
+            import nest_asyncio
+            nest_asyncio.apply()
+            return loop.run_until_complete(coro)
+    except RuntimeError:
+        pass
+    return asyncio.run(coro)
@@ -2,7 +2,7 @@
 Application configuration and settings
 """
 
-from typing import List, Union
+from typing import List, Literal, Optional, Union
 from pydantic import Field
 from pydantic_settings import BaseSettings
 from functools import lru_cache
@@ -20,6 +20,53 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = Field(env="DATABASE_URL", description="Database connection URL")
+    DB_ECHO: bool = Field(default=False, env="DB_ECHO", description="Log every SQL statement")
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        env="DB_POOL_SIZE",
+        description="Connections kept open per engine and process",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        env="DB_MAX_OVERFLOW",
+        description="Extra connections opened when the pool is exhausted",
+    )
+    DB_POOL_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        env="DB_POOL_TIMEOUT_SECONDS",
+        description="How long a checkout waits for a free connection before failing",
+    )
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=300, env="DB_POOL_RECYCLE_SECONDS")
+    DB_POOL_PING: Literal["always", "idle", "never"] = Field(
+        default="idle",
+        env="DB_POOL_PING",
+        description="When to check a connection is alive on checkout (see db/pool.py)",
+    )
+    DB_POOL_PING_IDLE_SECONDS: float = Field(
+        default=30.0,
+        env="DB_POOL_PING_IDLE_SECONDS",
+        description="Idle time after which the 'idle' strategy pings a connection",
+    )
+    DB_PGBOUNCER_MODE: bool = Field(
+        default=False,
+        env="DB_PGBOUNCER_MODE",
+        description="Disable asyncpg prepared statement caches (PgBouncer transaction pooling)",
+    )
+    DATABASE_REPLICA_URL: Optional[str] = Field(
+        default=None,
+        env="DATABASE_REPLICA_URL",
+        description="Read replica for read-only endpoints (see db/routing.py); unset reads from the primary",
+    )
+    DATABASE_REPLICA_MAX_LAG_SECONDS: float = Field(
+        default=5.0,
+        env="DATABASE_REPLICA_MAX_LAG_SECONDS",
+        description="Replication lag above which reads fall back to the primary",
+    )
+    DATABASE_REPLICA_LAG_CHECK_SECONDS: float = Field(
+        default=5.0,
+        env="DATABASE_REPLICA_LAG_CHECK_SECONDS",
+        description="How often the replica's lag is measured",
+    )
 
     # Security
     JWT_SECRET: str = Field(env="JWT_SECRET", description="JWT signing secret")
@@ -49,6 +96,70 @@ class Settings(BaseSettings):
         env="GROQ_MODEL",
         description="Groq model for LLM calls",
     )
+    LLM_REQUESTS_PER_MINUTE: int = Field(
+        default=30,
+        env="LLM_REQUESTS_PER_MINUTE",
+        description="Requests-per-minute budget per LLM model",
+    )
+    LLM_TOKENS_PER_MINUTE: int = Field(
+        default=12000,
+        env="LLM_TOKENS_PER_MINUTE",
+        description="Tokens-per-minute budget per LLM model",
+    )
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=4,
+        env="LLM_MAX_CONCURRENCY",
+        description="Maximum in-flight LLM calls per model and process",
+    )
+    LLM_MAX_RETRIES: int = Field(
+        default=5,
+        env="LLM_MAX_RETRIES",
+        description="Retries for rate-limited or transient LLM failures",
+    )
+    LLM_TELEMETRY_ENABLED: bool = Field(
+        default=True,
+        env="LLM_TELEMETRY_ENABLED",
+        description="Store latency, token usage and cost of every LLM call",
+    )
+    LLM_PROMPT_COMPACTION: bool = Field(
+        default=True,
+        env="LLM_PROMPT_COMPACTION",
+        description="Compact Docling markdown (tables, whitespace, page boilerplate) before LLM calls",
+    )
+
+    # LLM routing (fallback models/providers, hedged requests)
+    GROQ_FALLBACK_MODELS: str = Field(
+        default="",
+        env="GROQ_FALLBACK_MODELS",
+        description="Comma-separated smaller Groq models to fall back to",
+    )
+    OPENAI_COMPAT_BASE_URL: Optional[str] = Field(
+        default=None,
+        env="OPENAI_COMPAT_BASE_URL",
+        description="Base URL of an OpenAI-compatible API used as fallback",
+    )
+    OPENAI_COMPAT_API_KEY: Optional[str] = Field(
+        default=None, env="OPENAI_COMPAT_API_KEY"
+    )
+    OPENAI_COMPAT_MODEL: Optional[str] = Field(
+        default=None, env="OPENAI_COMPAT_MODEL"
+    )
+    LOCAL_LLM_BASE_URL: Optional[str] = Field(
+        default=None,
+        env="LOCAL_LLM_BASE_URL",
+        description="OpenAI-compatible local server (Ollama, vLLM, llama.cpp)",
+    )
+    LOCAL_LLM_MODEL: Optional[str] = Field(default=None, env="LOCAL_LLM_MODEL")
+    LLM_HEDGING_ENABLED: bool = Field(
+        default=False,
+        env="LLM_HEDGING_ENABLED",
+        description="Send a duplicate request to the next backend when the first is slow",
+    )
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = Field(
+        default=10.0,
+        env="LLM_HEDGE_MIN_DELAY_SECONDS",
+        description="Never hedge before this delay, even if the p95 latency is lower",
+    )
 
     # Vector Embeddings (pgvector)
     EMBEDDING_MODEL: str = Field(
@@ -74,6 +185,97 @@ class Settings(BaseSettings):
         description="Redis URL for Celery result backend",
     )
 
+    # Resume import
+    RESUME_UPLOAD_DIR: str = Field(
+        default=str(Path(__file__).parent.parent / "uploads" / "resumes"),
+        env="RESUME_UPLOAD_DIR",
+        description="Where uploaded CVs wait for the parsing worker (shared with Celery workers)",
+    )
+    RESUME_BATCH_MAX_FILES: int = Field(
+        default=500,
+        env="RESUME_BATCH_MAX_FILES",
+        description="Maximum number of CVs accepted by one batch upload",
+    )
+    RESUME_BATCH_MAX_ZIP_MB: int = Field(
+        default=512,
+        env="RESUME_BATCH_MAX_ZIP_MB",
+        description="Maximum size of a ZIP archive in a batch upload",
+    )
+    RESUME_PARSE_STALE_SECONDS: int = Field(
+        default=900,
+        env="RESUME_PARSE_STALE_SECONDS",
+        description="Resumes left 'processing' longer than this (e.g. a worker killed at the "
+                    "hard time limit) are marked failed by the reaper task",
+    )
+
+    PDF_FAST_PATH_ENABLED: bool = Field(
+        default=True,
+        env="PDF_FAST_PATH_ENABLED",
+        description="Read the PDF text layer first and only run Docling when it is unusable",
+    )
+    PDF_FAST_PATH_MIN_QUALITY: float = Field(
+        default=0.7,
+        env="PDF_FAST_PATH_MIN_QUALITY",
+        description="Minimum text-layer quality score (0-1) to skip Docling",
+    )
+    PDF_FAST_PATH_MIN_CHARS_PER_PAGE: int = Field(
+        default=50,
+        env="PDF_FAST_PATH_MIN_CHARS_PER_PAGE",
+        description="Pages with images and less text than this are treated as scanned",
+    )
+    DOCLING_PROCESS_POOL_ENABLED: bool = Field(
+        default=True,
+        env="DOCLING_PROCESS_POOL_ENABLED",
+        description="Run Docling conversions in a separate process pool",
+    )
+    DOCLING_POOL_WORKERS: int = Field(default=2, env="DOCLING_POOL_WORKERS")
+    DOCLING_TIMEOUT_SECONDS: float = Field(
+        default=120.0,
+        env="DOCLING_TIMEOUT_SECONDS",
+        description="Hard limit per conversion; the worker is killed when exceeded",
+    )
+    DOCLING_MAX_TASKS_PER_CHILD: int = Field(
+        default=20,
+        env="DOCLING_MAX_TASKS_PER_CHILD",
+        description="Conversions before a pool worker is replaced",
+    )
+    DOCLING_MAX_RSS_MB: int = Field(
+        default=3072,
+        env="DOCLING_MAX_RSS_MB",
+        description="Recycle the pool when a worker's peak RSS exceeds this",
+    )
+    DOCLING_MAX_MEMORY_MB: int = Field(
+        default=8192,
+        env="DOCLING_MAX_MEMORY_MB",
+        description="Address-space limit (RLIMIT_AS) of each conversion worker; a conversion "
+                    "exceeding it fails with MemoryError. Counts virtual memory, so leave headroom "
+                    "above DOCLING_MAX_RSS_MB (0 disables)",
+    )
+    CONVERSION_CACHE_ENABLED: bool = Field(
+        default=True,
+        env="CONVERSION_CACHE_ENABLED",
+        description="Reuse extracted text for PDFs with identical content",
+    )
+    CONVERSION_CACHE_URL: str = Field(
+        default="redis://localhost:6379/2",
+        env="CONVERSION_CACHE_URL",
+        description="Redis URL for the conversion cache",
+    )
+    CONVERSION_CACHE_TTL_SECONDS: int = Field(
+        default=30 * 24 * 3600,
+        env="CONVERSION_CACHE_TTL_SECONDS",
+    )
+    PROFILE_OWNERSHIP_CACHE_TTL_SECONDS: int = Field(
+        default=10,
+        env="PROFILE_OWNERSHIP_CACHE_TTL_SECONDS",
+        description="How long a resolved profile ownership is reused per process (0 disables the cache)",
+    )
+    DOCLING_WARMUP_ON_START: bool = Field(
+        default=True,
+        env="DOCLING_WARMUP_ON_START",
+        description="Load Docling models when a Celery worker process starts",
+    )
+
     # Logging
     LOG_LEVEL: str = Field(default="INFO", env="LOG_LEVEL")
     LOG_FORMAT: str = Field(
@@ -0,0 +1,102 @@
+"""
+Process-wide Docling converter.
+
+Building a ``DocumentConverter`` and loading its layout/table/OCR models on
+first use takes seconds, so every process keeps a single converter, built
+lazily on the first conversion (endpoints that never parse never touch
+Docling) or eagerly by ``start_background_warmup`` when a worker starts.
+"""
+
+import logging
+import threading
+import time
+from io import BytesIO
+from typing import Optional
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.pipeline_options import AcceleratorOptions, PdfPipelineOptions
+from docling.document_converter import DocumentConverter, PdfFormatOption
+from docling_core.types.io import DocumentStream
+
+logger = logging.getLogger(__name__)
+
+_converter: Optional[DocumentConverter] = None
+_converter_lock = threading.Lock()
+
+
+def build_pipeline_options() -> PdfPipelineOptions:
+    """PDF pipeline options used by the shared converter"""
+    # Configure Docling for CPU
+    pipeline_options = PdfPipelineOptions()
+    pipeline_options.accelerator_options = AcceleratorOptions(device="cpu")
+    return pipeline_options
+
+
+def _build_converter() -> DocumentConverter:
+    pipeline_options = build_pipeline_options()
+    converter = DocumentConverter(
+        format_options={
+            InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+        }
+    )
+    # Load the layout/table/OCR models now rather than on the first document
+    converter.initialize_pipeline(InputFormat.PDF)
+    return converter
+
+
+def get_document_converter() -> DocumentConverter:
+    """Get the shared converter, building it on first use"""
+    global _converter
+    if _converter is None:
+        with _converter_lock:
+            if _converter is None:
+                started = time.monotonic()
+                _converter = _build_converter()
+                logger.info(
+                    f"Docling converter initialized (CPU) in {time.monotonic() - started:.1f}s"
+                )
+    return _converter
+
+
+def _tiny_pdf() -> bytes:
+    """A one-page PDF with a line of text, used to exercise the whole pipeline"""
+    content = b"BT /F1 12 Tf 72 720 Td (Warm-up) Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+    ]
+    pdf = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return pdf
+
+
+def warm_up_converter() -> None:
+    """Build the converter and run a tiny PDF through it"""
+    try:
+        started = time.monotonic()
+        converter = get_document_converter()
+        converter.convert(DocumentStream(name="warmup.pdf", stream=BytesIO(_tiny_pdf())))
+        logger.info(f"Docling warm-up finished in {time.monotonic() - started:.1f}s")
+    except Exception as e:
+        logger.warning(f"Docling warm-up failed: {e}")
+
+
+def start_background_warmup() -> threading.Thread:
+    """Warm the converter up without blocking process start-up"""
+    thread = threading.Thread(target=warm_up_converter, name="docling-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,29 @@
+"""
+Docling conversion as run in process pool workers.
+
+Pool workers unpickle their initializer and job function by module path, so
+these live outside ``features`` (whose package imports every router, the
+database engines and their models). Importing this module is cheap; the
+first call imports Docling through ``core.docling_converter``.
+"""
+from typing import Tuple
+
+from core.process_workers import peak_rss_mb
+
+# Written between pages by the text-layer and Docling extractors (see prompt_compaction)
+PAGE_BREAK = "<!-- page-break -->"
+
+
+def load_converter() -> None:
+    """Pool initializer: load the Docling models once per worker process"""
+    from core.docling_converter import get_document_converter
+
+    get_document_converter()
+
+
+def convert_to_markdown(pdf_path: str) -> Tuple[str, int]:
+    """Convert a PDF, return its Markdown and the worker's peak RSS"""
+    from core.docling_converter import get_document_converter
+
+    result = get_document_converter().convert(pdf_path)
+    return result.document.export_to_markdown(page_break_placeholder=PAGE_BREAK), peak_rss_mb()
@@ -0,0 +1,198 @@
+"""
+Keyset (cursor) pagination.
+
+Pages are selected with ``WHERE (sort_key, id) < (:last_key, :last_id)``
+instead of ``OFFSET``, so with a matching composite index every page costs the
+same however deep the client goes. The position is returned to clients as an
+opaque cursor token (URL-safe base64 JSON) in the ``X-Next-Cursor`` header.
+
+NULL sort keys follow PostgreSQL's default ordering (NULL sorts above every
+value: first when descending, last when ascending), stated explicitly so
+other backends return the same pages.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, List, Optional, TypeVar
+
+from fastapi import Query, Response
+from sqlalchemy import and_, literal, or_, tuple_
+from sqlalchemy.orm import Query as ORMQuery
+
+from core.exceptions import AppException
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursor(AppException):
+    """The cursor token is malformed"""
+
+    def __init__(self, message: str = "Invalid cursor"):
+        super().__init__(message=message, status_code=400, error_code="INVALID_CURSOR")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
+
+@dataclass
+class PageParams:
+    cursor: Optional[str]
+    limit: int
+
+
+def page_params(
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Maximum number of items to return"),
+) -> PageParams:
+    """Dependency reading the keyset pagination query parameters"""
+    return PageParams(cursor=cursor, limit=limit)
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise InvalidCursor("Unknown cursor value")
+    return value
+
+
+def encode_cursor(key: Any, row_id: int) -> str:
+    payload = json.dumps([_encode_value(key), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _key_type(sort_column: Any) -> Optional[type]:
+    try:
+        return sort_column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def decode_cursor(token: str, key_type: Optional[type] = None) -> tuple:
+    """
+    Decode a cursor token into ``(sort_key, row_id)``.
+
+    Args:
+        token: Token from the ``X-Next-Cursor`` header
+        key_type: Python type of the sort column; a non-NULL key of another
+            type is rejected here instead of failing in the database
+
+    Raises:
+        InvalidCursor: If the token is malformed or was tampered with
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        # bool is an int subclass; ids outside BIGINT would also fail in the database
+        if type(row_id) is not int or not -(2 ** 63) <= row_id < 2 ** 63:
+            raise InvalidCursor()
+        key = _decode_value(key)
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor() from e
+
+    if key is not None and key_type is not None:
+        # Exact types: a datetime is a date, and a bool an int, but neither binds as one
+        matches = type(key) is key_type or (key_type is float and type(key) is int)
+        if not matches:
+            raise InvalidCursor()
+    return key, row_id
+
+
+def keyset_page(
+    query: ORMQuery,
+    sort_column: Optional[Any],
+    id_column: Any,
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = True,
+) -> Page:
+    """
+    Fetch one page of ``query`` ordered by ``(sort_column, id_column)``.
+
+    Args:
+        query: Filtered query returning ORM rows
+        sort_column: Leading sort key (may be nullable), or None to order by id only
+        id_column: Unique tie-breaker, normally the primary key
+        cursor: Token returned with the previous page, or None for the first
+        limit: Page size
+        descending: Newest/largest first
+
+    Raises:
+        InvalidCursor: If the token cannot be decoded or does not fit ``sort_column``
+    """
+    if sort_column is None:
+        return _id_page(query, id_column, cursor, limit, descending)
+
+    if cursor:
+        key, last_id = decode_cursor(cursor, _key_type(sort_column))
+        position = tuple_(sort_column, id_column)
+        if descending:
+            # NULLs come first, then values in descending order
+            after = (
+                or_(and_(sort_column.is_(None), id_column < last_id), sort_column.isnot(None))
+                if key is None
+                else position < tuple_(literal(key), literal(last_id))
+            )
+        else:
+            # Values in ascending order, then NULLs
+            after = (
+                and_(sort_column.is_(None), id_column > last_id)
+                if key is None
+                else or_(position > tuple_(literal(key), literal(last_id)), sort_column.is_(None))
+            )
+        query = query.filter(after)
+
+    order = (
+        (sort_column.desc().nulls_first(), id_column.desc())
+        if descending
+        else (sort_column.asc().nulls_last(), id_column.asc())
+    )
+    # One extra row tells whether there is a next page
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def _id_page(query: ORMQuery, id_column: Any, cursor: Optional[str], limit: int, descending: bool) -> Page:
+    if cursor:
+        _, last_id = decode_cursor(cursor)
+        query = query.filter(id_column < last_id if descending else id_column > last_id)
+    rows = query.order_by(id_column.desc() if descending else id_column.asc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(None, getattr(rows[-1], id_column.key))
+    return Page(items=rows, next_cursor=next_cursor)
+
+
+def set_next_cursor(response: Response, page: Page) -> List[Any]:
+    """Expose the next cursor in the response headers and return the items"""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
@@ -0,0 +1,57 @@
+"""
+Worker-side helpers for process pools.
+
+Runs in spawned worker processes, so it is kept free of application imports:
+unpickling an initializer from a feature module would import that feature's
+package (routers, models, Docling) before the worker can take any work.
+"""
+import os
+import resource
+import sys
+from typing import Any, Callable, Optional
+
+# Where jobs report the process running them (set by ``init_worker``)
+_started: Optional[Any] = None
+
+
+def peak_rss_mb() -> int:
+    """Peak resident set size of this process, in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak // (1024 * 1024) if sys.platform == "darwin" else peak // 1024
+
+
+def limit_memory(max_memory_mb: int) -> None:
+    """Cap this process's address space; allocations beyond it raise MemoryError"""
+    limit = max_memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def init_worker(
+    started: Any,
+    max_memory_mb: Optional[int],
+    initializer: Optional[Callable[[], None]],
+) -> None:
+    """
+    Pool initializer.
+
+    Args:
+        started: multiprocessing queue receiving ``(job_id, pid)`` when a job starts
+        max_memory_mb: Address-space limit of the worker (None/0: unlimited)
+        initializer: Called last, under the memory limit
+    """
+    global _started
+    _started = started
+    if max_memory_mb:
+        limit_memory(max_memory_mb)
+    if initializer is not None:
+        initializer()
+
+
+def run_job(fn: Callable[[Any], Any], job_id: int, arg: Any) -> Any:
+    """Report which process runs ``job_id``, then run it"""
+    _started.put((job_id, os.getpid()))
+    return fn(arg)
@@ -0,0 +1,172 @@
+"""
+Connection pool configuration and metrics.
+
+Engines use QueuePool subclasses that time every checkout, so an exhausted
+pool shows up as growing checkout waits and counted timeouts rather than only
+as slow requests. Stale connections are detected according to
+``DB_POOL_PING``:
+
+    always  ping on every checkout (SQLAlchemy's ``pool_pre_ping``)
+    idle    ping only connections that sat in the pool longer than
+            ``DB_POOL_PING_IDLE_SECONDS``; busy pools skip the round trip
+    never   rely on ``pool_recycle`` and invalidation after a failed query
+
+``DB_PGBOUNCER_MODE`` disables asyncpg's prepared statement caches, which do
+not survive PgBouncer's transaction pooling.
+"""
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from core.config import Settings
+
+
+class PoolMetrics:
+    """Checkout waits and failures of one engine's pool (kept across pool recreation)"""
+
+    def __init__(self, window: int = 1000):
+        self._lock = threading.Lock()
+        self._waits: Deque[float] = deque(maxlen=window)
+        self._stats = {"checkouts": 0, "timeouts": 0, "pings": 0, "stale_connections": 0}
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._waits.append(seconds)
+            self._stats["checkouts"] += 1
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            stats = dict(self._stats)
+        return {
+            "checkout_wait_avg_ms": round(1000 * sum(waits) / len(waits), 3) if waits else 0.0,
+            "checkout_wait_p95_ms": round(1000 * waits[int(0.95 * (len(waits) - 1))], 3) if waits else 0.0,
+            "checkout_wait_max_ms": round(1000 * waits[-1], 3) if waits else 0.0,
+            **stats,
+        }
+
+
+class _TimedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.increment("timeouts")
+            raise
+        self.metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() and disconnect handling replace the pool object
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    """QueuePool recording checkout wait times"""
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait times"""
+
+
+_engines: Dict[str, Engine] = {}
+
+
+def engine_options(settings: Settings, is_async: bool = False) -> Dict[str, Any]:
+    """Keyword arguments for create_engine / create_async_engine"""
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        "poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PING == "always",
+    }
+    if is_async and settings.DB_PGBOUNCER_MODE:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            # Names must not collide with statements left on a shared server connection
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+    return options
+
+
+def instrument_engine(
+    name: str,
+    engine: Engine,
+    ping: str = "always",
+    idle_seconds: float = 30.0,
+) -> PoolMetrics:
+    """
+    Attach metrics and the ``idle`` ping strategy to an engine's pool.
+
+    Args:
+        name: Label reported by ``pool_snapshots``
+        engine: Sync engine (``AsyncEngine.sync_engine`` for async ones)
+        ping: ``always``, ``idle`` or ``never`` (``always`` is done by ``pool_pre_ping``)
+        idle_seconds: Idle time after which the ``idle`` strategy pings
+
+    Returns:
+        The metrics of the pool
+    """
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+    _engines[name] = engine
+
+    if ping == "idle":
+        dialect = engine.dialect
+
+        @event.listens_for(engine, "checkin")
+        def remember_checkin(dbapi_connection, connection_record):
+            connection_record.info["checked_in_at"] = time.monotonic()
+
+        @event.listens_for(engine, "checkout")
+        def ping_idle_connection(dbapi_connection, connection_record, connection_proxy):
+            checked_in_at = connection_record.info.get("checked_in_at")
+            if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+                return
+            metrics.increment("pings")
+            try:
+                dialect.do_ping(dbapi_connection)
+            except Exception as e:
+                metrics.increment("stale_connections")
+                # The pool discards this connection and retries with a fresh one
+                raise exc.DisconnectionError() from e
+
+    return metrics
+
+
+def pool_snapshots() -> List[Dict[str, Any]]:
+    """Size, usage and checkout metrics of every instrumented pool"""
+    snapshots = []
+    for name, engine in _engines.items():
+        pool = engine.pool
+        metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+        snapshots.append({
+            "name": name,
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "max_overflow": pool._max_overflow,
+            "timeout_s": pool.timeout(),
+            **(metrics.snapshot() if metrics else {}),
+        })
+    return snapshots
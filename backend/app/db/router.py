@@ -0,0 +1,21 @@
+"""
+Database Router
+
+Admin endpoint exposing connection pool metrics.
+"""
+from fastapi import APIRouter, Depends
+
+from db.pool import pool_snapshots
+from features.auth.dependencies import require_admin_from_token
+from features.auth.schemas import TokenData
+
+router = APIRouter(prefix="/api/v1/db", tags=["database"])
+
+
+@router.get("/pools")
+async def get_pool_metrics(admin_user: TokenData = Depends(require_admin_from_token)):
+    """Size, usage and checkout wait times of every connection pool - Admin only
+
+    Metrics are per process (each API/Celery worker has its own pools).
+    """
+    return {"pools": pool_snapshots()}
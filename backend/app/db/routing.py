@@ -0,0 +1,161 @@
+"""
+Read-replica routing.
+
+Read-only dependencies (``get_read_db`` / ``get_async_read_db``) hand out
+sessions whose ``get_bind`` picks an engine per statement. Reads go to the
+replica unless:
+
+    - the statement or flush writes (writes always go to the primary),
+    - the session or anything else in the same request already wrote
+      (read-your-writes: the replica may not have replayed it yet),
+    - the replica lags more than ``DATABASE_REPLICA_MAX_LAG_SECONDS``
+      behind the primary, or cannot be reached.
+
+Writes in a request are tracked through ``RequestDatabaseState``, which
+``DatabaseRoutingMiddleware`` installs for every HTTP request. The state is
+a mutable object in a ContextVar, so flushes in threadpool-run dependencies
+and endpoints are seen by the rest of the request.
+"""
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+REPLICA_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+@dataclass
+class RequestDatabaseState:
+    """What the current request did to the database"""
+    wrote: bool = False
+
+
+_request_state: ContextVar[Optional[RequestDatabaseState]] = ContextVar("db_request_state", default=None)
+
+
+def request_wrote() -> bool:
+    state = _request_state.get()
+    return state is not None and state.wrote
+
+
+def _mark_write(session: Session) -> None:
+    session.info["wrote"] = True
+    state = _request_state.get()
+    if state is not None:
+        state.wrote = True
+
+
+@event.listens_for(Session, "after_flush")
+def _flushed(session, flush_context):
+    _mark_write(session)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _mark_write(orm_execute_state.session)
+
+
+class DatabaseRoutingMiddleware:
+    """Gives every HTTP request its own ``RequestDatabaseState`` (pure ASGI, keeps the context)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _request_state.set(RequestDatabaseState())
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_state.reset(token)
+
+
+class ReplicaLagMonitor:
+    """
+    Decides whether a replica is fresh enough to read from.
+
+    The lag is measured at most every ``check_interval`` seconds; an
+    unreachable replica counts as stale until the next check.
+    """
+
+    def __init__(self, engine: Engine, max_lag_seconds: float, check_interval: float = 5.0):
+        self.engine = engine
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._lag: Optional[float] = None
+
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        """Last measured lag (None if the replica could not be reached)"""
+        return self._lag
+
+    def is_fresh(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            due = self._checked_at is None or now - self._checked_at >= self.check_interval
+            if due:
+                # Claim the check so concurrent callers keep using the last result
+                self._checked_at = now
+        if due:
+            self._lag = self._measure()
+        return self._lag is not None and self._lag <= self.max_lag_seconds
+
+    def _measure(self) -> Optional[float]:
+        try:
+            with self.engine.connect() as conn:
+                lag = float(conn.execute(REPLICA_LAG_QUERY).scalar() or 0.0)
+        except Exception as e:
+            logger.warning(f"Read replica unavailable, reading from the primary: {e}")
+            return None
+        if lag > self.max_lag_seconds:
+            logger.warning(f"Read replica is {lag:.1f}s behind, reading from the primary")
+        return lag
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads to a replica and everything else to the primary.
+
+    Bound with ``sessionmaker(class_=RoutingSession, primary=..., replica=...)``
+    (``sync_session_class`` for AsyncSession, with the async engines'
+    ``sync_engine``).
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replica: Optional[Engine] = None,
+        monitor: Optional[ReplicaLagMonitor] = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.primary = primary
+        self.replica = replica
+        self.monitor = monitor
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica is None or self._flushing or isinstance(clause, UpdateBase):
+            return self.primary
+        if self.info.get("wrote") or request_wrote():
+            return self.primary
+        if self.monitor is not None and not self.monitor.is_fresh():
+            return self.primary
+        return self.replica
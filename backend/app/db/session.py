@@ -1,6 +1,8 @@
 """
 Database session management
 """
+from contextlib import asynccontextmanager, contextmanager
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
@@ -8,31 +10,28 @@ from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from core.config import get_settings
+from db.pool import engine_options, instrument_engine
+from db.routing import ReplicaLagMonitor, RoutingSession
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 # Create synchronous engine and session factory
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=300,
-)
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings))
+instrument_engine("primary", engine, settings.DB_POOL_PING, settings.DB_POOL_PING_IDLE_SECONDS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine,expire_on_commit=False)
 
-# Create async engine and session factory for background tasks
-async_database_url = settings.DATABASE_URL
-if async_database_url.startswith("postgresql://"):
-    async_database_url = async_database_url.replace(
-        "postgresql://", "postgresql+asyncpg://", 1
-    )
 
-async_engine = create_async_engine(
-    async_database_url,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_recycle=300,
+def _async_url(url: str) -> str:
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    return url
+
+
+# Create async engine and session factory for async endpoints and background tasks
+async_engine = create_async_engine(_async_url(settings.DATABASE_URL), **engine_options(settings, is_async=True))
+instrument_engine(
+    "primary_async", async_engine.sync_engine, settings.DB_POOL_PING, settings.DB_POOL_PING_IDLE_SECONDS
 )
 AsyncSessionLocal = sessionmaker(
     async_engine,
@@ -42,19 +41,114 @@ AsyncSessionLocal = sessionmaker(
     autoflush=False,
 )
 
-def get_db():
-    """Database dependency for FastAPI"""
-    db = SessionLocal()
+# Read-only endpoints read from the replica when one is configured (see db/routing.py)
+ReadSessionLocal = SessionLocal
+AsyncReadSessionLocal = AsyncSessionLocal
+if settings.DATABASE_REPLICA_URL:
+    replica_engine = create_engine(settings.DATABASE_REPLICA_URL, **engine_options(settings))
+    instrument_engine("replica", replica_engine, settings.DB_POOL_PING, settings.DB_POOL_PING_IDLE_SECONDS)
+    replica_async_engine = create_async_engine(
+        _async_url(settings.DATABASE_REPLICA_URL), **engine_options(settings, is_async=True)
+    )
+    instrument_engine(
+        "replica_async", replica_async_engine.sync_engine, settings.DB_POOL_PING, settings.DB_POOL_PING_IDLE_SECONDS
+    )
+
+    ReadSessionLocal = sessionmaker(
+        class_=RoutingSession,
+        primary=engine,
+        replica=replica_engine,
+        monitor=ReplicaLagMonitor(
+            replica_engine, settings.DATABASE_REPLICA_MAX_LAG_SECONDS, settings.DATABASE_REPLICA_LAG_CHECK_SECONDS
+        ),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    AsyncReadSessionLocal = sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        primary=async_engine.sync_engine,
+        replica=replica_async_engine.sync_engine,
+        monitor=ReplicaLagMonitor(
+            replica_async_engine.sync_engine,
+            settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+            settings.DATABASE_REPLICA_LAG_CHECK_SECONDS,
+        ),
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+@contextmanager
+def _unit_of_work(factory):
+    db = factory()
     try:
         yield db
-    except SQLAlchemyError as e:
-        logger.error(f"Database error: {e}")
+    except Exception as e:
+        if isinstance(e, SQLAlchemyError):
+            logger.error(f"Database error: {e}")
         db.rollback()
         raise
+    else:
+        db.commit()
     finally:
         db.close()
 
 
+@asynccontextmanager
+async def _async_unit_of_work(factory):
+    async with factory() as db:
+        try:
+            yield db
+        except Exception as e:
+            if isinstance(e, SQLAlchemyError):
+                logger.error(f"Database error: {e}")
+            await db.rollback()
+            raise
+        else:
+            await db.commit()
+
+
+def get_db():
+    """
+    Database dependency for FastAPI.
+
+    The request is one unit of work: repositories only flush, and the session
+    is committed once after the endpoint returns (before the response is sent)
+    or rolled back if it raised.
+    """
+    with _unit_of_work(SessionLocal) as db:
+        yield db
+
+
+def get_read_db():
+    """
+    Database dependency for read-only endpoints.
+
+    Like ``get_db``, but reads go to the read replica while it is fresh enough
+    and nothing in the request has written yet.
+    """
+    with _unit_of_work(ReadSessionLocal) as db:
+        yield db
+
+
+async def get_async_db():
+    """
+    Async database dependency for ``async def`` endpoints.
+
+    Same unit of work as ``get_db`` on the async engine, so queries are awaited
+    instead of blocking the event loop (and every other request on the worker).
+    """
+    async with _async_unit_of_work(AsyncSessionLocal) as db:
+        yield db
+
+
+async def get_async_read_db():
+    """Async counterpart of ``get_read_db``"""
+    async with _async_unit_of_work(AsyncReadSessionLocal) as db:
+        yield db
+
+
 def get_async_session():
     """Async database session factory for background tasks."""
     return AsyncSessionLocal
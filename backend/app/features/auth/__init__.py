@@ -1,6 +1,9 @@
 from .router import router as auth_router
 from .dependencies import (
     get_current_user, 
+    get_current_user_read,
+    get_current_user_async,
+    get_current_user_async_read,
     get_current_active_user, 
     get_optional_current_user, 
     get_auth_service,
@@ -15,6 +18,9 @@ from .schemas import UserLogin, UserRegister, Token, TokenData, PasswordChange
 __all__ = [
     "auth_router",
     "get_current_user", 
+    "get_current_user_read",
+    "get_current_user_async",
+    "get_current_user_async_read",
     "get_current_active_user",
     "get_optional_current_user",
     "get_auth_service",
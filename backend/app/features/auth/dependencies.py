@@ -1,12 +1,14 @@
 from fastapi import Depends, status
 from core.exceptions import HTTPException
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
-from db.session import get_db
+from db.session import get_async_db, get_async_read_db, get_db, get_read_db
 from features.users.models import User, UserRole
+from .repository import AsyncAuthRepository
 from .service import AuthService
 from .schemas import TokenData
 
@@ -17,13 +19,36 @@ def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     """Dependency to get AuthService instance"""
     return AuthService(db)
 
-async def get_current_user(
+def get_auth_read_service(db: Session = Depends(get_read_db)) -> AuthService:
+    """Dependency to get AuthService for user lookups (may read from the replica)"""
+    return AuthService(db)
+
+def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token
+
+    Sync on purpose: FastAPI runs it in the threadpool, so the user lookup
+    does not block the event loop.
+    """
+    return _get_user(token, auth_service)
+
+def get_current_user_read(
+    token: str = Depends(oauth2_scheme),
+    auth_service: AuthService = Depends(get_auth_read_service)
+) -> User:
     """
+    ``get_current_user`` for read-only endpoints using ``get_read_db``
+
+    Shares the endpoint's read session (FastAPI caches ``get_read_db`` per
+    request), so the request neither touches the primary nor holds a second
+    connection.
+    """
+    return _get_user(token, auth_service)
+
+def _get_user(token: str, auth_service: AuthService) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         message="Could not validate credentials",
@@ -46,6 +71,47 @@ async def get_current_user(
     
     return user
 
+async def _get_user_async(token: str, db: AsyncSession) -> User:
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        message="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    try:
+        payload = AuthService.verify_token(token)
+        user_uuid: str = payload.get("sub")
+        if user_uuid is None:
+            raise credentials_exception
+    except HTTPException:
+        raise credentials_exception
+
+    user = await AsyncAuthRepository(db).get_user_by_uuid(user_uuid)
+    if user is None:
+        raise credentials_exception
+
+    return user
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    ``get_current_user`` for ``async def`` endpoints writing through ``get_async_db``
+
+    Looks the user up on the endpoint's own async session (FastAPI caches
+    ``get_async_db`` per request), so the request holds a single connection
+    instead of a sync one for the user plus an async one for the endpoint.
+    """
+    return await _get_user_async(token, db)
+
+async def get_current_user_async_read(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_read_db)
+) -> User:
+    """``get_current_user_async`` for read-only endpoints using ``get_async_read_db``"""
+    return await _get_user_async(token, db)
+
 async def get_current_active_user(
     current_user: User = Depends(get_current_user)
 ) -> User:
@@ -1,3 +1,5 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
 import uuid
@@ -48,4 +50,19 @@ class AuthRepository:
     
     def email_exists(self, email: str) -> bool:
         """Check if email already exists"""
-        return self.db.query(User).filter(User.email == email).first() is not None
\ No newline at end of file
+        return self.db.query(User).filter(User.email == email).first() is not None
+
+
+class AsyncAuthRepository:
+    """User lookups for ``async def`` endpoints"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_user_by_uuid(self, user_uuid: str) -> Optional[User]:
+        """Get user by UUID"""
+        try:
+            uuid_obj = uuid.UUID(user_uuid)
+        except ValueError:
+            return None
+        return await self.db.scalar(select(User).where(User.uuid == uuid_obj))
@@ -7,10 +7,10 @@ FastAPI routes for job description management.
 from typing import List
 from fastapi import APIRouter, Depends, Query
 from core.exceptions import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
+from db.session import get_async_db, get_async_read_db
+from features.auth.dependencies import get_current_user_async, get_current_user_async_read
 from features.users.models import User
 from features.job_descriptions.repository import JobDescriptionRepository
 from features.job_descriptions.service import JobDescriptionService
@@ -19,17 +19,23 @@ from features.job_descriptions.schemas import JobDescriptionCreate, JobDescripti
 router = APIRouter(prefix="/api/v1/users/{user_id}/job-descriptions", tags=["job-descriptions"])
 
 
-def get_job_description_service(db: Session = Depends(get_db)) -> JobDescriptionService:
+def get_job_description_service(db: AsyncSession = Depends(get_async_db)) -> JobDescriptionService:
     """Dependency to get job description service"""
     repository = JobDescriptionRepository(db)
     return JobDescriptionService(repository)
 
 
+def get_job_description_read_service(db: AsyncSession = Depends(get_async_read_db)) -> JobDescriptionService:
+    """Dependency to get job description service for read-only endpoints (may read from the replica)"""
+    repository = JobDescriptionRepository(db)
+    return JobDescriptionService(repository)
+
+
 @router.post("/", response_model=JobDescriptionResponse, status_code=201)
 async def create_job_description(
     user_id: int,
     job_desc_data: JobDescriptionCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     service: JobDescriptionService = Depends(get_job_description_service)
 ):
     """Create a new job description for the specified user"""
@@ -38,40 +44,40 @@ async def create_job_description(
         raise HTTPException(status_code=403, message="Cannot create job description for another user")
     
     try:
-        return service.create_job_description(user_id, job_desc_data)
+        return await service.create_job_description(user_id, job_desc_data)
     except ValueError as e:
         raise HTTPException(status_code=400, message=str(e))
 
 @router.get("/", response_model=list[JobDescriptionResponse])
 async def get_user_job_descriptions(
     user_id: int,
-    current_user: User = Depends(get_current_user),
-    service: JobDescriptionService = Depends(get_job_description_service)
+    current_user: User = Depends(get_current_user_async_read),
+    service: JobDescriptionService = Depends(get_job_description_read_service)
 ):
     """Get all job descriptions for the specified user"""
     # Check ownership
     if current_user.id != user_id:
         raise HTTPException(status_code=403, message="Cannot access another user's job descriptions")
     
-    return service.get_user_job_descriptions(user_id)
+    return await service.get_user_job_descriptions(user_id)
 
 @router.get("/{job_desc_uuid}", response_model=JobDescriptionResponse)
 async def get_job_description(
     user_id: int,
     job_desc_uuid: str,
-    current_user: User = Depends(get_current_user),
-    service: JobDescriptionService = Depends(get_job_description_service)
+    current_user: User = Depends(get_current_user_async_read),
+    service: JobDescriptionService = Depends(get_job_description_read_service)
 ):
     """Get a specific job description by UUID for the user"""
     # Check ownership
     if current_user.id != user_id:
         raise HTTPException(status_code=403, message="Cannot access another user's job description")
-    job_desc = service.get_job_description_by_uuid(job_desc_uuid)
+    job_desc = await service.get_job_description_by_uuid(job_desc_uuid)
     if not job_desc:
         raise HTTPException(status_code=404, message="Job description not found")
     
     # Check ownership
-    if not service.check_job_description_ownership(job_desc_uuid, current_user.id):
+    if not await service.check_job_description_ownership(job_desc_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Not authorized to access this job description")
     
     return job_desc
@@ -82,31 +88,31 @@ async def get_user_job_descriptions(
     user_uuid: str,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    current_user: User = Depends(get_current_user),
-    service: JobDescriptionService = Depends(get_job_description_service)
+    current_user: User = Depends(get_current_user_async_read),
+    service: JobDescriptionService = Depends(get_job_description_read_service)
 ):
     """Get all job descriptions for a specific user (UUID-based)"""
     # For now, users can only access their own job descriptions
     if user_uuid != current_user.uuid:
         raise HTTPException(status_code=403, message="Not authorized to access other users' job descriptions")
     
-    return service.get_user_job_descriptions(current_user.id, skip, limit)
+    return await service.get_user_job_descriptions(current_user.id, skip, limit)
 
 
 @router.put("/{job_desc_uuid}", response_model=JobDescriptionResponse)
 async def update_job_description(
     job_desc_uuid: str,
     job_desc_update: JobDescriptionUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     service: JobDescriptionService = Depends(get_job_description_service)
 ):
     """Update a job description"""
     # Check ownership
-    if not service.check_job_description_ownership(job_desc_uuid, current_user.id):
+    if not await service.check_job_description_ownership(job_desc_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Not authorized to update this job description")
     
     try:
-        updated_job_desc = service.update_job_description(job_desc_uuid, job_desc_update)
+        updated_job_desc = await service.update_job_description(job_desc_uuid, job_desc_update)
         if not updated_job_desc:
             raise HTTPException(status_code=404, message="Job description not found")
         return updated_job_desc
@@ -117,14 +123,14 @@ async def update_job_description(
 @router.delete("/{job_desc_uuid}", status_code=204)
 async def delete_job_description(
     job_desc_uuid: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_async),
     service: JobDescriptionService = Depends(get_job_description_service)
 ):
     """Delete a job description"""
     # Check ownership
-    if not service.check_job_description_ownership(job_desc_uuid, current_user.id):
+    if not await service.check_job_description_ownership(job_desc_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Not authorized to delete this job description")
     
-    success = service.delete_job_description(job_desc_uuid)
+    success = await service.delete_job_description(job_desc_uuid)
     if not success:
         raise HTTPException(status_code=404, message="Job description not found")
@@ -0,0 +1,6 @@
+"""
+LLM Feature - Provider abstraction, scheduling and structured parsing
+"""
+from .router import router as llm_router
+
+__all__ = ["llm_router"]
@@ -0,0 +1,231 @@
+"""
+Tolerant JSON parsing for LLM output.
+
+Models wrap JSON in code fences or ``<function>`` tags, leave trailing commas,
+escape single quotes (``\\'``) and, when they hit ``max_tokens``, stop in the
+middle of a string. ``repair_json`` fixes all of that in a single pass over the
+text: it tokenizes from the first ``{``/``[``, skips anything that cannot be
+part of JSON outside strings, tracks the open containers and, at the end,
+closes whatever is still open so truncated output keeps the data it has.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+_NUMBER = re.compile(r"-?(0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_LITERALS = {"true": "true", "false": "false", "null": "null", "none": "null"}
+_VALID_ESCAPES = set('"\\/bfnrtu')
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+_LITERAL_CHARS = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+-._")
+
+
+def _escape_char(c: str) -> str:
+    """A string character as it may appear inside a JSON string literal"""
+    return _CONTROL_ESCAPES.get(c) or (f"\\u{ord(c):04x}" if c < " " else c)
+
+
+# Parser states of an open container
+_KEY, _COLON, _VALUE, _AFTER = "key", "colon", "value", "after"
+
+
+def _literal_token(word: str) -> Optional[str]:
+    """Turn a bare word into a JSON token (None if nothing usable is left)"""
+    lowered = word.lower()
+    for name, literal in _LITERALS.items():
+        if name.startswith(lowered):
+            # Complete literals cut off by truncation ("tru" -> true)
+            return literal
+    match = _NUMBER.match(word)
+    if match and match.end() == len(word):
+        return word
+    if word[0] in "-0123456789":
+        # Truncated number ("12.", "1e", "-"): keep the valid prefix
+        return match.group(0) if match else None
+    # Unquoted word (e.g. a bare key): keep it as a string
+    return json.dumps(word)
+
+
+class _Repairer:
+    def __init__(self) -> None:
+        self.tokens: List[str] = []
+        # [container, state] for every open { / [
+        self.stack: List[List[str]] = []
+
+    # -- structure ---------------------------------------------------------
+
+    def value(self, token: str) -> None:
+        """Emit a scalar or string in the current position"""
+        if not self.stack:
+            return
+        frame = self.stack[-1]
+        if frame[1] == _AFTER:
+            # Missing comma between two values/pairs
+            self.tokens.append(",")
+            frame[1] = _KEY if frame[0] == "{" else _VALUE
+        if frame[0] == "{" and frame[1] == _KEY:
+            if not token.startswith('"'):
+                token = json.dumps(token)
+            frame[1] = _COLON
+        elif frame[0] == "{" and frame[1] == _COLON:
+            # A second string where a colon should be: assume the colon
+            self.tokens.append(":")
+            frame[1] = _AFTER
+        else:
+            frame[1] = _AFTER
+        self.tokens.append(token)
+
+    def open(self, char: str) -> None:
+        if self.stack:
+            frame = self.stack[-1]
+            self.comma()  # no-op unless a comma is missing
+            if frame[0] == "{" and frame[1] == _KEY:
+                # Container where a key belongs: keep it under an empty key
+                self.tokens.append('"":')
+            elif frame[0] == "{" and frame[1] == _COLON:
+                self.tokens.append(":")
+            frame[1] = _AFTER
+        self.tokens.append(char)
+        self.stack.append([char, _KEY if char == "{" else _VALUE])
+
+    def close(self) -> None:
+        container, state = self.stack.pop()
+        if container == "{":
+            if state == _COLON:
+                self.tokens.pop()  # dangling key
+                if self.tokens[-1] == ",":
+                    self.tokens.pop()
+            elif state == _VALUE:
+                self.tokens.append("null")  # "key": with no value
+            elif state == _KEY and self.tokens[-1] == ",":
+                self.tokens.pop()
+        elif state == _VALUE and self.tokens[-1] == ",":
+            self.tokens.pop()
+        self.tokens.append("}" if container == "{" else "]")
+
+    def colon(self) -> None:
+        if self.stack and self.stack[-1][1] == _COLON:
+            self.tokens.append(":")
+            self.stack[-1][1] = _VALUE
+
+    def comma(self) -> None:
+        if self.stack and self.stack[-1][1] == _AFTER:
+            frame = self.stack[-1]
+            self.tokens.append(",")
+            frame[1] = _KEY if frame[0] == "{" else _VALUE
+
+
+def repair_json(text: str, roots: str = "{[") -> Optional[str]:
+    """
+    Rewrite LLM output into syntactically valid JSON text.
+
+    Args:
+        text: Raw model output
+        roots: Characters the top-level value may start with (``"{"`` to
+            ignore prose such as ``[TOOL_CALLS]`` in front of an object)
+
+    Returns:
+        Valid JSON text, or None when there is no object/array to recover
+    """
+    starts = [i for i in (text.find(c) for c in roots) if i != -1]
+    if not starts:
+        return None
+
+    r = _Repairer()
+    chars: List[str] = []  # current string or bare word
+    in_string = False
+    i, n = min(starts), len(text)
+    while i < n:
+        c = text[i]
+        if in_string:
+            if c == "\\":
+                nxt = text[i + 1] if i + 1 < n else ""
+                if nxt == "'":
+                    chars.append("'")
+                elif nxt == "u":
+                    hex_digits = text[i + 2 : i + 6]
+                    if len(hex_digits) == 4 and all(h in "0123456789abcdefABCDEF" for h in hex_digits):
+                        chars.append("\\u" + hex_digits)
+                        i += 6
+                        continue
+                    if i + 6 > n:
+                        i = n  # escape cut off by truncation
+                        continue
+                    chars.append("\\\\u")
+                elif nxt in _VALID_ESCAPES:
+                    chars.append("\\" + nxt)
+                elif nxt:
+                    # Stray backslash: keep it literally, escaping whatever follows
+                    chars.append("\\\\" + _escape_char(nxt))
+                i += 2
+                continue
+            if c == '"':
+                in_string = False
+                r.value('"' + "".join(chars) + '"')
+                chars = []
+            else:
+                chars.append(_escape_char(c))
+            i += 1
+            continue
+
+        if c in _LITERAL_CHARS:
+            chars.append(c)
+            i += 1
+            continue
+        if chars:
+            token = _literal_token("".join(chars))
+            chars = []
+            if token is not None:
+                r.value(token)
+
+        if c == '"':
+            in_string = True
+        elif c in "{[":
+            r.open(c)
+        elif c in "}]":
+            if r.stack:
+                r.close()
+            if not r.stack:
+                break  # root closed: ignore trailing fences/tags/prose
+        elif c == ":":
+            r.colon()
+        elif c == ",":
+            r.comma()
+        elif c == "<":
+            # Stray markup such as </function> outside strings
+            end = text.find(">", i)
+            i = n if end == -1 else end
+        # anything else (whitespace, backticks, junk) is skipped
+        i += 1
+
+    # Truncated output: finish the pending token and close open containers
+    if in_string:
+        r.value('"' + "".join(chars) + '"')
+    elif chars:
+        token = _literal_token("".join(chars))
+        if token is not None:
+            r.value(token)
+    while r.stack:
+        r.close()
+    return "".join(r.tokens)
+
+
+def loads_tolerant(text: str, roots: str = "{[") -> Optional[Any]:
+    """
+    ``json.loads`` with a repair fallback for malformed or truncated LLM output.
+
+    Returns None when nothing usable can be recovered.
+    """
+    if not text:
+        return None
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    repaired = repair_json(text, roots)
+    if repaired is None:
+        return None
+    try:
+        return json.loads(repaired)
+    except json.JSONDecodeError:
+        return None
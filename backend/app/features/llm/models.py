@@ -0,0 +1,37 @@
+"""
+LLM Models - Per-call telemetry
+"""
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime
+
+from shared.models.base import Base
+
+
+class LLMCall(Base):
+    """One LLM API call: where the time, tokens and money went"""
+
+    __tablename__ = "llm_calls"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    provider = Column(String(50), nullable=False)
+    model = Column(String(100), nullable=False)
+    tool_name = Column(String(100), nullable=True)
+    caller = Column(String(100), nullable=True)  # user id the call was made for
+
+    latency_ms = Column(Integer, nullable=False)  # final attempt only
+    total_ms = Column(Integer, nullable=False)  # including queueing and retries
+    retries = Column(Integer, default=0, nullable=False)
+
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    cached_tokens = Column(Integer, nullable=True)
+    cache_hit = Column(Boolean, default=False, nullable=False)
+    cost_usd = Column(Float, nullable=True)
+
+    outcome = Column(String(20), nullable=False)  # success, error
+    error_type = Column(String(100), nullable=True)
+
+    def __repr__(self):
+        return f"<LLMCall {self.provider}:{self.model} tool={self.tool_name} outcome={self.outcome}>"
@@ -1,12 +1,13 @@
 import os
 import asyncio
-import json
 import logging
-import re
-from groq import Groq
+from groq import Groq, APIConnectionError
 from pydantic import BaseModel
 from typing import Type, Any, Dict, List, Optional
 from features.llm.interfaces import LLMProvider
+from features.llm.json_repair import loads_tolerant
+from features.llm.scheduler import get_scheduler, estimate_tokens
+from features.llm.telemetry import TokenUsage, submit_tracked
 
 
 logger = logging.getLogger(__name__)
@@ -153,6 +154,33 @@ def pydantic_to_groq_function(
     }
 
 
+def parse_tool_call_json(raw_json_str: str) -> Dict[str, Any]:
+    """
+    Parse the JSON arguments of a tool call (or a plain-text JSON answer).
+    Returns an empty dict when nothing usable can be recovered.
+    """
+    data = loads_tolerant(raw_json_str, roots="{")
+    if isinstance(data, dict):
+        return data
+
+    logger.error(
+        f"Failed to extract valid JSON from LLM response. Raw start: {(raw_json_str or '')[:500]}"
+    )
+    return {}
+
+
+def _groq_usage(response: Any) -> TokenUsage:
+    usage = response.usage
+    if usage is None:
+        return TokenUsage()
+    details = usage.prompt_tokens_details
+    return TokenUsage(
+        prompt_tokens=usage.prompt_tokens,
+        completion_tokens=usage.completion_tokens,
+        cached_tokens=details.cached_tokens if details else None,
+    )
+
+
 class GroqProvider(LLMProvider):
     """Groq LLM provider implementation with function calling support."""
 
@@ -163,16 +191,34 @@ class GroqProvider(LLMProvider):
         self.api_key = settings.GROQ_API_KEY
         if not self.api_key:
             raise ValueError("GROQ_API_KEY environment variable is required")
-        self.client = Groq(api_key=self.api_key)
+        # Retries are owned by the scheduler so they respect the shared budget
+        self.client = Groq(api_key=self.api_key, max_retries=0)
         self.model = model or settings.GROQ_MODEL
+        self.scheduler = get_scheduler(
+            f"groq:{self.model}", retryable_exceptions=(APIConnectionError,)
+        )
+
+    async def _create_completion(self, prompt: str, tool_name: str = None, **kwargs) -> Any:
+        """Send a chat completion through the rate-limit-aware scheduler."""
+        return await submit_tracked(
+            self.scheduler,
+            lambda: asyncio.to_thread(
+                self.client.chat.completions.create,
+                model=self.model,
+                messages=[{"role": "user", "content": prompt}],
+                **kwargs,
+            ),
+            provider="groq",
+            model=self.model,
+            tool_name=tool_name,
+            estimated_tokens=estimate_tokens(prompt),
+            usage=_groq_usage,
+        )
 
     async def generate_response(self, prompt: str) -> str:
         """Generate response using Groq API (text mode)."""
-        response = await asyncio.to_thread(
-            self.client.chat.completions.create,
-            messages=[{"role": "user", "content": prompt}],
-            model=self.model,
-            response_format={"type": "json_object"},
+        response = await self._create_completion(
+            prompt, response_format={"type": "json_object"}
         )
         return response.choices[0].message.content
 
@@ -191,10 +237,9 @@ class GroqProvider(LLMProvider):
         )
 
         try:
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
+            response = await self._create_completion(
+                prompt,
+                tool_name=function_def["function"]["name"],
                 tools=[function_def],
                 tool_choice="required",
                 max_tokens=8192,
@@ -209,61 +254,7 @@ class GroqProvider(LLMProvider):
             elif message.content:
                 raw_json_str = message.content
 
-            if raw_json_str:
-                logger.info(
-                    f"Attempting to parse JSON from response (length: {len(raw_json_str)})"
-                )
-
-                # 1. Try direct parse
-                try:
-                    return json.loads(raw_json_str)
-                except json.JSONDecodeError:
-                    pass
-
-                # 2. Try cleaning common escaping issues
-                try:
-                    # Fix escaped single quotes (common in LLM outputs)
-                    cleaned = raw_json_str.replace("\\'", "'")
-                    return json.loads(cleaned)
-                except json.JSONDecodeError:
-                    pass
-
-                # 3. Try regex extraction (find the main JSON block)
-                try:
-                    # Strip markdown block markers if present
-                    content = raw_json_str.strip()
-                    if "```" in content:
-                        # Extract content between markers
-                        match = re.search(
-                            r"```(?:json)?\s*(.*?)\s*```", content, re.DOTALL
-                        )
-                        if match:
-                            content = match.group(1)
-
-                    # Find potential JSON block (first { to last })
-                    match = re.search(r"(\{.*\})", content, re.DOTALL)
-                    if match:
-                        potential_json = match.group(1)
-                        # Remove problematic custom tags that some models might add
-                        potential_json = re.sub(r"</?function>", "", potential_json)
-
-                        try:
-                            return json.loads(potential_json)
-                        except json.JSONDecodeError:
-                            # Final attempt: fix internal escaped quotes in the regex match
-                            try:
-                                return json.loads(potential_json.replace("\\'", "'"))
-                            except json.JSONDecodeError:
-                                logger.error(
-                                    "Regex matched a block but it's still not valid JSON"
-                                )
-                except Exception as e:
-                    logger.error(f"Regex extraction error: {e}")
-
-            logger.error(
-                f"Failed to extract valid JSON from Groq response. Raw start: {raw_json_str[:500]}"
-            )
-            return {}
+            return parse_tool_call_json(raw_json_str)
 
         except Exception as e:
             logger.error(f"Groq API call failed: {str(e)}", exc_info=True)
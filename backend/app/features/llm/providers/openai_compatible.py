@@ -0,0 +1,128 @@
+import logging
+from typing import Any, Dict, Optional, Type
+
+import httpx
+from pydantic import BaseModel
+
+from features.llm.interfaces import LLMProvider
+from features.llm.providers.groq import parse_tool_call_json, pydantic_to_groq_function
+from features.llm.scheduler import get_scheduler, estimate_tokens
+from features.llm.telemetry import TokenUsage, submit_tracked
+
+
+logger = logging.getLogger(__name__)
+
+
+class OpenAICompatibleError(Exception):
+    """HTTP error from an OpenAI-compatible endpoint (carries status/headers for retries)"""
+
+    def __init__(self, status_code: int, response: httpx.Response):
+        super().__init__(f"HTTP {status_code}: {response.text[:200]}")
+        self.status_code = status_code
+        self.response = response
+
+
+def _openai_usage(response: Dict[str, Any]) -> TokenUsage:
+    usage = response.get("usage") or {}
+    details = usage.get("prompt_tokens_details") or {}
+    return TokenUsage(
+        prompt_tokens=usage.get("prompt_tokens"),
+        completion_tokens=usage.get("completion_tokens"),
+        cached_tokens=details.get("cached_tokens"),
+    )
+
+
+class OpenAICompatibleProvider(LLMProvider):
+    """
+    Provider for any OpenAI-compatible ``/chat/completions`` endpoint
+    (hosted APIs, or a local server such as Ollama / vLLM / llama.cpp).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        api_key: Optional[str] = None,
+        name: str = "openai",
+        timeout: float = 120.0,
+        **scheduler_overrides: Any,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.api_key = api_key
+        self.name = name
+        self.timeout = timeout
+        self.scheduler = get_scheduler(
+            f"{name}:{model}",
+            retryable_exceptions=(httpx.TransportError,),
+            **scheduler_overrides,
+        )
+
+    async def _post_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.post(
+                f"{self.base_url}/chat/completions", json=payload, headers=headers
+            )
+        if response.status_code >= 400:
+            raise OpenAICompatibleError(response.status_code, response)
+        return response.json()
+
+    async def _create_completion(self, prompt: str, tool_name: str = None, **kwargs) -> Dict[str, Any]:
+        """Send a chat completion through the rate-limit-aware scheduler."""
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            **kwargs,
+        }
+        return await submit_tracked(
+            self.scheduler,
+            lambda: self._post_completion(payload),
+            provider=self.name,
+            model=self.model,
+            tool_name=tool_name,
+            estimated_tokens=estimate_tokens(prompt),
+            usage=_openai_usage,
+        )
+
+    async def generate_response(self, prompt: str) -> str:
+        """Generate response (text mode, JSON output)."""
+        response = await self._create_completion(
+            prompt, response_format={"type": "json_object"}
+        )
+        return response["choices"][0]["message"].get("content") or ""
+
+    async def parse_with_function_calling(
+        self,
+        prompt: str,
+        model_class: Type[BaseModel],
+        description: str = None,
+        tool_name: str = None,
+    ) -> Dict[str, Any]:
+        """
+        Use function calling to parse text into a structured format.
+        """
+        function_def = pydantic_to_groq_function(
+            model_class, name=tool_name, description=description
+        )
+
+        try:
+            response = await self._create_completion(
+                prompt,
+                tool_name=function_def["function"]["name"],
+                tools=[function_def],
+                tool_choice="required",
+                max_tokens=8192,
+            )
+        except Exception as e:
+            logger.error(f"{self.name} API call failed: {str(e)}", exc_info=True)
+            raise
+
+        message = response["choices"][0]["message"]
+        raw_json_str = ""
+        if message.get("tool_calls"):
+            raw_json_str = message["tool_calls"][0]["function"].get("arguments") or ""
+        elif message.get("content"):
+            raw_json_str = message["content"]
+
+        return parse_tool_call_json(raw_json_str)
@@ -0,0 +1,278 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+
+from features.llm.interfaces import LLMProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmptyLLMResult(Exception):
+    """A backend answered, but nothing usable could be extracted"""
+
+
+class RoutedBackend:
+    """A provider plus the latency/health statistics the router ranks it by."""
+
+    def __init__(
+        self,
+        name: str,
+        provider: LLMProvider,
+        weight: float = 1.0,
+        failure_threshold: int = 3,
+        cooldown_seconds: float = 60.0,
+    ):
+        self.name = name
+        self.provider = provider
+        # Relative cost/quality penalty: lower is preferred at equal latency
+        self.weight = weight
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+
+        self.latencies: Deque[float] = deque(maxlen=200)
+        self.ewma_latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.unhealthy_until = 0.0
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def supports(self, method: str) -> bool:
+        return hasattr(self.provider, method)
+
+    def p95_latency(self) -> Optional[float]:
+        if len(self.latencies) < 20:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def record_success(self, latency: float) -> None:
+        self.calls += 1
+        self.latencies.append(latency)
+        self.ewma_latency = (
+            latency if self.ewma_latency is None else 0.8 * self.ewma_latency + 0.2 * latency
+        )
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        self.calls += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= self.failure_threshold:
+            # Circuit open: skip this backend until the cooldown expires,
+            # then let a single call through to probe it again.
+            self.unhealthy_until = time.monotonic() + self.cooldown_seconds
+            self.consecutive_failures = self.failure_threshold - 1
+            logger.warning(
+                f"LLM backend {self.name} marked unhealthy for {self.cooldown_seconds:.0f}s"
+            )
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "healthy": self.healthy,
+            "ewma_latency_s": round(self.ewma_latency, 3) if self.ewma_latency else None,
+            "p95_latency_s": round(self.p95_latency(), 3) if self.p95_latency() else None,
+            "calls": self.calls,
+            "failures": self.failures,
+        }
+
+
+class RouterProvider(LLMProvider):
+    """
+    LLM provider that routes each call over several backends.
+
+    Backends are ranked by observed latency times their weight, unhealthy ones
+    are skipped, errors fall back to the next backend, and (optionally) a
+    duplicate request is hedged to the runner-up when the first one is slower
+    than its p95 latency.
+    """
+
+    def __init__(
+        self,
+        backends: List[RoutedBackend],
+        hedging: bool = False,
+        hedge_min_delay: float = 10.0,
+        default_latency: float = 5.0,
+    ):
+        if not backends:
+            raise ValueError("RouterProvider needs at least one backend")
+        self.backends = backends
+        self.hedging = hedging
+        self.hedge_min_delay = hedge_min_delay
+        self.default_latency = default_latency
+
+    async def generate_response(self, prompt: str) -> str:
+        """Generate a response from the best available backend."""
+        return await self._route("generate_response", prompt)
+
+    async def parse_with_function_calling(
+        self,
+        prompt: str,
+        model_class: Type[BaseModel],
+        description: str = None,
+        tool_name: str = None,
+    ) -> Dict[str, Any]:
+        """Function-calling parse on the best available backend."""
+        try:
+            return await self._route(
+                "parse_with_function_calling",
+                prompt,
+                model_class,
+                description=description,
+                tool_name=tool_name,
+            )
+        except EmptyLLMResult:
+            return {}
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        return [backend.snapshot() for backend in self.backends]
+
+    def _candidates(self, method: str) -> List[RoutedBackend]:
+        supported = [b for b in self.backends if b.supports(method)]
+        healthy = [b for b in supported if b.healthy]
+        # If everything is tripped, still try the least-recently-tripped backends
+        pool = healthy or sorted(supported, key=lambda b: b.unhealthy_until)
+        return sorted(
+            pool, key=lambda b: (b.ewma_latency or self.default_latency) * b.weight
+        )
+
+    def _hedge_delay(self, backend: RoutedBackend) -> float:
+        p95 = backend.p95_latency()
+        return max(self.hedge_min_delay, p95) if p95 else self.hedge_min_delay
+
+    async def _call(self, backend: RoutedBackend, method: str, args, kwargs) -> Any:
+        started = time.monotonic()
+        try:
+            result = await getattr(backend.provider, method)(*args, **kwargs)
+            if method == "parse_with_function_calling" and not result:
+                raise EmptyLLMResult(f"{backend.name} returned no structured data")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            backend.record_failure()
+            raise
+        backend.record_success(time.monotonic() - started)
+        return result
+
+    async def _route(self, method: str, *args, **kwargs) -> Any:
+        queue = self._candidates(method)
+        if not queue:
+            raise RuntimeError(f"No LLM backend supports {method}")
+
+        pending: Dict[asyncio.Task, RoutedBackend] = {}
+        last_error: Optional[Exception] = None
+        try:
+            while queue or pending:
+                if not pending:
+                    backend = queue.pop(0)
+                    pending[asyncio.ensure_future(self._call(backend, method, args, kwargs))] = backend
+
+                timeout = None
+                if self.hedging and queue and len(pending) == 1:
+                    timeout = self._hedge_delay(next(iter(pending.values())))
+
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    backend = queue.pop(0)
+                    logger.info(f"Hedging {method} to {backend.name} after {timeout:.1f}s")
+                    pending[asyncio.ensure_future(self._call(backend, method, args, kwargs))] = backend
+                    continue
+
+                for task in done:
+                    backend = pending.pop(task)
+                    try:
+                        return task.result()
+                    except Exception as exc:
+                        last_error = exc
+                        logger.warning(
+                            f"LLM backend {backend.name} failed for {method}: {exc}"
+                            + (f"; falling back to {queue[0].name}" if queue else "")
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise last_error
+
+
+def _split_models(value: Optional[str]) -> List[str]:
+    return [m.strip() for m in (value or "").split(",") if m.strip()]
+
+
+def build_provider_from_settings() -> LLMProvider:
+    """
+    Build the default LLM provider from settings.
+
+    Plain ``GroqProvider`` when no alternative backend is configured, otherwise
+    a ``RouterProvider`` over the primary Groq model, smaller Groq models,
+    an OpenAI-compatible endpoint and a local stand-in.
+    """
+    from core.config import get_settings
+    from features.llm.providers.groq import GroqProvider
+    from features.llm.providers.openai_compatible import OpenAICompatibleProvider
+
+    settings = get_settings()
+    primary = GroqProvider()
+    backends = [RoutedBackend(f"groq:{primary.model}", primary, weight=1.0)]
+
+    for model in _split_models(settings.GROQ_FALLBACK_MODELS):
+        backends.append(RoutedBackend(f"groq:{model}", GroqProvider(model=model), weight=2.0))
+
+    if settings.OPENAI_COMPAT_BASE_URL and settings.OPENAI_COMPAT_MODEL:
+        backends.append(
+            RoutedBackend(
+                f"openai:{settings.OPENAI_COMPAT_MODEL}",
+                OpenAICompatibleProvider(
+                    settings.OPENAI_COMPAT_BASE_URL,
+                    settings.OPENAI_COMPAT_MODEL,
+                    api_key=settings.OPENAI_COMPAT_API_KEY,
+                    name="openai",
+                ),
+                weight=3.0,
+            )
+        )
+
+    if settings.LOCAL_LLM_BASE_URL and settings.LOCAL_LLM_MODEL:
+        backends.append(
+            RoutedBackend(
+                f"local:{settings.LOCAL_LLM_MODEL}",
+                OpenAICompatibleProvider(
+                    settings.LOCAL_LLM_BASE_URL,
+                    settings.LOCAL_LLM_MODEL,
+                    name="local",
+                    # A local server has no provider quota to respect
+                    requests_per_minute=10_000,
+                    tokens_per_minute=100_000_000,
+                ),
+                weight=4.0,
+            )
+        )
+
+    if len(backends) == 1:
+        return primary
+
+    logger.info(f"LLM routing enabled over: {', '.join(b.name for b in backends)}")
+    return RouterProvider(
+        backends,
+        hedging=settings.LLM_HEDGING_ENABLED,
+        hedge_min_delay=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+    )
+
+
+@lru_cache()
+def get_default_provider() -> LLMProvider:
+    """Get the process-wide default provider (backend health is shared across requests)"""
+    return build_provider_from_settings()
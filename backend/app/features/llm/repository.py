@@ -0,0 +1,67 @@
+"""
+LLM Repository - Telemetry persistence and aggregation
+"""
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import Integer, cast, func
+from sqlalchemy.orm import Session
+
+from .models import LLMCall
+
+
+class LLMCallRepository:
+    """Repository for LLM call telemetry"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, **fields: Any) -> LLMCall:
+        """Store a single call record"""
+        call = LLMCall(**fields)
+        self.db.add(call)
+        self.db.commit()
+        return call
+
+    def daily_summary(self, days: int = 7) -> List[Dict[str, Any]]:
+        """Latency percentiles and token/cost totals per day, provider and model"""
+        day = func.date_trunc("day", LLMCall.created_at).label("day")
+        rows = (
+            self.db.query(
+                day,
+                LLMCall.provider,
+                LLMCall.model,
+                func.count(LLMCall.id).label("calls"),
+                func.sum(cast(LLMCall.outcome != "success", Integer)).label("errors"),
+                func.sum(LLMCall.retries).label("retries"),
+                func.percentile_cont(0.5).within_group(LLMCall.latency_ms).label("p50_latency_ms"),
+                func.percentile_cont(0.95).within_group(LLMCall.latency_ms).label("p95_latency_ms"),
+                func.percentile_cont(0.95).within_group(LLMCall.total_ms).label("p95_total_ms"),
+                func.coalesce(func.sum(LLMCall.prompt_tokens), 0).label("prompt_tokens"),
+                func.coalesce(func.sum(LLMCall.completion_tokens), 0).label("completion_tokens"),
+                func.coalesce(func.sum(LLMCall.cached_tokens), 0).label("cached_tokens"),
+                func.coalesce(func.sum(LLMCall.cost_usd), 0.0).label("cost_usd"),
+            )
+            .filter(LLMCall.created_at >= datetime.utcnow() - timedelta(days=days))
+            .group_by(day, LLMCall.provider, LLMCall.model)
+            .order_by(day.desc(), LLMCall.provider, LLMCall.model)
+            .all()
+        )
+        return [
+            {
+                "day": row.day.date().isoformat(),
+                "provider": row.provider,
+                "model": row.model,
+                "calls": row.calls,
+                "errors": row.errors or 0,
+                "retries": row.retries or 0,
+                "p50_latency_ms": round(row.p50_latency_ms or 0),
+                "p95_latency_ms": round(row.p95_latency_ms or 0),
+                "p95_total_ms": round(row.p95_total_ms or 0),
+                "prompt_tokens": row.prompt_tokens,
+                "completion_tokens": row.completion_tokens,
+                "cached_tokens": row.cached_tokens,
+                "cost_usd": round(row.cost_usd, 4),
+            }
+            for row in rows
+        ]
@@ -0,0 +1,36 @@
+"""
+LLM Router
+
+Admin endpoints exposing LLM scheduling metrics and call telemetry.
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from db.session import get_db
+from features.auth.dependencies import require_admin_from_token
+from features.auth.schemas import TokenData
+from features.llm.repository import LLMCallRepository
+from features.llm.scheduler import get_all_schedulers
+
+router = APIRouter(prefix="/api/v1/llm", tags=["llm"])
+
+
+@router.get("/scheduler")
+async def get_scheduler_metrics(admin_user: TokenData = Depends(require_admin_from_token)):
+    """Queue depth, wait times and budget usage per LLM model - Admin only
+
+    Metrics are per process (each API/Celery worker keeps its own scheduler).
+    """
+    return {
+        "schedulers": [scheduler.snapshot() for scheduler in get_all_schedulers().values()]
+    }
+
+
+@router.get("/telemetry/daily")
+def get_daily_telemetry(
+    days: int = Query(7, ge=1, le=90),
+    admin_user: TokenData = Depends(require_admin_from_token),
+    db: Session = Depends(get_db),
+):
+    """p50/p95 latency, token usage and cost per day and model - Admin only"""
+    return {"days": LLMCallRepository(db).daily_summary(days)}
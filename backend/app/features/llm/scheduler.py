@@ -0,0 +1,415 @@
+"""
+LLM request scheduler.
+
+Keeps calls to a provider under its requests-per-minute and tokens-per-minute
+budgets, shares the available capacity fairly between callers and retries
+transient failures (429, 5xx, connection errors) with jittered exponential
+backoff that honours ``retry-after``.
+
+Schedulers are process-wide (one per provider/model) because providers are
+created per request, while the rate limits belong to the API key. They are
+shared between threads each running their own event loop (Celery's threads
+pool runs every task in its own ``asyncio.run``): the budget state is guarded
+by a lock, and waiters are woken on their own loop.
+"""
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, Type, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Who an LLM call is made on behalf of (usually the user id). Calls queued by
+# different callers are served round-robin instead of first-come first-served,
+# so one user uploading many CVs cannot starve everybody else.
+llm_caller: ContextVar[str] = ContextVar("llm_caller", default="anonymous")
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token)"""
+    return max(1, len(text or "") // 4)
+
+
+@dataclass
+class _Slot:
+    """A granted request occupying the sliding budget window"""
+
+    started_at: float
+    tokens: int
+    active: bool = True
+
+
+@dataclass(eq=False)
+class _Waiter:
+    caller: str
+    tokens: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    enqueued_at: float
+    # Set (under the lock) when the request is granted, before the future is resolved
+    slot: Optional[_Slot] = None
+
+
+def _call_in(loop: asyncio.AbstractEventLoop, fn: Callable[..., Any], *args: Any) -> bool:
+    """Run ``fn`` on ``loop`` (now if it is the current thread's loop); False if the loop is closed"""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        fn(*args)
+        return True
+    try:
+        loop.call_soon_threadsafe(fn, *args)
+    except RuntimeError:
+        return False
+    return True
+
+
+def _parse_retry_after(exc: Exception) -> Optional[float]:
+    """Read the retry-after (seconds) or retry-after-ms header from an API error"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return max(0.0, float(headers["retry-after-ms"]) / 1000)
+        if headers.get("retry-after") is not None:
+            return max(0.0, float(headers["retry-after"]))
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+class LLMScheduler:
+    """Rate-limit-aware queue in front of a single LLM provider/model"""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        window_seconds: float = 60.0,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (),
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.window_seconds = window_seconds
+        self.retryable_exceptions = (
+            ConnectionError,
+            TimeoutError,
+            asyncio.TimeoutError,
+        ) + tuple(retryable_exceptions)
+
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._window: Deque[_Slot] = deque()
+        self._window_tokens = 0
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        # Re-dispatch timer, on the loop of the waiter it was armed for
+        self._timer: Optional[Tuple[asyncio.TimerHandle, asyncio.AbstractEventLoop]] = None
+        self._timer_generation = 0
+        self._lock = threading.RLock()
+        self._wait_times: Deque[float] = deque(maxlen=1000)
+        self._stats = {"completed": 0, "failed": 0, "retries": 0, "rate_limited": 0}
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 1,
+        caller: Optional[str] = None,
+        usage: Optional[Callable[[T], Optional[int]]] = None,
+    ) -> T:
+        """
+        Run ``call`` once budget is available, retrying transient failures.
+
+        Args:
+            call: Zero-argument factory returning a fresh awaitable per attempt
+            estimated_tokens: Tokens reserved against the TPM budget up front
+            caller: Fairness key, defaults to the ``llm_caller`` context variable
+            usage: Extracts the real token usage from the result to settle the reservation
+
+        Returns:
+            The result of the first successful attempt
+        """
+        caller = caller or llm_caller.get()
+        attempt = 0
+        while True:
+            slot = await self._acquire(caller, estimated_tokens)
+            try:
+                result = await call()
+            except Exception as exc:
+                self._release(slot)
+                delay = self._retry_delay(exc, attempt)
+                if delay is None or attempt >= self.max_retries:
+                    self._count("failed")
+                    raise
+                attempt += 1
+                self._count("retries")
+                logger.warning(
+                    f"[{self.name}] transient LLM error ({type(exc).__name__}: {exc}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self._release(slot)
+                raise
+
+            actual_tokens = None
+            if usage is not None:
+                try:
+                    actual_tokens = usage(result)
+                except Exception:
+                    actual_tokens = None
+            self._release(slot, actual_tokens)
+            self._count("completed")
+            return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current queue depth, wait times and budget usage"""
+        with self._lock:
+            return self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        self._evict(now)
+        waits = sorted(self._wait_times)
+        return {
+            "name": self.name,
+            "queue_depth": sum(len(q) for q in self._queues.values()),
+            "queued_callers": len(self._queues),
+            "in_flight": self._in_flight,
+            "requests_in_window": len(self._window),
+            "tokens_in_window": self._window_tokens,
+            "requests_per_minute": self.requests_per_minute,
+            "tokens_per_minute": self.tokens_per_minute,
+            "cooldown_remaining_s": round(max(0.0, self._cooldown_until - now), 3),
+            "wait_time_avg_s": round(sum(waits) / len(waits), 3) if waits else 0.0,
+            "wait_time_p95_s": round(waits[int(0.95 * (len(waits) - 1))], 3) if waits else 0.0,
+            "wait_time_max_s": round(waits[-1], 3) if waits else 0.0,
+            **self._stats,
+        }
+
+    # ------------------------------------------------------------------
+    # Budget bookkeeping
+    # ------------------------------------------------------------------
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    async def _acquire(self, caller: str, tokens: int) -> _Slot:
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(caller, max(1, tokens), loop, loop.create_future(), time.monotonic())
+        with self._lock:
+            self._queues.setdefault(caller, deque()).append(waiter)
+        self._dispatch()
+        try:
+            return await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.slot
+                if granted is None:
+                    self._discard(waiter)
+            if granted is not None:
+                # Granted, but the caller went away before using the slot
+                self._release(granted)
+            raise
+
+    def _release(self, slot: _Slot, actual_tokens: Optional[int] = None) -> None:
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if actual_tokens is not None and slot.active:
+                self._window_tokens += actual_tokens - slot.tokens
+                slot.tokens = actual_tokens
+        self._dispatch()
+
+    def _discard(self, waiter: _Waiter) -> None:
+        queue = self._queues.get(waiter.caller)
+        if queue is None:
+            return
+        try:
+            queue.remove(waiter)
+        except ValueError:
+            pass
+        if not queue:
+            del self._queues[waiter.caller]
+
+    def _evict(self, now: float) -> None:
+        horizon = now - self.window_seconds
+        while self._window and self._window[0].started_at <= horizon:
+            slot = self._window.popleft()
+            slot.active = False
+            self._window_tokens -= slot.tokens
+
+    def _delay_for(self, tokens: int, now: float) -> float:
+        """Seconds until a request of ``tokens`` fits the budgets (inf = wait for a release)"""
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+        if self._in_flight >= self.max_concurrency:
+            return math.inf
+        if len(self._window) >= self.requests_per_minute:
+            return self._window[0].started_at + self.window_seconds - now
+        if self._window and self._window_tokens + tokens > self.tokens_per_minute:
+            freed = 0
+            for slot in self._window:
+                freed += slot.tokens
+                if self._window_tokens - freed + tokens <= self.tokens_per_minute:
+                    return slot.started_at + self.window_seconds - now
+            return self._window[-1].started_at + self.window_seconds - now
+        return 0.0
+
+    def _dispatch(self) -> None:
+        """Grant queued requests round-robin across callers while budget allows"""
+        granted = []
+        with self._lock:
+            self._cancel_timer()
+
+            now = time.monotonic()
+            self._evict(now)
+            while self._queues:
+                caller, queue = next(iter(self._queues.items()))
+                waiter = queue[0]
+                if waiter.future.done() or waiter.loop.is_closed():
+                    queue.popleft()
+                    if not queue:
+                        del self._queues[caller]
+                    continue
+
+                delay = self._delay_for(waiter.tokens, now)
+                if delay > 0:
+                    # The head waiter's loop runs for as long as it waits, so the timer goes there
+                    if delay == math.inf or _call_in(
+                        waiter.loop, self._start_timer, waiter.loop, self._timer_generation, delay
+                    ):
+                        break
+                    queue.popleft()
+                    if not queue:
+                        del self._queues[caller]
+                    continue
+
+                queue.popleft()
+                if queue:
+                    self._queues.move_to_end(caller)
+                else:
+                    del self._queues[caller]
+
+                slot = _Slot(started_at=now, tokens=waiter.tokens)
+                self._window.append(slot)
+                self._window_tokens += slot.tokens
+                self._in_flight += 1
+                self._wait_times.append(now - waiter.enqueued_at)
+                waiter.slot = slot
+                granted.append(waiter)
+
+        for waiter in granted:
+            if not _call_in(waiter.loop, self._wake, waiter):
+                # Its loop is gone: nobody will use the slot
+                self._release(waiter.slot)
+
+    @staticmethod
+    def _wake(waiter: _Waiter) -> None:
+        if not waiter.future.done():
+            waiter.future.set_result(waiter.slot)
+
+    def _start_timer(self, loop: asyncio.AbstractEventLoop, generation: int, delay: float) -> None:
+        """Runs on ``loop``: arm the re-dispatch timer unless a later dispatch superseded it"""
+        with self._lock:
+            if generation != self._timer_generation:
+                return
+            self._timer = (loop.call_later(max(delay, 0.001), self._dispatch), loop)
+
+    def _cancel_timer(self) -> None:
+        self._timer_generation += 1
+        if self._timer is not None:
+            handle, loop = self._timer
+            self._timer = None
+            _call_in(loop, handle.cancel)
+
+    def _retry_delay(self, exc: Exception, attempt: int) -> Optional[float]:
+        """Backoff before the next attempt, or None if the error is not transient"""
+        status_code = getattr(exc, "status_code", None)
+        if status_code is not None:
+            if status_code not in RETRYABLE_STATUS_CODES:
+                return None
+        elif not isinstance(exc, self.retryable_exceptions):
+            return None
+
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = _parse_retry_after(exc)
+
+        if status_code == 429:
+            # Pause every queued call, not just this one: the provider said the
+            # whole key is over budget.
+            pause = retry_after if retry_after is not None else backoff
+            with self._lock:
+                self._stats["rate_limited"] += 1
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + pause)
+
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        return backoff
+
+
+# Process-wide schedulers keyed by provider/model
+_schedulers: Dict[str, LLMScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(
+    name: str,
+    retryable_exceptions: Tuple[Type[BaseException], ...] = (),
+    **overrides: Any,
+) -> LLMScheduler:
+    """Get or create the shared scheduler for a provider/model.
+
+    ``overrides`` (e.g. ``requests_per_minute``) replace the settings-based
+    budgets when the scheduler is first created.
+    """
+    scheduler = _schedulers.get(name)
+    if scheduler is not None:
+        return scheduler
+    with _schedulers_lock:
+        scheduler = _schedulers.get(name)
+        if scheduler is not None:
+            return scheduler
+        from core.config import get_settings
+
+        settings = get_settings()
+        options = {
+            "requests_per_minute": settings.LLM_REQUESTS_PER_MINUTE,
+            "tokens_per_minute": settings.LLM_TOKENS_PER_MINUTE,
+            "max_concurrency": settings.LLM_MAX_CONCURRENCY,
+            "max_retries": settings.LLM_MAX_RETRIES,
+        }
+        options.update(overrides)
+        scheduler = LLMScheduler(
+            name, retryable_exceptions=retryable_exceptions, **options
+        )
+        _schedulers[name] = scheduler
+    return scheduler
+
+
+def get_all_schedulers() -> Dict[str, LLMScheduler]:
+    """All schedulers created in this process"""
+    return dict(_schedulers)
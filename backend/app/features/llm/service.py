@@ -1,9 +1,10 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Type
 from pydantic import BaseModel
 import json
 from features.llm.interfaces import LLMProvider
-from features.llm.providers.groq import GroqProvider
+from features.llm.providers.router import get_default_provider
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ class LLMService:
     """Service for LLM operations with strategy pattern."""
     
     def __init__(self, provider: LLMProvider = None):
-        self.provider = provider or GroqProvider()
+        self.provider = provider or get_default_provider()
     
     def set_provider(self, provider: LLMProvider):
         """Change the LLM provider."""
@@ -91,15 +92,24 @@ Return ONLY the structured data - extract everything you can from the resume."""
             raise ValueError(f"Failed to create {model_class.__name__} from extracted data: {e}")
 
     async def parse_multiple_models(self, text: str, model_configs: List[Dict[str, Any]]) -> List[BaseModel]:
-        """Parse text into multiple Pydantic models."""
+        """Parse text into multiple Pydantic models.
+
+        Calls are issued concurrently; the provider's scheduler paces them
+        against the rate limits.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self.parse_to_model(text, config['model_class'], config.get('instructions'))
+                for config in model_configs
+            ),
+            return_exceptions=True,
+        )
         results = []
-        for config in model_configs:
-            model_class = config['model_class']
-            instructions = config.get('instructions')
-            try:
-                model = await self.parse_to_model(text, model_class, instructions)
-                results.append(model)
-            except ValueError:
+        for outcome in outcomes:
+            if isinstance(outcome, ValueError):
                 # Skip if parsing fails
                 continue
-        return results
\ No newline at end of file
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(outcome)
+        return results
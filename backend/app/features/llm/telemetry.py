@@ -0,0 +1,160 @@
+"""
+LLM call telemetry.
+
+Providers send their calls through ``submit_tracked`` instead of calling the
+scheduler directly. It counts attempts, times the final attempt and the whole
+call (queueing and retries included), reads token usage from the response and
+stores one ``LLMCall`` row per call. Rows are written off the event loop and
+failures to write them never affect the LLM call itself.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+from features.llm.scheduler import LLMScheduler, llm_caller
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# USD per million (input, output) tokens
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "openai/gpt-oss-120b": (0.15, 0.75),
+    "openai/gpt-oss-20b": (0.10, 0.50),
+    "meta-llama/llama-4-scout-17b-16e-instruct": (0.11, 0.34),
+}
+
+
+@dataclass
+class TokenUsage:
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    cached_tokens: Optional[int] = None
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        if self.prompt_tokens is None and self.completion_tokens is None:
+            return None
+        return (self.prompt_tokens or 0) + (self.completion_tokens or 0)
+
+
+def estimate_cost(model: str, usage: TokenUsage) -> Optional[float]:
+    """Cost in USD, or None for models without known pricing"""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None or usage.total_tokens is None:
+        return None
+    input_price, output_price = pricing
+    return (
+        (usage.prompt_tokens or 0) * input_price
+        + (usage.completion_tokens or 0) * output_price
+    ) / 1_000_000
+
+
+# Keep references to in-flight writes so they are not garbage collected
+_pending_writes: Set[asyncio.Task] = set()
+
+
+def _write_call(fields: Dict[str, Any]) -> None:
+    from db.session import SessionLocal
+    from features.llm.repository import LLMCallRepository
+
+    db = SessionLocal()
+    try:
+        LLMCallRepository(db).create(**fields)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Failed to store LLM telemetry: {e}")
+    finally:
+        db.close()
+
+
+def record_llm_call(**fields: Any) -> None:
+    """Store a call record in the background (no-op when telemetry is disabled)"""
+    from core.config import get_settings
+
+    if not get_settings().LLM_TELEMETRY_ENABLED:
+        return
+    task = asyncio.get_running_loop().create_task(asyncio.to_thread(_write_call, fields))
+    _pending_writes.add(task)
+    task.add_done_callback(_pending_writes.discard)
+
+
+async def submit_tracked(
+    scheduler: LLMScheduler,
+    call: Callable[[], Awaitable[T]],
+    *,
+    provider: str,
+    model: str,
+    usage: Callable[[T], TokenUsage],
+    tool_name: Optional[str] = None,
+    estimated_tokens: int = 1,
+) -> T:
+    """
+    Run ``call`` through ``scheduler`` and record its telemetry.
+
+    Args:
+        scheduler: Scheduler of the provider/model
+        call: Zero-argument factory returning a fresh awaitable per attempt
+        provider: Provider name ("groq", "openai", "local")
+        model: Model name (also used for pricing)
+        usage: Extracts token usage from the response
+        tool_name: Function-calling tool, if any
+        estimated_tokens: Tokens reserved against the TPM budget up front
+    """
+    attempts = 0
+    attempt_started = 0.0
+
+    def attempt() -> Awaitable[T]:
+        nonlocal attempts, attempt_started
+        attempts += 1
+        attempt_started = time.monotonic()
+        return call()
+
+    def total_tokens(result: T) -> Optional[int]:
+        return usage(result).total_tokens
+
+    started = time.monotonic()
+    record = {
+        "provider": provider,
+        "model": model,
+        "tool_name": tool_name,
+        "caller": llm_caller.get(),
+    }
+    try:
+        result = await scheduler.submit(
+            attempt, estimated_tokens=estimated_tokens, usage=total_tokens
+        )
+    except Exception as exc:
+        now = time.monotonic()
+        record_llm_call(
+            **record,
+            latency_ms=int((now - (attempt_started or now)) * 1000),
+            total_ms=int((now - started) * 1000),
+            retries=max(0, attempts - 1),
+            outcome="error",
+            error_type=type(exc).__name__,
+        )
+        raise
+
+    now = time.monotonic()
+    try:
+        tokens = usage(result)
+    except Exception:
+        tokens = TokenUsage()
+    record_llm_call(
+        **record,
+        latency_ms=int((now - attempt_started) * 1000),
+        total_ms=int((now - started) * 1000),
+        retries=attempts - 1,
+        prompt_tokens=tokens.prompt_tokens,
+        completion_tokens=tokens.completion_tokens,
+        cached_tokens=tokens.cached_tokens,
+        cache_hit=bool(tokens.cached_tokens),
+        cost_usd=estimate_cost(model, tokens),
+        outcome="success",
+    )
+    return result
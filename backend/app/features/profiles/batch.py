@@ -0,0 +1,269 @@
+"""
+Batch create/update/delete endpoints for profile sections.
+
+Every section router gets ``POST``, ``PATCH`` and ``DELETE`` on
+``<section>:batch``. The list is validated as a whole, ownership is checked
+once, and the batch is applied in the request's single transaction: creates
+become one multi-row INSERT per table (see ``bulk_insert_entities``), and updates and deletes load their
+targets in one SELECT and are flushed as executemany statements. Items that
+cannot be applied (unknown UUID, duplicate value) are reported per item and
+do not abort the rest of the batch. Duplicates are checked on creates and
+updates, against the profile's rows and earlier items of the same batch,
+ignoring case.
+"""
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
+from uuid import UUID
+
+from fastapi import APIRouter, Body, Depends
+from pydantic import BaseModel, Field, create_model
+from pydantic_core import Url
+from sqlalchemy.orm import Session, selectinload
+
+from db.session import get_db
+from shared.models.entity import bulk_insert_entities
+from .dependencies import OwnedProfile, get_owned_profile
+
+MAX_BATCH_ITEMS = 200
+
+T = TypeVar("T")
+
+
+def column_values(validated: BaseModel, exclude_unset: bool = False) -> Dict[str, Any]:
+    """Schema fields as column values (URLs are stored as plain strings)"""
+    return {
+        name: str(value) if isinstance(value, Url) else value
+        for name, value in validated.model_dump(exclude_unset=exclude_unset).items()
+    }
+
+
+def unique_key(value: Any) -> Any:
+    """Unique values are compared ignoring case and surrounding whitespace"""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class BatchItemStatus(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    NOT_FOUND = "not_found"
+    CONFLICT = "conflict"
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """Outcome of one item, in request order"""
+    index: int
+    status: BatchItemStatus
+    uuid: Optional[UUID] = None
+    item: Optional[T] = None
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    succeeded: int
+    failed: int
+    results: List[BatchItemResult[T]]
+
+
+class BatchRequest(BaseModel, Generic[T]):
+    items: List[T] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchDeleteRequest(BaseModel):
+    uuids: List[UUID] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+@dataclass(frozen=True)
+class SectionBatch:
+    """How a section maps to its model and schemas"""
+    model: type
+    create_schema: Type[BaseModel]
+    update_schema: Type[BaseModel]
+    response_schema: Type[BaseModel]
+    # Column that must be unique per profile (reported as a conflict)
+    unique_field: Optional[str] = None
+    # Column set on the first item created for a profile that has none
+    first_default_field: Optional[str] = None
+
+
+class SectionBatchService:
+    """Applies a batch of section changes without committing"""
+
+    def __init__(self, db: Session, section: SectionBatch):
+        self.db = db
+        self.section = section
+
+    def create_many(self, profile_id: int, items: List[BaseModel]) -> BatchResponse:
+        model = self.section.model
+        results: List[Optional[BatchItemResult]] = [None] * len(items)
+        owners = self._unique_value_owners(profile_id)
+        needs_default = self._needs_default(profile_id)
+
+        created = []
+        for index, item in enumerate(items):
+            values = column_values(item)
+            if self.section.unique_field:
+                value = values.get(self.section.unique_field)
+                key = unique_key(value)
+                if key in owners:
+                    results[index] = self._conflict(index, value)
+                    continue
+                owners[key] = None
+            if self.section.first_default_field:
+                values[self.section.first_default_field] = needs_default
+                needs_default = False
+            created.append((index, {"profile_id": profile_id, **values}))
+
+        rows = bulk_insert_entities(self.db, model, [values for _, values in created])
+        for (index, _), row in zip(created, rows):
+            results[index] = self._success(index, BatchItemStatus.CREATED, row)
+        return self._response(results)
+
+    def update_many(self, profile_id: int, items: List[BaseModel]) -> BatchResponse:
+        rows = self._load(profile_id, [item.uuid for item in items])
+        results: List[Optional[BatchItemResult]] = [None] * len(items)
+        owners = self._unique_value_owners(profile_id)
+        unique_field = self.section.unique_field
+
+        updated = []
+        for index, item in enumerate(items):
+            row = rows.get(item.uuid)
+            if row is None:
+                results[index] = self._failure(index, BatchItemStatus.NOT_FOUND, "Item not found", item.uuid)
+                continue
+            changes = column_values(item, exclude_unset=True)
+            changes.pop("uuid", None)
+            if unique_field and unique_field in changes:
+                # Checked against the values as earlier items left them
+                key = unique_key(changes[unique_field])
+                if owners.get(key, row.uuid) != row.uuid:
+                    results[index] = self._conflict(index, changes[unique_field], row.uuid)
+                    continue
+                owners.pop(unique_key(getattr(row, unique_field)), None)
+                owners[key] = row.uuid
+            for name, value in changes.items():
+                setattr(row, name, value)
+            updated.append((index, row))
+
+        self.db.flush()
+        for index, row in updated:
+            results[index] = self._success(index, BatchItemStatus.UPDATED, row)
+        return self._response(results)
+
+    def delete_many(self, profile_id: int, uuids: List[UUID]) -> BatchResponse:
+        # Embeddings cascade on delete: load them with the rows, not one query per row
+        rows = self._load(profile_id, uuids, selectinload(self.section.model.embeddings))
+        results = []
+        deleted = set()
+        for index, item_uuid in enumerate(uuids):
+            row = rows.get(item_uuid)
+            if row is None or item_uuid in deleted:
+                results.append(self._failure(index, BatchItemStatus.NOT_FOUND, "Item not found", item_uuid))
+                continue
+            self.db.delete(row)
+            deleted.add(item_uuid)
+            results.append(BatchItemResult(index=index, status=BatchItemStatus.DELETED, uuid=item_uuid))
+
+        self.db.flush()
+        return self._response(results)
+
+    def _load(self, profile_id: int, uuids: List[UUID], *options) -> Dict[UUID, Any]:
+        model = self.section.model
+        rows = (
+            self.db.query(model)
+            .options(*options)
+            .filter(model.profile_id == profile_id, model.uuid.in_(set(uuids)))
+            .all()
+        )
+        return {row.uuid: row for row in rows}
+
+    def _unique_value_owners(self, profile_id: int) -> Dict[Any, Optional[UUID]]:
+        """UUID of the row holding each unique value of the profile"""
+        if not self.section.unique_field:
+            return {}
+        model = self.section.model
+        column = getattr(model, self.section.unique_field)
+        return {
+            unique_key(value): item_uuid for item_uuid, value in
+            self.db.query(model.uuid, column).filter(model.profile_id == profile_id)
+        }
+
+    def _needs_default(self, profile_id: int) -> bool:
+        if not self.section.first_default_field:
+            return False
+        model = self.section.model
+        return self.db.query(model.id).filter(model.profile_id == profile_id).first() is None
+
+    def _success(self, index: int, status: BatchItemStatus, row: Any) -> BatchItemResult:
+        return BatchItemResult(
+            index=index,
+            status=status,
+            uuid=row.uuid,
+            item=self.section.response_schema.model_validate(row),
+        )
+
+    @staticmethod
+    def _failure(
+        index: int, status: BatchItemStatus, error: str, item_uuid: Optional[UUID] = None
+    ) -> BatchItemResult:
+        return BatchItemResult(index=index, status=status, uuid=item_uuid, error=error)
+
+    def _conflict(self, index: int, value: Any, item_uuid: Optional[UUID] = None) -> BatchItemResult:
+        return self._failure(
+            index, BatchItemStatus.CONFLICT,
+            f"{self.section.unique_field} '{value}' already exists for this profile", item_uuid
+        )
+
+    @staticmethod
+    def _response(results: List[BatchItemResult]) -> BatchResponse:
+        failed = sum(result.error is not None for result in results)
+        return BatchResponse(succeeded=len(results) - failed, failed=failed, results=results)
+
+
+def add_batch_routes(router: APIRouter, section: SectionBatch) -> None:
+    """Register ``POST/PATCH/DELETE <prefix>:batch`` on a section router"""
+    name = section.model.__tablename__
+    response_model = BatchResponse[section.response_schema]
+    create_request = BatchRequest[section.create_schema]
+    update_item = create_model(
+        f"{section.update_schema.__name__}BatchItem",
+        __base__=section.update_schema,
+        uuid=(UUID, ...),
+    )
+    update_request = BatchRequest[update_item]
+
+    def create_batch(
+        batch: create_request,
+        profile: OwnedProfile = Depends(get_owned_profile),
+        db: Session = Depends(get_db),
+    ):
+        return SectionBatchService(db, section).create_many(profile.id, batch.items)
+
+    def update_batch(
+        batch: update_request,
+        profile: OwnedProfile = Depends(get_owned_profile),
+        db: Session = Depends(get_db),
+    ):
+        return SectionBatchService(db, section).update_many(profile.id, batch.items)
+
+    def delete_batch(
+        batch: BatchDeleteRequest = Body(...),
+        profile: OwnedProfile = Depends(get_owned_profile),
+        db: Session = Depends(get_db),
+    ):
+        return SectionBatchService(db, section).delete_many(profile.id, batch.uuids)
+
+    for method, endpoint, summary in (
+        ("POST", create_batch, f"Create several {name} at once"),
+        ("PATCH", update_batch, f"Update several {name} at once"),
+        ("DELETE", delete_batch, f"Delete several {name} at once"),
+    ):
+        router.add_api_route(
+            ":batch",
+            endpoint,
+            methods=[method],
+            response_model=response_model,
+            summary=summary,
+            name=f"{method.lower()}_{name}_batch",
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -25,6 +25,11 @@ class Certificate(BaseEntity):
     profile = relationship("Profile", back_populates="certificates")
     # embeddings relationship is inherited from BaseEntity via Entity table
     
+    # Keyset pagination of the profile's list endpoint
+    __table_args__ = (
+        Index('ix_certificates_profile_issue_date', 'profile_id', 'issue_date', 'id'),
+    )
+    
     __mapper_args__ = {
         'polymorphic_identity': 'certificate',
     }
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from core.pagination import DEFAULT_PAGE_SIZE, Page, keyset_page
 from .models import Certificate
 from .schemas import CertificateCreate, CertificateUpdate
 
@@ -13,8 +14,7 @@ class CertificateRepository:
         
         certificate = Certificate(**data_dict)
         self.db.add(certificate)
-        self.db.commit()
-        self.db.refresh(certificate)
+        self.db.flush()
         return certificate
     
     def get_by_uuid(self, certificate_uuid: str) -> Optional[Certificate]:
@@ -28,6 +28,13 @@ class CertificateRepository:
                 .limit(limit)
                 .all())
     
+    def get_page_by_profile_id(
+        self, profile_id: int, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Page:
+        """One page of the profile's items, newest issue_date first (keyset paginated)"""
+        query = self.db.query(Certificate).filter(Certificate.profile_id == profile_id)
+        return keyset_page(query, Certificate.issue_date, Certificate.id, cursor, limit)
+    
     def get_active_certificates(self, user_uuid: str) -> List[Certificate]:
         """Get non-expired certificates for a user"""
         from features.users.models import User
@@ -55,14 +62,13 @@ class CertificateRepository:
         if certificate:
             for field, value in certificate_data.model_dump(exclude_unset=True).items():
                 setattr(certificate, field, value)
-            self.db.commit()
-            self.db.refresh(certificate)
+            self.db.flush()
         return certificate
     
     def delete_by_uuid(self, certificate_uuid: str) -> bool:
         certificate = self.get_by_uuid(certificate_uuid)
         if certificate:
             self.db.delete(certificate)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from core.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
-from features.users.models import User
+from core.pagination import PageParams, page_params, set_next_cursor
+from db.session import get_db, get_read_db
 from .service import CertificateService
 from .schemas import CertificateCreate, CertificateUpdate, CertificateResponse
-from features.profiles.repository import ProfileRepository
+from .models import Certificate
+from features.profiles.dependencies import OwnedProfile, get_owned_profile, get_owned_profile_read
+from features.profiles.batch import SectionBatch, add_batch_routes
 # from features.vector_embeddings.async_service import trigger_section_item_indexing
 
 router = APIRouter(
@@ -16,32 +17,18 @@ router = APIRouter(
 )
 
 
-def check_profile_ownership(db: Session, current_user: User, profile_uuid: str):
-    """Ensure the user owns the profile they are trying to manipulate"""
-    repo = ProfileRepository(db)
-    profile = repo.get_by_uuid(profile_uuid)
-    if not profile or profile.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403,
-            message="Not authorized to access this profile's certificates",
-        )
-    return profile
-
-
 @router.post(
     "/", response_model=CertificateResponse, status_code=status.HTTP_201_CREATED
 )
 def create_certificate(
-    profile_uuid: str,
     certificate_data: CertificateCreate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Create a new certificate for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = CertificateService(db)
     try:
-        certificate = service.create_certificate(profile_uuid, certificate_data)
+        certificate = service.create_certificate(profile.id, certificate_data)
 
         # Trigger async indexing
         # trigger_section_item_indexing(
@@ -58,26 +45,24 @@ def create_certificate(
 
 @router.get("/", response_model=List[CertificateResponse])
 def get_profile_certificates(
-    profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    profile: OwnedProfile = Depends(get_owned_profile_read),
+    db: Session = Depends(get_read_db),
 ):
-    """Get all certificates for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
+    """Get all certificates for the specified profile (keyset paginated, see X-Next-Cursor)"""
     service = CertificateService(db)
-    return service.get_certificates_by_profile(profile_uuid)
+    return set_next_cursor(response, service.get_certificates_page(profile.id, page.cursor, page.limit))
 
 
 @router.put("/{certificate_uuid}", response_model=CertificateResponse)
 def update_certificate(
-    profile_uuid: str,
     certificate_uuid: str,
     certificate_data: CertificateUpdate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Update certificate information by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = CertificateService(db)
     certificate = service.update_certificate_by_uuid(certificate_uuid, certificate_data)
     if not certificate:
@@ -96,13 +81,19 @@ def update_certificate(
 
 @router.delete("/{certificate_uuid}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_certificate(
-    profile_uuid: str,
     certificate_uuid: str,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Delete a certificate by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = CertificateService(db)
     if not service.delete_certificate_by_uuid(certificate_uuid):
         raise HTTPException(status_code=404, message="Certificate not found")
+
+
+add_batch_routes(router, SectionBatch(
+    model=Certificate,
+    create_schema=CertificateCreate,
+    update_schema=CertificateUpdate,
+    response_schema=CertificateResponse,
+))
@@ -23,8 +23,7 @@ class CustomSectionRepository:
             **section_data.model_dump()
         )
         self.db.add(db_section)
-        self.db.commit()
-        self.db.refresh(db_section)
+        self.db.flush()
         return db_section
     
     def get_by_uuid(self, section_uuid: str) -> Optional[CustomSection]:
@@ -38,8 +37,7 @@ class CustomSectionRepository:
             **section_data.model_dump()
         )
         self.db.add(db_section)
-        self.db.commit()
-        self.db.refresh(db_section)
+        self.db.flush()
         return db_section
     
     def get_by_profile_id(self, profile_id: int, skip: int = 0, limit: int = 100) -> List[CustomSection]:
@@ -70,12 +68,11 @@ class CustomSectionRepository:
         for field, value in update_data.items():
             setattr(db_section, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_section)
+        self.db.flush()
         return db_section
     
     def delete(self, db_section: CustomSection) -> bool:
         """Delete a custom section"""
         self.db.delete(db_section)
-        self.db.commit()
+        self.db.flush()
         return True
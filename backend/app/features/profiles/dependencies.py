@@ -0,0 +1,88 @@
+"""
+Profile resolution shared by the profile section routers.
+
+``get_owned_profile`` resolves ``{profile_uuid}`` from the path and checks it
+belongs to the current user once per request; the resolved id is then passed
+to the section services. GET endpoints use ``get_owned_profile_read``, which
+does the same on their ``get_read_db`` session. Profile ids and owners never change, so resolved
+ownerships are kept in a short-lived cache keyed by ``(user_id, profile_uuid)``.
+Only successful lookups are cached.
+
+The cache is per process: deleting a profile evicts its entry in the process
+that served the delete, but other workers keep theirs for up to
+``PROFILE_OWNERSHIP_CACHE_TTL_SECONDS``. Keep that TTL short (a few seconds
+spares the lookup for a burst of section edits); set it to 0 to always check.
+"""
+from dataclasses import dataclass
+from uuid import UUID
+
+from fastapi import Depends, status
+from sqlalchemy.orm import Session
+
+from core.cache import TTLCache
+from core.config import get_settings
+from core.exceptions import HTTPException
+from db.session import get_db, get_read_db
+from features.auth.dependencies import get_current_user, get_current_user_read
+from features.users.models import User
+from .repository import ProfileRepository
+
+_ownership_cache: TTLCache[int] = TTLCache(
+    maxsize=10_000, ttl_seconds=get_settings().PROFILE_OWNERSHIP_CACHE_TTL_SECONDS
+)
+
+
+@dataclass(frozen=True)
+class OwnedProfile:
+    """A profile the current user is allowed to modify"""
+
+    id: int
+    uuid: UUID
+    user_id: int
+
+
+def invalidate_profile_ownership(profile_uuid: UUID, user_id: int) -> None:
+    """Forget a cached ownership (e.g. after the profile is deleted)"""
+    _ownership_cache.delete((user_id, profile_uuid))
+
+
+def get_owned_profile(
+    profile_uuid: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> OwnedProfile:
+    """
+    Dependency resolving the path profile and checking the current user owns it
+    """
+    return _resolve_owned_profile(profile_uuid, current_user, db)
+
+
+def get_owned_profile_read(
+    profile_uuid: str,
+    current_user: User = Depends(get_current_user_read),
+    db: Session = Depends(get_read_db),
+) -> OwnedProfile:
+    """``get_owned_profile`` for read-only endpoints, on their ``get_read_db`` session"""
+    return _resolve_owned_profile(profile_uuid, current_user, db)
+
+
+def _resolve_owned_profile(profile_uuid: str, current_user: User, db: Session) -> OwnedProfile:
+    forbidden = HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        message="Not authorized to access this profile",
+    )
+    try:
+        parsed_uuid = UUID(profile_uuid)
+    except ValueError:
+        raise forbidden
+
+    key = (current_user.id, parsed_uuid)
+    profile_id = _ownership_cache.get(key)
+    if profile_id is None:
+        owner = ProfileRepository(db).get_owner_by_uuid(parsed_uuid)
+        if owner is None or owner[1] != current_user.id:
+            raise forbidden
+        profile_id = owner[0]
+        _ownership_cache.set(key, profile_id)
+
+    return OwnedProfile(id=profile_id, uuid=parsed_uuid, user_id=current_user.id)
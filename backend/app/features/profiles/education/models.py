@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, Float, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -28,6 +28,11 @@ class Education(BaseEntity):
     profile = relationship("Profile", back_populates="education")
     # embeddings relationship is inherited from BaseEntity via Entity table
     
+    # Keyset pagination of the profile's list endpoint
+    __table_args__ = (
+        Index('ix_education_profile_end_date', 'profile_id', 'end_date', 'id'),
+    )
+    
     __mapper_args__ = {
         'polymorphic_identity': 'education',
     }
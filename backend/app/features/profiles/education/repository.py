@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from core.pagination import DEFAULT_PAGE_SIZE, Page, keyset_page
 from .models import Education
 from .schemas import EducationCreate, EducationUpdate
 
@@ -13,8 +14,7 @@ class EducationRepository:
         
         education = Education(**data_dict)
         self.db.add(education)
-        self.db.commit()
-        self.db.refresh(education)
+        self.db.flush()
         return education
     
     def get_by_uuid(self, education_uuid: str) -> Optional[Education]:
@@ -28,6 +28,13 @@ class EducationRepository:
                 .limit(limit)
                 .all())
     
+    def get_page_by_profile_id(
+        self, profile_id: int, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Page:
+        """One page of the profile's items, newest end_date first (keyset paginated)"""
+        query = self.db.query(Education).filter(Education.profile_id == profile_id)
+        return keyset_page(query, Education.end_date, Education.id, cursor, limit)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> List[Education]:
         return self.db.query(Education).offset(skip).limit(limit).all()
     
@@ -36,14 +43,13 @@ class EducationRepository:
         if education:
             for field, value in education_data.model_dump(exclude_unset=True).items():
                 setattr(education, field, value)
-            self.db.commit()
-            self.db.refresh(education)
+            self.db.flush()
         return education
     
     def delete_by_uuid(self, education_uuid: str) -> bool:
         education = self.get_by_uuid(education_uuid)
         if education:
             self.db.delete(education)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
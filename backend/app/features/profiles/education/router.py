@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from core.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
-from features.users.models import User
+from core.pagination import PageParams, page_params, set_next_cursor
+from db.session import get_db, get_read_db
 from .service import EducationService
 from .schemas import EducationCreate, EducationUpdate, EducationResponse
-from features.profiles.repository import ProfileRepository
+from .models import Education
+from features.profiles.dependencies import OwnedProfile, get_owned_profile, get_owned_profile_read
+from features.profiles.batch import SectionBatch, add_batch_routes
 # from features.vector_embeddings.async_service import trigger_section_item_indexing
 
 router = APIRouter(
@@ -16,29 +17,16 @@ router = APIRouter(
 )
 
 
-def check_profile_ownership(db: Session, current_user: User, profile_uuid: str):
-    """Ensure the user owns the profile they are trying to manipulate"""
-    repo = ProfileRepository(db)
-    profile = repo.get_by_uuid(profile_uuid)
-    if not profile or profile.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403, message="Not authorized to access this profile's education"
-        )
-    return profile
-
-
 @router.post("/", response_model=EducationResponse, status_code=status.HTTP_201_CREATED)
 def create_education(
-    profile_uuid: str,
     education_data: EducationCreate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Create a new education record for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = EducationService(db)
     try:
-        education = service.create_education(profile_uuid, education_data)
+        education = service.create_education(profile.id, education_data)
 
         # Trigger async indexing
         # trigger_section_item_indexing(
@@ -55,26 +43,24 @@ def create_education(
 
 @router.get("/", response_model=List[EducationResponse])
 def get_profile_education(
-    profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    response: Response,
+    page: PageParams = Depends(page_params),
+    profile: OwnedProfile = Depends(get_owned_profile_read),
+    db: Session = Depends(get_read_db),
 ):
-    """Get all education records for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
+    """Get all education records for the specified profile (keyset paginated, see X-Next-Cursor)"""
     service = EducationService(db)
-    return service.get_education_by_profile(profile_uuid)
+    return set_next_cursor(response, service.get_education_page(profile.id, page.cursor, page.limit))
 
 
 @router.put("/{education_uuid}", response_model=EducationResponse)
 def update_education(
-    profile_uuid: str,
     education_uuid: str,
     education_data: EducationUpdate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Update education information by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = EducationService(db)
     education = service.update_education_by_uuid(education_uuid, education_data)
     if not education:
@@ -93,13 +79,19 @@ def update_education(
 
 @router.delete("/{education_uuid}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_education(
-    profile_uuid: str,
     education_uuid: str,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Delete an education record by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = EducationService(db)
     if not service.delete_education_by_uuid(education_uuid):
         raise HTTPException(status_code=404, message="Education record not found")
+
+
+add_batch_routes(router, SectionBatch(
+    model=Education,
+    create_schema=EducationCreate,
+    update_schema=EducationUpdate,
+    response_schema=EducationResponse,
+))
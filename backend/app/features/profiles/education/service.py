@@ -1,33 +1,31 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from core.pagination import DEFAULT_PAGE_SIZE, Page
 from .repository import EducationRepository
 from .schemas import EducationCreate, EducationUpdate, EducationResponse
-from features.profiles.repository import ProfileRepository
 
 class EducationService:
     def __init__(self, db: Session):
         self.repository = EducationRepository(db)
-        self.profile_repository = ProfileRepository(db)
     
-    def create_education(self, profile_uuid: str, education_data: EducationCreate) -> EducationResponse:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            raise ValueError("Profile not found")
-        
-        education = self.repository.create_with_profile_id(profile.id, education_data)
+    def create_education(self, profile_id: int, education_data: EducationCreate) -> EducationResponse:
+        education = self.repository.create_with_profile_id(profile_id, education_data)
         return EducationResponse.model_validate(education)
     
     def get_education_by_uuid(self, education_uuid: str) -> Optional[EducationResponse]:
         education = self.repository.get_by_uuid(education_uuid)
         return EducationResponse.model_validate(education) if education else None
     
-    def get_education_by_profile(self, profile_uuid: str, skip: int = 0, limit: int = 100) -> List[EducationResponse]:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            return []
-        education = self.repository.get_by_profile_id(profile.id, skip, limit)
+    def get_education_by_profile(self, profile_id: int, skip: int = 0, limit: int = 100) -> List[EducationResponse]:
+        education = self.repository.get_by_profile_id(profile_id, skip, limit)
         return [EducationResponse.model_validate(e) for e in education]
     
+    def get_education_page(
+        self, profile_id: int, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Page:
+        page = self.repository.get_page_by_profile_id(profile_id, cursor, limit)
+        return Page(items=[EducationResponse.model_validate(item) for item in page.items], next_cursor=page.next_cursor)
+    
     def update_education_by_uuid(self, education_uuid: str, education_data: EducationUpdate) -> Optional[EducationResponse]:
         education = self.repository.update_by_uuid(education_uuid, education_data)
         return EducationResponse.model_validate(education) if education else None
@@ -0,0 +1,79 @@
+"""
+Full Profile
+
+Schema and assembly of a profile together with all of its sections, served
+by ``GET /api/v1/profiles/{profile_uuid}/full`` so the profile editor loads
+in one request instead of one per section.
+"""
+
+from datetime import date
+from typing import List
+
+from features.profiles.models import Profile
+from features.profiles.schemas import ProfileResponse
+from features.profiles.certificates.schemas import CertificateResponse
+from features.profiles.custom_sections.schemas import CustomSectionResponse
+from features.profiles.education.schemas import EducationResponse
+from features.profiles.languages.schemas import LanguageResponse
+from features.profiles.professional_summaries.schemas import ProfessionalSummaryResponse
+from features.profiles.profile_links.schemas import ProfileLinkResponse
+from features.profiles.projects.schemas import ProjectResponse
+from features.profiles.skills.schemas import SkillResponse
+from features.profiles.work_experiences.schemas import WorkExperienceResponse
+
+
+class ProfileFullResponse(ProfileResponse):
+    """A profile with every section, ordered like the section endpoints"""
+    professional_summaries: List[ProfessionalSummaryResponse] = []
+    work_experiences: List[WorkExperienceResponse] = []
+    education: List[EducationResponse] = []
+    skills: List[SkillResponse] = []
+    projects: List[ProjectResponse] = []
+    certificates: List[CertificateResponse] = []
+    languages: List[LanguageResponse] = []
+    links: List[ProfileLinkResponse] = []
+    custom_sections: List[CustomSectionResponse] = []
+
+
+def _nulls_high(value, default):
+    """Sort key putting NULLs after every value, like PostgreSQL does"""
+    return value is None, value if value is not None else default
+
+
+def build_full_profile_response(profile: Profile) -> ProfileFullResponse:
+    """Serialize a profile whose sections are already loaded"""
+    return ProfileFullResponse(
+        name=profile.name,
+        email=profile.email,
+        phone_number=profile.phone_number,
+        location=profile.location,
+        uuid=profile.uuid,
+        created_at=profile.created_at,
+        updated_at=profile.updated_at,
+        professional_summaries=[
+            ProfessionalSummaryResponse.model_validate(s) for s in profile.professional_summaries
+        ],
+        work_experiences=[
+            WorkExperienceResponse.model_validate(w)
+            for w in sorted(profile.work_experiences, key=lambda w: _nulls_high(w.start_date, date.min), reverse=True)
+        ],
+        education=[
+            EducationResponse.model_validate(e)
+            for e in sorted(profile.education, key=lambda e: _nulls_high(e.end_date, date.min), reverse=True)
+        ],
+        skills=[SkillResponse.model_validate(s) for s in profile.skills],
+        projects=[ProjectResponse.model_validate(p) for p in profile.projects],
+        certificates=[
+            CertificateResponse.model_validate(c)
+            for c in sorted(profile.certificates, key=lambda c: _nulls_high(c.issue_date, date.min), reverse=True)
+        ],
+        languages=[
+            LanguageResponse.model_validate(l)
+            for l in sorted(profile.languages, key=lambda l: _nulls_high(l.proficiency, ""), reverse=True)
+        ],
+        links=[
+            ProfileLinkResponse.model_validate(l)
+            for l in sorted(profile.profile_links, key=lambda l: _nulls_high(l.platform, ""))
+        ],
+        custom_sections=[CustomSectionResponse.model_validate(c) for c in profile.custom_sections],
+    )
@@ -5,6 +5,7 @@ Handles all database operations for language skills.
 """
 
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from features.profiles.languages import Language
 from features.profiles.languages.schemas import LanguageCreate, LanguageUpdate
@@ -23,8 +24,7 @@ class LanguageRepository:
             **language_data.model_dump()
         )
         self.db.add(db_language)
-        self.db.commit()
-        self.db.refresh(db_language)
+        self.db.flush()
         return db_language
     
     def get_by_uuid(self, language_uuid: str) -> Optional[Language]:
@@ -43,10 +43,13 @@ class LanguageRepository:
         )
     
     def get_by_profile_and_language(self, profile_id: int, language_name: str) -> Optional[Language]:
-        """Check if a language already exists for a profile"""
+        """Check if a language already exists for a profile (ignoring case)"""
         return (
             self.db.query(Language)
-            .filter(Language.profile_id == profile_id, Language.language == language_name)
+            .filter(
+                Language.profile_id == profile_id,
+                func.lower(func.trim(Language.language)) == language_name.strip().lower(),
+            )
             .first()
         )
     
@@ -57,12 +60,11 @@ class LanguageRepository:
         for field, value in update_data.items():
             setattr(db_language, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_language)
+        self.db.flush()
         return db_language
     
     def delete(self, db_language: Language) -> bool:
         """Delete a language record"""
         self.db.delete(db_language)
-        self.db.commit()
+        self.db.flush()
         return True
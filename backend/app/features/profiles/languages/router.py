@@ -3,12 +3,12 @@ from core.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
-from features.users.models import User
+from db.session import get_db, get_read_db
 from .service import LanguageService
 from .schemas import LanguageCreate, LanguageUpdate, LanguageResponse
-from features.profiles.repository import ProfileRepository
+from .models import Language
+from features.profiles.dependencies import OwnedProfile, get_owned_profile, get_owned_profile_read
+from features.profiles.batch import SectionBatch, add_batch_routes
 # from features.vector_embeddings.async_service import trigger_section_item_indexing
 
 router = APIRouter(
@@ -16,29 +16,16 @@ router = APIRouter(
 )
 
 
-def check_profile_ownership(db: Session, current_user: User, profile_uuid: str):
-    """Ensure the user owns the profile they are trying to manipulate"""
-    repo = ProfileRepository(db)
-    profile = repo.get_by_uuid(profile_uuid)
-    if not profile or profile.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403, message="Not authorized to access this profile's languages"
-        )
-    return profile
-
-
 @router.post("/", response_model=LanguageResponse, status_code=status.HTTP_201_CREATED)
 def create_language(
-    profile_uuid: str,
     language_data: LanguageCreate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Create a new language for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = LanguageService(db)
     try:
-        language = service.create_language(profile_uuid, language_data)
+        language = service.create_language(profile.id, language_data)
 
         # Trigger async indexing
         # trigger_section_item_indexing(
@@ -55,26 +42,22 @@ def create_language(
 
 @router.get("/", response_model=List[LanguageResponse])
 def get_profile_languages(
-    profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    profile: OwnedProfile = Depends(get_owned_profile_read),
+    db: Session = Depends(get_read_db),
 ):
     """Get all languages for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = LanguageService(db)
-    return service.get_languages_by_profile(profile_uuid)
+    return service.get_languages_by_profile(profile.id)
 
 
 @router.put("/{language_uuid}", response_model=LanguageResponse)
 def update_language(
-    profile_uuid: str,
     language_uuid: str,
     language_data: LanguageUpdate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Update language information by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = LanguageService(db)
     language = service.update_language_by_uuid(language_uuid, language_data)
     if not language:
@@ -93,13 +76,20 @@ def update_language(
 
 @router.delete("/{language_uuid}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_language(
-    profile_uuid: str,
     language_uuid: str,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Delete a language by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = LanguageService(db)
     if not service.delete_language_by_uuid(language_uuid):
         raise HTTPException(status_code=404, message="Language not found")
+
+
+add_batch_routes(router, SectionBatch(
+    model=Language,
+    create_schema=LanguageCreate,
+    update_schema=LanguageUpdate,
+    response_schema=LanguageResponse,
+    unique_field="language",
+))
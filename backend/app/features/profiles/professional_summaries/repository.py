@@ -29,8 +29,7 @@ class ProfessionalSummaryRepository:
             is_default=is_default
         )
         self.db.add(db_summary)
-        self.db.commit()
-        self.db.refresh(db_summary)
+        self.db.flush()
         return db_summary
 
     def update(self, db_summary: ProfessionalSummary, data: ProfessionalSummaryUpdate) -> ProfessionalSummary:
@@ -38,12 +37,12 @@ class ProfessionalSummaryRepository:
         for key, value in update_data.items():
             setattr(db_summary, key, value)
         
-        self.db.commit()
+        self.db.flush()
         return db_summary
 
     def delete(self, db_summary: ProfessionalSummary) -> bool:
         self.db.delete(db_summary)
-        self.db.commit()
+        self.db.flush()
         return True
 
     def set_as_default(self, db_summary: ProfessionalSummary) -> ProfessionalSummary:
@@ -56,6 +55,5 @@ class ProfessionalSummaryRepository:
         
         # Set this one as default
         db_summary.is_default = True
-        self.db.commit()
-        self.db.refresh(db_summary)
+        self.db.flush()
         return db_summary
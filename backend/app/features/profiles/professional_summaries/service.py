@@ -1,28 +1,18 @@
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from features.profiles.repository import ProfileRepository
 from features.profiles.professional_summaries.repository import ProfessionalSummaryRepository
 from features.profiles.professional_summaries.schemas import ProfessionalSummaryCreate, ProfessionalSummaryUpdate, ProfessionalSummaryResponse
 
 class ProfessionalSummaryService:
     def __init__(self, db: Session):
         self.repository = ProfessionalSummaryRepository(db)
-        self.profile_repository = ProfileRepository(db)
 
-    def get_all_by_profile_uuid(self, profile_uuid: str) -> List[ProfessionalSummaryResponse]:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            raise ValueError("Profile not found")
-
-        summaries = self.repository.get_all_by_profile_id(profile.id)
+    def get_all_by_profile_id(self, profile_id: int) -> List[ProfessionalSummaryResponse]:
+        summaries = self.repository.get_all_by_profile_id(profile_id)
         return [ProfessionalSummaryResponse.model_validate(summary) for summary in summaries]
 
-    def create(self, profile_uuid: str, data: ProfessionalSummaryCreate) -> ProfessionalSummaryResponse:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            raise ValueError("Profile not found")
-
-        summary = self.repository.create(profile.id, data)
+    def create(self, profile_id: int, data: ProfessionalSummaryCreate) -> ProfessionalSummaryResponse:
+        summary = self.repository.create(profile_id, data)
         return ProfessionalSummaryResponse.model_validate(summary)
 
     def update(self, summary_uuid: str, data: ProfessionalSummaryUpdate) -> Optional[ProfessionalSummaryResponse]:
@@ -26,8 +26,7 @@ class ProfileLinkRepository:
             is_visible=link_data.is_visible
         )
         self.db.add(db_link)
-        self.db.commit()
-        self.db.refresh(db_link)
+        self.db.flush()
         return db_link
     
     def get_by_uuid(self, link_uuid: str) -> Optional[ProfileLink]:
@@ -64,12 +63,11 @@ class ProfileLinkRepository:
         for field, value in update_data.items():
             setattr(db_link, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_link)
+        self.db.flush()
         return db_link
     
     def delete(self, db_link: ProfileLink) -> bool:
         """Delete a user link"""
         self.db.delete(db_link)
-        self.db.commit()
+        self.db.flush()
         return True
@@ -17,8 +17,7 @@ class ProjectRepository:
         
         project = Project(**data_dict)
         self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        self.db.flush()
         return project
     
     def get_by_uuid(self, project_uuid: str) -> Optional[Project]:
@@ -39,14 +38,13 @@ class ProjectRepository:
         if project:
             for field, value in project_data.model_dump(exclude_unset=True).items():
                 setattr(project, field, value)
-            self.db.commit()
-            self.db.refresh(project)
+            self.db.flush()
         return project
     
     def delete_by_uuid(self, project_uuid: str) -> bool:
         project = self.get_by_uuid(project_uuid)
         if project:
             self.db.delete(project)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
@@ -3,39 +3,26 @@ from core.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import List
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
-from features.users.models import User
+from db.session import get_db, get_read_db
 from .service import ProjectService
 from .schemas import ProjectCreate, ProjectUpdate, ProjectResponse
-from features.profiles.repository import ProfileRepository
+from .models import Project
+from features.profiles.dependencies import OwnedProfile, get_owned_profile, get_owned_profile_read
+from features.profiles.batch import SectionBatch, add_batch_routes
 
 router = APIRouter(prefix="/api/v1/profiles/{profile_uuid}/projects", tags=["projects"])
 
 
-def check_profile_ownership(db: Session, current_user: User, profile_uuid: str):
-    """Ensure the user owns the profile they are trying to manipulate"""
-    repo = ProfileRepository(db)
-    profile = repo.get_by_uuid(profile_uuid)
-    if not profile or profile.user_id != current_user.id:
-        raise HTTPException(
-            status_code=403, message="Not authorized to access this profile's projects"
-        )
-    return profile
-
-
 @router.post("/", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 def create_project(
-    profile_uuid: str,
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Create a new project for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = ProjectService(db)
     try:
-        project = service.create_project(profile_uuid, project_data)
+        project = service.create_project(profile.id, project_data)
 
         # Trigger async indexing
         # trigger_section_item_indexing(
@@ -52,26 +39,22 @@ def create_project(
 
 @router.get("/", response_model=List[ProjectResponse])
 def get_profile_projects(
-    profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    profile: OwnedProfile = Depends(get_owned_profile_read),
+    db: Session = Depends(get_read_db),
 ):
     """Get all projects for the specified profile"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = ProjectService(db)
-    return service.get_projects_by_profile(profile_uuid)
+    return service.get_projects_by_profile(profile.id)
 
 
 @router.put("/{project_uuid}", response_model=ProjectResponse)
 def update_project(
-    profile_uuid: str,
     project_uuid: str,
     project_data: ProjectUpdate,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Update project information by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = ProjectService(db)
     project = service.update_project_by_uuid(project_uuid, project_data)
     if not project:
@@ -90,13 +73,19 @@ def update_project(
 
 @router.delete("/{project_uuid}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
-    profile_uuid: str,
     project_uuid: str,
-    current_user: User = Depends(get_current_user),
+    profile: OwnedProfile = Depends(get_owned_profile),
     db: Session = Depends(get_db),
 ):
     """Delete a project by UUID"""
-    check_profile_ownership(db, current_user, profile_uuid)
     service = ProjectService(db)
     if not service.delete_project_by_uuid(project_uuid):
         raise HTTPException(status_code=404, message="Project not found")
+
+
+add_batch_routes(router, SectionBatch(
+    model=Project,
+    create_schema=ProjectCreate,
+    update_schema=ProjectUpdate,
+    response_schema=ProjectResponse,
+))
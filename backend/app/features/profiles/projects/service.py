@@ -2,30 +2,21 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 from .repository import ProjectRepository
 from .schemas import ProjectCreate, ProjectUpdate, ProjectResponse
-from features.profiles.repository import ProfileRepository
 
 class ProjectService:
     def __init__(self, db: Session):
         self.repository = ProjectRepository(db)
-        self.profile_repository = ProfileRepository(db)
     
-    def create_project(self, profile_uuid: str, project_data: ProjectCreate) -> ProjectResponse:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            raise ValueError("Profile not found")
-        
-        project = self.repository.create_with_profile_id(profile.id, project_data)
+    def create_project(self, profile_id: int, project_data: ProjectCreate) -> ProjectResponse:
+        project = self.repository.create_with_profile_id(profile_id, project_data)
         return ProjectResponse.model_validate(project)
     
     def get_project_by_uuid(self, project_uuid: str) -> Optional[ProjectResponse]:
         project = self.repository.get_by_uuid(project_uuid)
         return ProjectResponse.model_validate(project) if project else None
     
-    def get_projects_by_profile(self, profile_uuid: str, skip: int = 0, limit: int = 100) -> List[ProjectResponse]:
-        profile = self.profile_repository.get_by_uuid(profile_uuid)
-        if not profile:
-            return []
-        projects = self.repository.get_by_profile_id(profile.id, skip, limit)
+    def get_projects_by_profile(self, profile_id: int, skip: int = 0, limit: int = 100) -> List[ProjectResponse]:
+        projects = self.repository.get_by_profile_id(profile_id, skip, limit)
         return [ProjectResponse.model_validate(p) for p in projects]
     
     def update_project_by_uuid(self, project_uuid: str, project_data: ProjectUpdate) -> Optional[ProjectResponse]:
@@ -4,11 +4,28 @@ Profile Repository
 Handles all database operations for user profiles.
 """
 
-from typing import Optional
-from sqlalchemy.orm import Session
+from typing import Optional, Tuple
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 from .models import Profile
 from .schemas import ProfileCreate, ProfileUpdate
 
+def _full_profile_options() -> tuple:
+    """Loader options for every section (built on use: they configure the mappers)"""
+    return (
+        selectinload(Profile.professional_summaries),
+        selectinload(Profile.work_experiences),
+        selectinload(Profile.education),
+        selectinload(Profile.skills),
+        selectinload(Profile.projects),
+        selectinload(Profile.certificates),
+        selectinload(Profile.languages),
+        selectinload(Profile.profile_links),
+        selectinload(Profile.custom_sections),
+    )
+
 
 class ProfileRepository:
     """Repository for profile database operations"""
@@ -34,6 +51,24 @@ class ProfileRepository:
         """Get profile by UUID"""
         return self.db.query(Profile).filter(Profile.uuid == profile_uuid).first()
     
+    def get_owner_by_uuid(self, profile_uuid: UUID) -> Optional[Tuple[int, int]]:
+        """(profile id, owner user id) of a profile, without loading the row"""
+        row = (
+            self.db.query(Profile.id, Profile.user_id)
+            .filter(Profile.uuid == profile_uuid)
+            .first()
+        )
+        return (row.id, row.user_id) if row else None
+
+    def get_full_by_uuid(self, profile_uuid: str) -> Optional[Profile]:
+        """Get profile by UUID with every section loaded (one query per section)"""
+        return (
+            self.db.query(Profile)
+            .options(*_full_profile_options())
+            .filter(Profile.uuid == profile_uuid)
+            .first()
+        )
+    
     def get_by_user_id(self, user_id: int) -> Optional[Profile]:
         """Get profile by user ID (users should have only one profile)"""
         return self.db.query(Profile).filter(Profile.user_id == user_id).first()
@@ -54,3 +89,52 @@ class ProfileRepository:
         self.db.delete(db_profile)
         self.db.commit()
         return True
+
+
+class AsyncProfileRepository:
+    """Async profile database operations for ``async def`` endpoints (flushes, never commits)"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, user_id: int, profile_data: ProfileCreate) -> Profile:
+        """Create a new profile"""
+        db_profile = Profile(user_id=user_id, **profile_data.model_dump())
+        self.db.add(db_profile)
+        await self.db.flush()
+        return db_profile
+
+    async def get_by_uuid(self, profile_uuid: str) -> Optional[Profile]:
+        """Get profile by UUID"""
+        try:
+            uuid_obj = UUID(str(profile_uuid))
+        except ValueError:
+            return None
+        return await self.db.scalar(select(Profile).where(Profile.uuid == uuid_obj))
+
+    async def get_full_by_uuid(self, profile_uuid: str) -> Optional[Profile]:
+        """Get profile by UUID with every section loaded (one query per section)"""
+        try:
+            uuid_obj = UUID(str(profile_uuid))
+        except ValueError:
+            return None
+        return await self.db.scalar(
+            select(Profile).options(*_full_profile_options()).where(Profile.uuid == uuid_obj)
+        )
+
+    async def get_by_user_id(self, user_id: int) -> Optional[Profile]:
+        """Get profile by user ID (users should have only one profile)"""
+        return await self.db.scalar(select(Profile).where(Profile.user_id == user_id).limit(1))
+
+    async def update(self, db_profile: Profile, profile_update: ProfileUpdate) -> Profile:
+        """Update an existing profile"""
+        for field, value in profile_update.model_dump(exclude_unset=True).items():
+            setattr(db_profile, field, value)
+        await self.db.flush()
+        return db_profile
+
+    async def delete(self, db_profile: Profile) -> bool:
+        """Delete a profile"""
+        await self.db.delete(db_profile)
+        await self.db.flush()
+        return True
@@ -4,18 +4,21 @@ Profile Router
 FastAPI routes for user profile management.
 """
 import logging
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 from core.exceptions import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from db.session import get_db
-from features.auth.dependencies import get_current_user
+from db.session import get_async_db, get_async_read_db
+from features.auth.dependencies import get_current_user_async, get_current_user_async_read
 from features.users.models import User
-from features.profiles.repository import ProfileRepository
-from features.profiles.service import ProfileService
+from features.profiles.repository import AsyncProfileRepository
+from features.profiles.dependencies import invalidate_profile_ownership
+from features.profiles.service import AsyncProfileService
 from features.profiles.schemas import ProfileCreate, ProfileUpdate, ProfileResponse
+from features.profiles.full_profile import ProfileFullResponse
 from features.vector_embeddings.tasks import index_profile_task
 
 logger = logging.getLogger(__name__)
@@ -23,25 +26,31 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1/profiles", tags=["profiles"])
 
 
-def get_profile_service(db: Session = Depends(get_db)) -> ProfileService:
+def get_profile_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProfileService:
     """Dependency to get profile service"""
-    repository = ProfileRepository(db)
-    return ProfileService(repository)
+    repository = AsyncProfileRepository(db)
+    return AsyncProfileService(repository)
+
+
+def get_profile_read_service(db: AsyncSession = Depends(get_async_read_db)) -> AsyncProfileService:
+    """Dependency to get profile service for read-only endpoints (may read from the replica)"""
+    repository = AsyncProfileRepository(db)
+    return AsyncProfileService(repository)
 
 
 @router.post("/", response_model=ProfileResponse, status_code=201)
 async def create_profile(
     user_uuid: str,
     profile_data: ProfileCreate,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async),
+    service: AsyncProfileService = Depends(get_profile_service)
 ):
     """Create a new profile for the specified user"""
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot create profile for another user")
     
     try:
-        return service.create_profile(current_user.id, profile_data)
+        return await service.create_profile(current_user.id, profile_data)
     except ValueError as e:
         raise HTTPException(status_code=400, message=str(e))
 
@@ -49,14 +58,14 @@ async def create_profile(
 @router.get("/", response_model=list[ProfileResponse])
 async def get_user_profiles(
     user_uuid: str,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async_read),
+    service: AsyncProfileService = Depends(get_profile_read_service)
 ):
     """Get all profiles for the specified user"""
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot access another user's profiles")
     
-    profile = service.get_user_profile(current_user.id)
+    profile = await service.get_user_profile(current_user.id)
     return [profile] if profile else []
 
 
@@ -64,17 +73,38 @@ async def get_user_profiles(
 async def get_profile(
     user_uuid: str,
     profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async_read),
+    service: AsyncProfileService = Depends(get_profile_read_service)
 ):
     """Get a specific profile for the user"""
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot access another user's profile")
     
-    if not service.check_profile_ownership(profile_uuid, current_user.id):
+    if not await service.check_profile_ownership(profile_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Cannot access another user's profile")
         
-    profile = service.get_profile_by_uuid(profile_uuid)
+    profile = await service.get_profile_by_uuid(profile_uuid)
+    if not profile:
+        raise HTTPException(status_code=404, message="Profile not found")
+    return profile
+
+
+@router.get("/{profile_uuid}/full", response_model=ProfileFullResponse)
+async def get_full_profile(
+    profile_uuid: str,
+    current_user: User = Depends(get_current_user_async_read),
+    service: AsyncProfileService = Depends(get_profile_read_service)
+):
+    """
+    Get a profile with all of its sections (summaries, experience, education,
+    skills, projects, certificates, languages, links and custom sections)
+
+    Replaces one request per section router when loading the profile editor.
+    """
+    try:
+        profile = await service.get_full_profile(profile_uuid, current_user.id)
+    except PermissionError as e:
+        raise HTTPException(status_code=403, message=str(e))
     if not profile:
         raise HTTPException(status_code=404, message="Profile not found")
     return profile
@@ -85,18 +115,18 @@ async def update_profile(
     user_uuid: str,
     profile_uuid: str,
     profile_data: ProfileUpdate,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async),
+    service: AsyncProfileService = Depends(get_profile_service)
 ):
     """Update a specific profile"""
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot update another user's profile")
         
-    if not service.check_profile_ownership(profile_uuid, current_user.id):
+    if not await service.check_profile_ownership(profile_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Cannot update another user's profile")
     
     try:
-        updated = service.update_profile(profile_uuid, profile_data)
+        updated = await service.update_profile(profile_uuid, profile_data)
         if not updated:
             raise HTTPException(status_code=404, message="Profile not found")
         return updated
@@ -108,19 +138,24 @@ async def update_profile(
 async def delete_profile(
     user_uuid: str,
     profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async),
+    service: AsyncProfileService = Depends(get_profile_service),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a specific profile"""
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot delete another user's profile")
         
-    if not service.check_profile_ownership(profile_uuid, current_user.id):
+    if not await service.check_profile_ownership(profile_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Cannot delete another user's profile")
     
-    success = service.delete_profile(profile_uuid)
+    success = await service.delete_profile(profile_uuid)
     if not success:
         raise HTTPException(status_code=404, message="Profile not found")
+    # Commit first: evicting earlier would let a concurrent request re-cache
+    # the ownership from the not yet deleted row
+    await db.commit()
+    invalidate_profile_ownership(UUID(profile_uuid), current_user.id)
     
     return {"message": "Profile deleted successfully"}
 
@@ -137,8 +172,8 @@ class IndexingResponse(BaseModel):
 async def index_profile(
     user_uuid: str,
     profile_uuid: str,
-    current_user: User = Depends(get_current_user),
-    service: ProfileService = Depends(get_profile_service)
+    current_user: User = Depends(get_current_user_async),
+    service: AsyncProfileService = Depends(get_profile_service)
 ):
     """
     Trigger embedding generation and indexing for a profile.
@@ -153,11 +188,11 @@ async def index_profile(
     if str(current_user.uuid) != user_uuid:
         raise HTTPException(status_code=403, message="Cannot index another user's profile")
     
-    if not service.check_profile_ownership(profile_uuid, current_user.id):
+    if not await service.check_profile_ownership(profile_uuid, current_user.id):
         raise HTTPException(status_code=403, message="Cannot index another user's profile")
     
     # Verify profile exists
-    profile = service.get_profile_by_uuid(profile_uuid)
+    profile = await service.get_profile_by_uuid(profile_uuid)
     if not profile:
         raise HTTPException(status_code=404, message="Profile not found")
     
@@ -5,8 +5,9 @@ Business logic for user profile management.
 """
 
 from typing import Optional
-from features.profiles.repository import ProfileRepository
+from features.profiles.repository import AsyncProfileRepository, ProfileRepository
 from features.profiles.schemas import ProfileCreate, ProfileUpdate, ProfileResponse
+from features.profiles.full_profile import ProfileFullResponse, build_full_profile_response
 
 
 class ProfileService:
@@ -32,6 +33,15 @@ class ProfileService:
             return None
         return self._convert_to_response(db_profile)
     
+    def get_full_profile(self, profile_uuid: str, user_id: int) -> Optional[ProfileFullResponse]:
+        """Get a profile with all of its sections in a constant number of queries"""
+        db_profile = self.repository.get_full_by_uuid(profile_uuid)
+        if not db_profile:
+            return None
+        if db_profile.user_id != user_id:
+            raise PermissionError("Cannot access another user's profile")
+        return build_full_profile_response(db_profile)
+    
     def get_user_profile(self, user_id: int) -> Optional[ProfileResponse]:
         """Get profile for a user"""
         db_profile = self.repository.get_by_user_id(user_id)
@@ -72,3 +82,65 @@ class ProfileService:
             created_at=db_profile.created_at,
             updated_at=db_profile.updated_at
         )
+
+
+class AsyncProfileService:
+    """Profile business logic for ``async def`` endpoints"""
+
+    def __init__(self, repository: AsyncProfileRepository):
+        self.repository = repository
+
+    async def create_profile(self, user_id: int, profile_data: ProfileCreate) -> ProfileResponse:
+        """Create a new profile"""
+        if await self.repository.get_by_user_id(user_id):
+            raise ValueError("User already has a profile")
+
+        db_profile = await self.repository.create(user_id, profile_data)
+        return self._convert_to_response(db_profile)
+
+    async def get_profile_by_uuid(self, profile_uuid: str) -> Optional[ProfileResponse]:
+        """Get profile by UUID"""
+        db_profile = await self.repository.get_by_uuid(profile_uuid)
+        if not db_profile:
+            return None
+        return self._convert_to_response(db_profile)
+
+    async def get_full_profile(self, profile_uuid: str, user_id: int) -> Optional[ProfileFullResponse]:
+        """Get a profile with all of its sections in a constant number of queries"""
+        db_profile = await self.repository.get_full_by_uuid(profile_uuid)
+        if not db_profile:
+            return None
+        if db_profile.user_id != user_id:
+            raise PermissionError("Cannot access another user's profile")
+        return build_full_profile_response(db_profile)
+
+    async def get_user_profile(self, user_id: int) -> Optional[ProfileResponse]:
+        """Get profile for a user"""
+        db_profile = await self.repository.get_by_user_id(user_id)
+        if not db_profile:
+            return None
+        return self._convert_to_response(db_profile)
+
+    async def update_profile(self, profile_uuid: str, profile_update: ProfileUpdate) -> Optional[ProfileResponse]:
+        """Update a profile"""
+        db_profile = await self.repository.get_by_uuid(profile_uuid)
+        if not db_profile:
+            return None
+
+        updated_profile = await self.repository.update(db_profile, profile_update)
+        return self._convert_to_response(updated_profile)
+
+    async def delete_profile(self, profile_uuid: str) -> bool:
+        """Delete a profile"""
+        db_profile = await self.repository.get_by_uuid(profile_uuid)
+        if not db_profile:
+            return False
+
+        return await self.repository.delete(db_profile)
+
+    async def check_profile_ownership(self, profile_uuid: str, user_id: int) -> bool:
+        """Check if a profile belongs to a specific user"""
+        db_profile = await self.repository.get_by_uuid(profile_uuid)
+        return db_profile is not None and db_profile.user_id == user_id
+
+    _convert_to_response = ProfileService._convert_to_response
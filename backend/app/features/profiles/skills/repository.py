@@ -13,8 +13,7 @@ class SkillRepository:
         
         skill = Skill(**data_dict)
         self.db.add(skill)
-        self.db.commit()
-        self.db.refresh(skill)
+        self.db.flush()
         return skill
     
     def get_by_uuid(self, skill_uuid: str) -> Optional[Skill]:
@@ -42,14 +41,13 @@ class SkillRepository:
         if skill:
             for field, value in skill_data.model_dump(exclude_unset=True).items():
                 setattr(skill, field, value)
-            self.db.commit()
-            self.db.refresh(skill)
+            self.db.flush()
         return skill
     
     def delete_by_uuid(self, skill_uuid: str) -> bool:
         skill = self.get_by_uuid(skill_uuid)
         if skill:
             self.db.delete(skill)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
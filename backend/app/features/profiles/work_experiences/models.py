@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -24,6 +24,11 @@ class WorkExperience(BaseEntity):
     profile = relationship("Profile", back_populates="work_experiences")
     # embeddings relationship is inherited from BaseEntity via Entity table
     
+    # Keyset pagination of the profile's list endpoint
+    __table_args__ = (
+        Index('ix_work_experiences_profile_start_date', 'profile_id', 'start_date', 'id'),
+    )
+    
     __mapper_args__ = {
         'polymorphic_identity': 'work_experience',
     }
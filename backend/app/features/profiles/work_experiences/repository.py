@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
+from core.pagination import DEFAULT_PAGE_SIZE, Page, keyset_page
 from .models import WorkExperience
 from .schemas import WorkExperienceCreate, WorkExperienceUpdate
 
@@ -14,15 +15,13 @@ class WorkExperienceRepository:
         
         work_exp = WorkExperience(**data_dict)
         self.db.add(work_exp)
-        self.db.commit()
-        self.db.refresh(work_exp)
+        self.db.flush()
         return work_exp
     
     def create(self, work_exp_data: WorkExperienceCreate) -> WorkExperience:
         work_exp = WorkExperience(**work_exp_data.model_dump())
         self.db.add(work_exp)
-        self.db.commit()
-        self.db.refresh(work_exp)
+        self.db.flush()
         return work_exp
     
     def get_by_uuid(self, work_exp_uuid: str) -> Optional[WorkExperience]:
@@ -37,6 +36,13 @@ class WorkExperienceRepository:
                 .limit(limit)
                 .all())
     
+    def get_page_by_profile_id(
+        self, profile_id: int, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Page:
+        """One page of the profile's items, newest start_date first (keyset paginated)"""
+        query = self.db.query(WorkExperience).filter(WorkExperience.profile_id == profile_id)
+        return keyset_page(query, WorkExperience.start_date, WorkExperience.id, cursor, limit)
+    
     def get_by_id(self, work_exp_id: int) -> Optional[WorkExperience]:
         return self.db.query(WorkExperience).filter(WorkExperience.id == work_exp_id).first()
     
@@ -56,8 +62,7 @@ class WorkExperienceRepository:
         if work_exp:
             for field, value in work_exp_data.model_dump(exclude_unset=True).items():
                 setattr(work_exp, field, value)
-            self.db.commit()
-            self.db.refresh(work_exp)
+            self.db.flush()
         return work_exp
     
     def update(self, work_exp_id: int, work_exp_data: WorkExperienceUpdate) -> Optional[WorkExperience]:
@@ -65,8 +70,7 @@ class WorkExperienceRepository:
         if work_exp:
             for field, value in work_exp_data.model_dump(exclude_unset=True).items():
                 setattr(work_exp, field, value)
-            self.db.commit()
-            self.db.refresh(work_exp)
+            self.db.flush()
         return work_exp
     
     def delete_by_uuid(self, work_exp_uuid: str) -> bool:
@@ -74,7 +78,7 @@ class WorkExperienceRepository:
         work_exp = self.get_by_uuid(work_exp_uuid)
         if work_exp:
             self.db.delete(work_exp)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
     
@@ -86,8 +90,7 @@ class WorkExperienceRepository:
         
         work_exp = WorkExperience(**data_dict)
         self.db.add(work_exp)
-        self.db.commit()
-        self.db.refresh(work_exp)
+        self.db.flush()
         return work_exp
     
     def get_by_user_uuid(self, user_uuid: str, skip: int = 0, limit: int = 100) -> List[WorkExperience]:
@@ -104,14 +107,13 @@ class WorkExperienceRepository:
         if work_exp:
             for field, value in work_exp_data.model_dump(exclude_unset=True).items():
                 setattr(work_exp, field, value)
-            self.db.commit()
-            self.db.refresh(work_exp)
+            self.db.flush()
         return work_exp
     
     def delete_by_uuid(self, work_exp_uuid: str) -> bool:
         work_exp = self.get_by_uuid(work_exp_uuid)
         if work_exp:
             self.db.delete(work_exp)
-            self.db.commit()
+            self.db.flush()
             return True
         return False
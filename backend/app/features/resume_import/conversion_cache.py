@@ -0,0 +1,103 @@
+"""
+Cache of PDF → text conversions keyed by file content.
+
+Retries, re-uploads and the same CV imported into several profiles all carry
+identical bytes, so the extracted text is stored in Redis under the SHA-256 of
+the PDF plus a fingerprint of everything that shapes the output (Docling
+version, pipeline options, fast-path settings). Values are zlib-compressed
+and expire after ``CONVERSION_CACHE_TTL_SECONDS``; configure the Redis
+instance with an LRU ``maxmemory-policy`` to bound its size.
+"""
+
+import hashlib
+import json
+import logging
+import zlib
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache()
+def conversion_fingerprint() -> str:
+    """Short hash of the settings that influence the extracted text"""
+    from core.config import get_settings
+    from core.docling_converter import build_pipeline_options
+
+    settings = get_settings()
+    try:
+        docling_version = version("docling")
+    except PackageNotFoundError:
+        docling_version = "unknown"
+    options = {
+        "docling": docling_version,
+        "pipeline": build_pipeline_options().model_dump(mode="json"),
+        "fast_path": [
+            settings.PDF_FAST_PATH_ENABLED,
+            settings.PDF_FAST_PATH_MIN_QUALITY,
+            settings.PDF_FAST_PATH_MIN_CHARS_PER_PAGE,
+        ],
+    }
+    encoded = json.dumps(options, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+class ConversionCache:
+    """Compressed, TTL-bounded conversion results in Redis"""
+
+    def __init__(self, client: Any, ttl_seconds: int, prefix: str = "conversion:md:"):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def key(self, content_hash: str, fingerprint: Optional[str] = None) -> str:
+        return f"{self.prefix}{content_hash}:{fingerprint or conversion_fingerprint()}"
+
+    def get(self, content_hash: str) -> Optional[str]:
+        """Cached text for this PDF, or None (cache errors count as misses)"""
+        try:
+            value = self.client.get(self.key(content_hash))
+            return zlib.decompress(value).decode("utf-8") if value is not None else None
+        except Exception as e:
+            logger.warning(f"Conversion cache read failed: {e}")
+            return None
+
+    def set(self, content_hash: str, text: str) -> None:
+        try:
+            self.client.setex(
+                self.key(content_hash),
+                self.ttl_seconds,
+                zlib.compress(text.encode("utf-8"), 6),
+            )
+        except Exception as e:
+            logger.warning(f"Conversion cache write failed: {e}")
+
+
+@lru_cache()
+def get_conversion_cache() -> Optional[ConversionCache]:
+    """Process-wide cache, or None when disabled"""
+    from core.config import get_settings
+
+    settings = get_settings()
+    if not settings.CONVERSION_CACHE_ENABLED:
+        return None
+    client = redis.Redis.from_url(
+        settings.CONVERSION_CACHE_URL, socket_timeout=2, socket_connect_timeout=2
+    )
+    return ConversionCache(client, settings.CONVERSION_CACHE_TTL_SECONDS)
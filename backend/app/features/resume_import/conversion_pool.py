@@ -0,0 +1,228 @@
+"""
+Process pool for Docling conversions.
+
+Docling's layout/table models are CPU-heavy and hold the GIL, and a
+pathological PDF can make ``convert`` hang forever. Running conversions in a
+small pool of spawned processes gives real multi-core parallelism and lets us
+enforce a hard timeout: a conversion that overruns raises ``ConversionTimeout``
+and its worker process is killed. The pool it belonged to stops taking work
+(a fresh one replaces it) but its other conversions are allowed to finish
+before the kill, which would otherwise break them too.
+
+Memory is bounded twice: every worker runs under an address-space limit
+(``max_memory_mb``, ``RLIMIT_AS``) so a runaway conversion fails with
+``MemoryError`` instead of growing without bound, and workers are recycled
+after ``max_tasks_per_child`` conversions, or as soon as one reports a peak
+RSS above ``max_rss_mb``, so model memory growth cannot accumulate.
+
+Celery note: prefork worker children are daemonic and cannot start processes
+of their own, so the worker consuming the ``resume_parsing`` queue should run
+with ``--pool=threads`` (or ``solo``); the heavy lifting happens here anyway.
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Optional, Set, Tuple, Union
+
+from core.docling_worker import convert_to_markdown, load_converter
+from core.process_workers import init_worker, peak_rss_mb, run_job
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionTimeout(Exception):
+    """A conversion exceeded its time budget and its worker was killed"""
+
+
+@dataclass(eq=False)
+class _Workers:
+    """One generation of worker processes and the conversions running on it"""
+
+    executor: ProcessPoolExecutor
+    started: "multiprocessing.Queue"
+    pids: Dict[int, int] = field(default_factory=dict)
+    running: Dict[Future, int] = field(default_factory=dict)
+    # Timed-out conversions whose process is killed once the others are done
+    abandoned: Set[Future] = field(default_factory=set)
+    retired: bool = False
+    finished: bool = False
+
+    def pid_of(self, job_id: int) -> Optional[int]:
+        while True:
+            try:
+                started_id, pid = self.started.get_nowait()
+            except queue.Empty:
+                return self.pids.get(job_id)
+            self.pids[started_id] = pid
+
+
+class ConversionPool:
+    """Bounded, self-healing process pool for PDF → Markdown conversions"""
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        timeout: float = 120.0,
+        max_tasks_per_child: int = 20,
+        max_rss_mb: int = 3072,
+        max_memory_mb: Optional[int] = None,
+        worker_fn: Callable[[str], Tuple[str, int]] = convert_to_markdown,
+        initializer: Optional[Callable[[], None]] = load_converter,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_rss_mb = max_rss_mb
+        self.max_memory_mb = max_memory_mb
+        self.worker_fn = worker_fn
+        self.initializer = initializer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._workers: Optional[_Workers] = None
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self.restarts = 0
+
+    def _get_workers(self) -> _Workers:
+        with self._lock:
+            if self._workers is None:
+                # Fork would copy the parent's threads/locks (and torch state)
+                context = multiprocessing.get_context("spawn")
+                started = context.Queue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=init_worker,
+                    initargs=(started, self.max_memory_mb, self.initializer),
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+                self._workers = _Workers(self._executor, started)
+            return self._workers
+
+    def _submit(self, workers: _Workers, pdf_path: str) -> Tuple[int, Future]:
+        job_id = next(self._job_ids)
+        future = workers.executor.submit(run_job, self.worker_fn, job_id, pdf_path)
+        with self._lock:
+            workers.running[future] = job_id
+        future.add_done_callback(lambda done: self._job_done(workers, done))
+        return job_id, future
+
+    def _job_done(self, workers: _Workers, future: Future) -> None:
+        with self._lock:
+            workers.running.pop(future, None)
+        self._finish_if_idle(workers)
+
+    def _retire(self, workers: _Workers, reason: str, abandon: Optional[Future] = None) -> None:
+        """Stop routing work to ``workers``; kill the abandoned conversion once the others finish"""
+        with self._lock:
+            if abandon is not None:
+                workers.abandoned.add(abandon)
+            if not workers.retired:
+                workers.retired = True
+                self.restarts += 1
+                if self._workers is workers:
+                    self._workers = None
+                    self._executor = None
+                logger.warning(f"Recycling Docling process pool: {reason}")
+        # In-flight conversions finish; idle workers exit right away
+        workers.executor.shutdown(wait=False)
+        self._finish_if_idle(workers)
+
+    def _finish_if_idle(self, workers: _Workers) -> None:
+        with self._lock:
+            if not workers.retired or workers.finished:
+                return
+            if any(future not in workers.abandoned for future in workers.running):
+                return
+            workers.finished = True
+            stuck = [workers.running[future] for future in workers.abandoned if future in workers.running]
+        for job_id in stuck:
+            pid = workers.pid_of(job_id)
+            if pid is None:
+                continue
+            logger.warning(f"Killing Docling worker {pid} (conversion timed out)")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    async def convert(self, pdf_path: Union[str, Path]) -> str:
+        """
+        Convert a PDF to Markdown in a worker process
+
+        Raises:
+            ConversionTimeout: The conversion overran ``timeout``
+            MemoryError: The worker hit ``max_memory_mb``
+        """
+        for attempt in range(2):
+            workers = self._get_workers()
+            job_id, future = self._submit(workers, str(pdf_path))
+            try:
+                markdown, rss_mb = await asyncio.wait_for(
+                    asyncio.wrap_future(future), timeout=self.timeout
+                )
+            except asyncio.TimeoutError:
+                if workers.pid_of(job_id) is None:
+                    # Still queued behind other conversions: nothing to kill
+                    future.cancel()
+                else:
+                    self._retire(workers, f"conversion exceeded {self.timeout:.0f}s", abandon=future)
+                raise ConversionTimeout(f"Conversion of {Path(pdf_path).name} timed out")
+            except BrokenProcessPool:
+                # A worker died (OOM kill, crash) or the pool was recycled under us
+                self._retire(workers, "worker process died")
+                if attempt:
+                    raise
+                continue
+            except MemoryError:
+                self._retire(workers, f"worker exceeded the {self.max_memory_mb}MB memory limit")
+                raise
+
+            if rss_mb > self.max_rss_mb:
+                self._retire(workers, f"worker peak RSS {rss_mb}MB > {self.max_rss_mb}MB")
+            return markdown
+        raise BrokenProcessPool("Docling process pool unavailable")
+
+    def warm_up(self) -> None:
+        """Start the worker processes (loading their models) ahead of the first upload"""
+        workers = self._get_workers()
+        for _ in range(self.max_workers):
+            workers.executor.submit(peak_rss_mb)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            workers, self._workers, self._executor = self._workers, None, None
+        if workers is not None:
+            workers.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[ConversionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_conversion_pool() -> ConversionPool:
+    """Get the process-wide conversion pool (configured from settings)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from core.config import get_settings
+
+                settings = get_settings()
+                _pool = ConversionPool(
+                    max_workers=settings.DOCLING_POOL_WORKERS,
+                    timeout=settings.DOCLING_TIMEOUT_SECONDS,
+                    max_tasks_per_child=settings.DOCLING_MAX_TASKS_PER_CHILD,
+                    max_rss_mb=settings.DOCLING_MAX_RSS_MB,
+                    max_memory_mb=settings.DOCLING_MAX_MEMORY_MB,
+                )
+    return _pool
@@ -1,15 +1,19 @@
 """
 Resume Import Dependencies - FastAPI dependency injection
 """
+import asyncio
+import zipfile
 from fastapi import Depends, UploadFile, File, Form
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from db.session import get_db
+from core.config import get_settings
+from db.session import get_db, get_read_db
 from features.users.models import User
 from features.auth.dependencies import get_current_user
 from .service import ResumeImportService
+from .uploads import StoredUpload, UploadTooLarge, extract_pdfs, store_upload
 
 
 def get_resume_import_service(db: Session = Depends(get_db)) -> ResumeImportService:
@@ -17,14 +21,24 @@ def get_resume_import_service(db: Session = Depends(get_db)) -> ResumeImportServ
     return ResumeImportService(db)
 
 
+def get_resume_import_read_service(db: Session = Depends(get_read_db)) -> ResumeImportService:
+    """Dependency to get ResumeImportService for status lookups (may read from the replica)"""
+    return ResumeImportService(db)
+
+
 async def validate_resume_upload(
+    current_user: User = Depends(get_current_user),
     profile_id: str = Form(...),
     resume: UploadFile = File(...)  # must match FormData field name sent by frontend
 ) -> dict:
     """
     Validate resume upload request
 
+    The user is authenticated before anything is written to disk, so
+    anonymous requests cannot leave files in the upload directory.
+
     Args:
+        current_user: Authenticated user (resolved first)
         profile_id: Profile UUID as string
         resume: Uploaded file
 
@@ -49,10 +63,10 @@ async def validate_resume_upload(
             message="Only PDF files are supported"
         )
 
-    # Validate file size (max 10MB)
-    max_size = 10 * 1024 * 1024  # 10MB
-    file_content = await resume.read()
-    if len(file_content) > max_size:
+    # Stream to disk, enforcing the size limit (max 10MB) as we go
+    try:
+        stored = await store_upload(resume, get_settings().RESUME_UPLOAD_DIR)
+    except UploadTooLarge:
         from core.exceptions import HTTPException
         raise HTTPException(
             status_code=400,
@@ -61,6 +75,91 @@ async def validate_resume_upload(
 
     return {
         "profile_id": profile_uuid,
-        "file_content": file_content,
+        "file_path": stored.path,
+        "content_hash": stored.sha256,
         "filename": resume.filename
-    }
\ No newline at end of file
+    }
+
+
+async def validate_resume_batch_upload(
+    current_user: User = Depends(get_current_user),
+    profile_id: str = Form(...),
+    files: List[UploadFile] = File(...)
+) -> dict:
+    """
+    Validate a batch upload of PDFs and/or ZIP archives of PDFs
+
+    Files that are not PDFs, exceed 10MB or go over the batch limit are
+    reported back as rejected instead of failing the whole batch. Nothing
+    is stored before the user is authenticated.
+
+    Args:
+        current_user: Authenticated user (resolved first)
+        profile_id: Profile UUID as string
+        files: Uploaded PDFs and ZIP archives
+
+    Returns:
+        Dictionary with the stored uploads and the rejected filenames
+    """
+    from core.exceptions import HTTPException
+
+    try:
+        profile_uuid = UUID(profile_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            message="Invalid profile_id format"
+        )
+
+    settings = get_settings()
+    upload_dir = settings.RESUME_UPLOAD_DIR
+    stored: List[StoredUpload] = []
+    rejected: List[str] = []
+    try:
+        for upload in files:
+            filename = upload.filename or ""
+            remaining = settings.RESUME_BATCH_MAX_FILES - len(stored)
+            if filename.lower().endswith(".pdf") and remaining > 0:
+                try:
+                    stored.append(await store_upload(upload, upload_dir))
+                except UploadTooLarge:
+                    rejected.append(filename)
+            elif filename.lower().endswith(".zip") and remaining > 0:
+                try:
+                    archive = await store_upload(
+                        upload,
+                        upload_dir,
+                        max_bytes=settings.RESUME_BATCH_MAX_ZIP_MB * 1024 * 1024,
+                        suffix=".zip"
+                    )
+                except UploadTooLarge:
+                    rejected.append(filename)
+                    continue
+                try:
+                    extracted, skipped = await asyncio.to_thread(
+                        extract_pdfs, archive.path, upload_dir, remaining
+                    )
+                    stored.extend(extracted)
+                    rejected.extend(skipped)
+                except zipfile.BadZipFile:
+                    rejected.append(filename)
+                finally:
+                    archive.path.unlink(missing_ok=True)
+            else:
+                rejected.append(filename)
+    except BaseException:
+        for upload in stored:
+            upload.path.unlink(missing_ok=True)
+        raise
+
+    if not stored:
+        raise HTTPException(
+            status_code=400,
+            message="No valid PDF files in upload (PDFs or ZIP archives of PDFs, max 10MB each)"
+        )
+
+    return {
+        "profile_id": profile_uuid,
+        "uploads": stored,
+        "rejected_files": rejected
+    }
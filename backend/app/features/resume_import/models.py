@@ -3,9 +3,9 @@ Resume Import Models - Track uploaded CVs and extracted data
 """
 import uuid as uuid_lib
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey, Enum
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, JSON, Text, DateTime, ForeignKey, Enum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 
 from shared.models.base import Base
 
@@ -21,14 +21,22 @@ class UploadedResume(Base):
     profile_id = Column(Integer, ForeignKey("profiles.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
+    # Set for CVs uploaded together through the batch endpoint
+    batch_id = Column(UUID(as_uuid=True), nullable=True, index=True)
+
     original_filename = Column(String(255), nullable=False)
-    extracted_data = Column(JSON, nullable=False)  # Full extracted data from PDF
+    # Large payloads: JSONB/TEXT values are compressed out of line by TOAST, and
+    # deferred so list queries never fetch them
+    extracted_data = deferred(
+        Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    )  # Full extracted data from PDF
+    raw_markdown = deferred(Column(Text, nullable=True))  # Text the LLM parsed
 
     import_status = Column(
         String(50),
         default="pending",
         nullable=False,
-    )  # pending, confirmed, rejected
+    )  # processing, pending, failed, confirmed, rejected
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -10,17 +10,19 @@ from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime
 from pathlib import Path
 
-# Docling imports
-from docling.datamodel.base_models import InputFormat
-from docling.document_converter import DocumentConverter, PdfFormatOption
-from docling.datamodel.pipeline_options import PdfPipelineOptions, AcceleratorOptions
-
+from core.config import get_settings
 from features.llm.service import LLMService
+from features.resume_import.conversion_cache import file_sha256, get_conversion_cache
+from features.resume_import.conversion_pool import ConversionTimeout, get_conversion_pool
+from core.docling_converter import get_document_converter
+from features.resume_import.prompt_compaction import PAGE_BREAK, compact_markdown
+from features.resume_import.text_extraction import extract_text_layer
 
 # Import actual profile schemas for valid enum values
 from features.profiles.education.schemas import DegreeType
 from features.profiles.skills.schemas import ProficiencyLevel
 from features.profiles.languages.schemas import ProficiencyLevel as LangProficiency
+from shared.utils.date_normalization import normalize_date_str
 
 logger = logging.getLogger(__name__)
 
@@ -161,66 +163,6 @@ class CustomSectionLenient(BaseModel):
     content: str = Field(..., description="Section content")
 
 
-
-def normalize_date_str(val: Any) -> Optional[str]:
-    if not val:
-        return None
-    if isinstance(val, (date, datetime)):
-        return val.strftime("%Y-%m-%d")
-        
-    val_str = str(val).strip()
-    if not val_str:
-        return None
-        
-    # Standardize common "present" indicators
-    if val_str.lower() in ("present", "current", "ongoing", "now", "active", "en cours", "today"):
-        return None
-        
-    import re
-    
-    # Try exact YYYY-MM-DD
-    match = re.search(r"\b(19\d{2}|20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b", val_str)
-    if match:
-        return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-        
-    # Try Month/Year patterns: MM/YYYY, M/YYYY, MM-YYYY, MM.YYYY
-    match = re.search(r"\b(0?[1-9]|1[0-2])[-/.\s]+(19\d{2}|20\d{2})\b", val_str)
-    if match:
-        month = int(match.group(1))
-        year = match.group(2)
-        return f"{year}-{month:02d}-01"
-        
-    # Try Year/Month patterns: YYYY/MM, YYYY-MM, YYYY.MM
-    match = re.search(r"\b(19\d{2}|20\d{2})[-/.\s]+(0?[1-9]|1[0-2])\b", val_str)
-    if match:
-        year = match.group(1)
-        month = int(match.group(2))
-        return f"{year}-{month:02d}-01"
-        
-    # Try textual month names
-    months_map = {
-        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
-        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
-        "janvier": 1, "fevrier": 2, "février": 2, "mars": 3, "avril": 4,
-        "mai": 5, "juin": 6, "juillet": 7, "aout": 8, "août": 8,
-        "septembre": 9, "octobre": 10, "novembre": 11, "decembre": 12, "décembre": 12
-    }
-    
-    val_lower = val_str.lower()
-    for name, num in months_map.items():
-        if name in val_lower:
-            year_match = re.search(r"\b(19\d{2}|20\d{2})\b", val_str)
-            if year_match:
-                return f"{year_match.group(1)}-{num:02d}-01"
-                
-    # Fallback to year-only if a 4-digit number is found
-    year_match = re.search(r"\b(19\d{2}|20\d{2})\b", val_str)
-    if year_match:
-        return f"{year_match.group(1)}-01-01"
-        
-    return None
-
-
 def clean_url_str(val: Any) -> Optional[str]:
     if not val:
         return None
@@ -340,44 +282,112 @@ class ResumeDataLenient(BaseModel):
 # ============================================================================
 
 
+class ResumeParsingError(Exception):
+    """A CV could not be converted to text or structured by the LLM"""
+
+
 class PDFParserService:
     """Service for extracting and parsing PDF resumes using Docling and LLM"""
 
     def __init__(self):
         self.llm_service = LLMService()
 
-        # Configure Docling for CPU
-        pipeline_options = PdfPipelineOptions()
-        pipeline_options.accelerator_options = AcceleratorOptions(device="cpu")
-        self.converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
-            }
-        )
-        logger.info("PDFParserService initialized with Docling (CPU)")
-
-    async def _extract_text(self, pdf_path: str | Path) -> str:
-        """Extract Markdown text from PDF using Docling"""
+    @property
+    def converter(self):
+        """Process-wide Docling converter (built on first use)"""
+        return get_document_converter()
+
+    async def _extract_text(self, pdf_path: str | Path, content_hash: Optional[str] = None) -> str:
+        """Extract text from PDF, reusing the cached result for identical files"""
+        cache = get_conversion_cache()
+        if cache is None:
+            return await self._convert(pdf_path)
+
+        if content_hash is None:
+            content_hash = await asyncio.to_thread(file_sha256, pdf_path)
+        cached = await asyncio.to_thread(cache.get, content_hash)
+        if cached is not None:
+            logger.info(f"Conversion cache hit for {content_hash[:12]}")
+            return cached
+
+        text = await self._convert(pdf_path)
+        if text:
+            await asyncio.to_thread(cache.set, content_hash, text)
+        return text
+
+    async def _convert(self, pdf_path: str | Path) -> str:
+        """Extract text from PDF: text layer when it is clean, Docling Markdown otherwise"""
+        settings = get_settings()
+        if settings.PDF_FAST_PATH_ENABLED:
+            try:
+                fast = await asyncio.to_thread(
+                    extract_text_layer, pdf_path, settings.PDF_FAST_PATH_MIN_CHARS_PER_PAGE
+                )
+                if fast.is_usable(settings.PDF_FAST_PATH_MIN_QUALITY):
+                    logger.info(
+                        f"Text layer used ({fast.page_count} pages, quality={fast.quality:.2f}, "
+                        f"{fast.elapsed_ms:.0f}ms)"
+                    )
+                    return fast.text
+                logger.info(
+                    f"Text layer rejected (quality={fast.quality:.2f}, "
+                    f"scanned pages={fast.scanned_pages}); falling back to Docling"
+                )
+            except Exception as e:
+                logger.warning(f"Text layer extraction failed, falling back to Docling: {e}")
 
         def blocking_convert():
             result = self.converter.convert(str(pdf_path))
-            return result.document.export_to_markdown()
+            return result.document.export_to_markdown(page_break_placeholder=PAGE_BREAK)
 
         try:
+            if settings.DOCLING_PROCESS_POOL_ENABLED:
+                return await get_conversion_pool().convert(pdf_path)
             return await asyncio.to_thread(blocking_convert)
         except Exception as e:
             logger.error(f"Docling extraction failed: {e}")
-            return ""
+            raise
 
-    async def parse_cv_structure(self, file_path: str) -> Dict[str, Any]:
+    async def parse_cv_structure(
+        self, file_path: str, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Convert PDF to structured JSON using Docling + LLM"""
+        raw_text = await self.extract_markdown(file_path, content_hash)
+        return await self.parse_markdown(raw_text)
+
+    async def extract_markdown(self, file_path: str, content_hash: Optional[str] = None) -> str:
+        """
+        Extract the CV text (Markdown when Docling runs)
+
+        Raises:
+            ConversionTimeout: Docling overran DOCLING_TIMEOUT_SECONDS
+            ResumeParsingError: The PDF could not be converted or has no text
+        """
+        try:
+            raw_text = await self._extract_text(file_path, content_hash)
+        except ConversionTimeout:
+            logger.error(f"Text extraction timed out for {file_path}")
+            raise
+        except Exception as e:
+            logger.error(f"Text extraction failed for {file_path}: {e}", exc_info=True)
+            raise ResumeParsingError(f"Could not extract text from {Path(file_path).name}: {e}") from e
+        if not raw_text or not raw_text.strip():
+            raise ResumeParsingError(f"No text found in {Path(file_path).name}")
+        if len(raw_text.strip()) < 50:
+            logger.warning("Extracted text is too short for reliable parsing.")
+        return raw_text
+
+    async def parse_markdown(self, raw_text: str) -> Dict[str, Any]:
+        """
+        Structure extracted CV text with the LLM
+
+        Raises:
+            ResumeParsingError: The LLM call or its result failed
+        """
         try:
-            # 1. Text Extraction
-            raw_text = await self._extract_text(file_path)
-            if not raw_text or len(raw_text.strip()) < 50:
-                logger.warning("Extracted text is too short for reliable parsing.")
+            if get_settings().LLM_PROMPT_COMPACTION:
+                raw_text, _ = compact_markdown(raw_text)
 
-            # 2. LLM Structured Parsing
             logger.info("Sending text to LLM for structured extraction...")
             resume_data = await self.llm_service.parse_to_model_with_function_calling(
                 text=raw_text,
@@ -386,12 +396,12 @@ class PDFParserService:
                 tool_name="extract_resume",
             )
 
-            # 3. Final cleanup and conversion
+            # Final cleanup and conversion
             return self._finalize_data(resume_data)
 
         except Exception as e:
-            logger.error(f"Critical error in parse_cv_structure: {e}", exc_info=True)
-            return self._get_empty_structure()
+            logger.error(f"Critical error in parse_markdown: {e}", exc_info=True)
+            raise ResumeParsingError(f"Structured extraction failed: {e}") from e
 
     def _get_instructions(self) -> str:
         return """You are an expert resume parser. Extract information from the provided text into the structured schema.
@@ -0,0 +1,251 @@
+"""
+Bulk import of extracted resume data into a profile.
+
+Every extracted item is validated before anything touches the database;
+items that fail validation, or repeat a value that must be unique in the
+profile (a language it already has), are preserved as "Unresolved ...
+(Imported)" custom sections. Each section is then inserted as one batch (one multi-row
+INSERT for the ``entities`` parent rows and one for the section table, see
+``bulk_insert_entities``) inside a savepoint, so a database error only costs that
+section a row-by-row retry. Nothing is committed here: the caller commits the
+whole import together with the resume status.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from features.profiles.batch import column_values, unique_key
+from shared.models.entity import bulk_insert_entities
+from features.profiles.models import Profile
+from features.profiles.schemas import ProfileUpdate
+from features.profiles.education.models import Education
+from features.profiles.education.schemas import EducationCreate
+from features.profiles.work_experiences.models import WorkExperience
+from features.profiles.work_experiences.schemas import WorkExperienceCreate
+from features.profiles.skills.models import Skill
+from features.profiles.skills.schemas import SkillCreate
+from features.profiles.certificates.models import Certificate
+from features.profiles.certificates.schemas import CertificateCreate
+from features.profiles.languages.models import Language
+from features.profiles.languages.schemas import LanguageCreate
+from features.profiles.projects.models import Project
+from features.profiles.projects.schemas import ProjectCreate
+from features.profiles.professional_summaries.models import ProfessionalSummary
+from features.profiles.professional_summaries.schemas import ProfessionalSummaryCreate
+from features.profiles.custom_sections.models import CustomSection
+from features.profiles.custom_sections.schemas import CustomSectionCreate
+
+logger = logging.getLogger(__name__)
+
+# Extracted data key → (create schema, ORM model), in insertion order
+SECTIONS: List[Tuple[str, Type[BaseModel], type]] = [
+    ("education", EducationCreate, Education),
+    ("work_experiences", WorkExperienceCreate, WorkExperience),
+    ("skills", SkillCreate, Skill),
+    ("certificates", CertificateCreate, Certificate),
+    ("languages", LanguageCreate, Language),
+    ("projects", ProjectCreate, Project),
+    ("professional_summaries", ProfessionalSummaryCreate, ProfessionalSummary),
+    ("custom_sections", CustomSectionCreate, CustomSection),
+]
+
+# Extracted data key → field unique per profile (compared with ``unique_key``)
+UNIQUE_FIELDS: Dict[str, str] = {"languages": "language"}
+
+
+@dataclass
+class ImportSummary:
+    """What happened to the extracted items"""
+
+    inserted: Dict[str, int] = field(default_factory=dict)
+    recovered: int = 0  # items saved as fallback custom sections
+    dropped: int = 0  # items that could not be saved at all
+
+
+def _fallback_section(key: str, item: Dict[str, Any]) -> Optional[CustomSectionCreate]:
+    """Keep an item that cannot be imported as-is as a custom section"""
+    details = [
+        f"**{k.replace('_', ' ').title()}**: {v}"
+        for k, v in item.items()
+        if v is not None
+    ]
+    try:
+        return CustomSectionCreate(
+            title=f"Unresolved {key.replace('_', ' ').title()} (Imported)",
+            content="\n".join(details),
+        )
+    except ValidationError as e:
+        logger.error(f"Failed to build fallback custom section for {key} item: {e}")
+        return None
+
+
+def _log_validation_error(key: str, error: ValidationError) -> None:
+    for err in error.errors():
+        logger.warning(
+            f"  → {key} field '{'.'.join(str(l) for l in err['loc'])}': "
+            f"{err['msg']} (type={err['type']}, input={err.get('input')})"
+        )
+
+
+class ProfileImporter:
+    """Populates a profile from extracted resume data in one transaction"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def populate(self, profile: Profile, data: Dict[str, Any]) -> ImportSummary:
+        summary = ImportSummary()
+        self._update_contact_info(profile, data.get("contact_info") or {})
+
+        validated, fallbacks = self._validate(data, summary)
+        fallbacks.extend(self._remove_duplicates(profile.id, validated, summary))
+        validated["custom_sections"].extend(fallbacks)
+
+        has_summary = bool(
+            self.db.query(ProfessionalSummary.id)
+            .filter(ProfessionalSummary.profile_id == profile.id)
+            .first()
+        )
+        for key, _, model in SECTIONS:
+            items = validated[key]
+            if not items:
+                continue
+
+            def build(item: BaseModel, index: int, model=model, key=key):
+                values = column_values(item)
+                if key == "professional_summaries":
+                    # First summary of a profile becomes the default
+                    values["is_default"] = not has_summary and index == 0
+                return {"profile_id": profile.id, **values}
+
+            summary.inserted[key] = self._insert_section(profile.id, key, model, items, build, summary)
+
+        logger.info(
+            f"Imported {sum(summary.inserted.values())} items into profile {profile.uuid} "
+            f"({summary.recovered} recovered as custom sections, {summary.dropped} dropped)"
+        )
+        return summary
+
+    def _update_contact_info(self, profile: Profile, contact: Dict[str, Any]) -> None:
+        if not contact:
+            return
+        update_data = ProfileUpdate(
+            name=contact.get("name"),
+            email=contact.get("email"),
+            phone_number=contact.get("phone"),
+            location=contact.get("location")
+        )
+        for name, value in update_data.model_dump(exclude_unset=True).items():
+            setattr(profile, name, value)
+
+    def _validate(
+        self, data: Dict[str, Any], summary: ImportSummary
+    ) -> Tuple[Dict[str, List[BaseModel]], List[CustomSectionCreate]]:
+        """Validate every item up front; invalid ones become fallback sections"""
+        validated: Dict[str, List[BaseModel]] = {key: [] for key, _, _ in SECTIONS}
+        fallbacks: List[CustomSectionCreate] = []
+        for key, schema, _ in SECTIONS:
+            items = data.get(key, [])
+            if not isinstance(items, list):
+                continue
+            for item in items:
+                try:
+                    # Handles date string -> date object conversion automatically
+                    validated[key].append(schema.model_validate(item))
+                except ValidationError as e:
+                    _log_validation_error(key, e)
+                    logger.warning(f"Skipping {key} item due to validation error: {e}")
+                    # Do not fall back if the item is already a custom section
+                    fallback = (
+                        _fallback_section(key, item)
+                        if key != "custom_sections" and isinstance(item, dict)
+                        else None
+                    )
+                    if fallback is None:
+                        summary.dropped += 1
+                    else:
+                        fallbacks.append(fallback)
+                        summary.recovered += 1
+        return validated, fallbacks
+
+    def _remove_duplicates(
+        self, profile_id: int, validated: Dict[str, List[BaseModel]], summary: ImportSummary
+    ) -> List[CustomSectionCreate]:
+        """Take out items repeating a unique value of the profile or of an earlier item"""
+        fallbacks: List[CustomSectionCreate] = []
+        for key, _, model in SECTIONS:
+            field_name = UNIQUE_FIELDS.get(key)
+            if field_name is None or not validated[key]:
+                continue
+            column = getattr(model, field_name)
+            seen = {
+                unique_key(value)
+                for (value,) in self.db.query(column).filter(model.profile_id == profile_id)
+            }
+            kept = []
+            for item in validated[key]:
+                value_key = unique_key(getattr(item, field_name))
+                if value_key not in seen:
+                    seen.add(value_key)
+                    kept.append(item)
+                    continue
+                logger.warning(f"Skipping duplicate {key} item: {getattr(item, field_name)!r}")
+                fallback = _fallback_section(key, item.model_dump(mode="json"))
+                if fallback is None:
+                    summary.dropped += 1
+                else:
+                    fallbacks.append(fallback)
+                    summary.recovered += 1
+            validated[key] = kept
+        return fallbacks
+
+    def _insert_section(
+        self,
+        profile_id: int,
+        key: str,
+        model: type,
+        items: List[BaseModel],
+        build: Callable[[BaseModel, int], Dict[str, Any]],
+        summary: ImportSummary,
+    ) -> int:
+        """Insert a section in one batch, isolating bad rows only if the batch fails"""
+        try:
+            with self.db.begin_nested():
+                bulk_insert_entities(self.db, model, [build(item, i) for i, item in enumerate(items)])
+            return len(items)
+        except SQLAlchemyError as e:
+            logger.warning(f"Batch insert of {len(items)} {key} failed, retrying row by row: {e}")
+
+        inserted = 0
+        for i, item in enumerate(items):
+            try:
+                with self.db.begin_nested():
+                    bulk_insert_entities(self.db, model, [build(item, i)])
+                inserted += 1
+                continue
+            except SQLAlchemyError as e:
+                logger.warning(f"Skipping {key} item that failed to insert: {e}")
+
+            fallback = (
+                _fallback_section(key, item.model_dump(mode="json"))
+                if key != "custom_sections"
+                else None
+            )
+            if fallback is None:
+                summary.dropped += 1
+                continue
+            try:
+                with self.db.begin_nested():
+                    bulk_insert_entities(
+                        self.db, CustomSection, [{"profile_id": profile_id, **fallback.model_dump()}]
+                    )
+                summary.recovered += 1
+            except SQLAlchemyError as fallback_err:
+                logger.error(f"Failed to save fallback custom section: {fallback_err}")
+                summary.dropped += 1
+        return inserted
@@ -0,0 +1,167 @@
+"""
+Prompt compaction for Docling markdown.
+
+``export_to_markdown()`` output carries a lot of tokens the LLM does not need:
+table pipes and separator rows, padding whitespace, image placeholders and
+page headers/footers repeated on every page. Compacting it before the LLM call
+lowers latency and cost per upload and keeps long CVs under the context limit.
+
+Headers, footers and page numbers are only recognised at the top and bottom of
+a page, so extractors separate pages with ``PAGE_BREAK``. Repeats are compared
+literally and lines that look like dates are never dropped: "2019 - 2021" on
+one job and "2017 - 2019" on the next are CV data, not boilerplate.
+"""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from core.docling_worker import PAGE_BREAK
+from features.llm.scheduler import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Non-empty lines at the top and at the bottom of a page that may be a header/footer
+_EDGE_LINES = 2
+
+_IMAGE_PLACEHOLDER = re.compile(r"<!--\s*image\s*-->", re.IGNORECASE)
+_TABLE_SEPARATOR = re.compile(r"^\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?$")
+_PAGE_NUMBER = re.compile(
+    r"^(page\s*)?(\d{1,3})(\s*(/|of)\s*\d{1,3})?$", re.IGNORECASE
+)
+_DATE_LIKE = re.compile(
+    r"\b(19|20)\d{2}\b|\b(jan(uary)?|feb(ruary)?|mar(ch)?|apr(il)?|may|june?|july?|aug(ust)?"
+    r"|sep(t(ember)?)?|oct(ober)?|nov(ember)?|dec(ember)?)\b",
+    re.IGNORECASE,
+)
+_INLINE_SPACE = re.compile(r"[ \t\u00a0]+")
+_MARKDOWN_ESCAPE = re.compile(r"\\([_*#\[\]()&<>])")
+
+
+@dataclass
+class CompactionStats:
+    """Size of the prompt text before and after compaction"""
+
+    original_chars: int
+    compacted_chars: int
+    original_tokens: int
+    compacted_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.original_tokens - self.compacted_tokens
+
+    @property
+    def saved_ratio(self) -> float:
+        if not self.original_tokens:
+            return 0.0
+        return self.saved_tokens / self.original_tokens
+
+
+def _collapse_table_row(line: str) -> str:
+    """'| Python | Python | 5 years |' -> 'Python | 5 years'"""
+    cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+    compact: List[str] = []
+    for cell in cells:
+        # Docling repeats the text of merged cells in every spanned column
+        if cell and (not compact or compact[-1] != cell):
+            compact.append(cell)
+    return " | ".join(compact)
+
+
+def _is_boilerplate_candidate(line: str) -> bool:
+    # Headings, list items, labels ("Responsibilities:") and dates legitimately repeat
+    return (
+        len(line) <= 80
+        and not line.startswith(("#", "-", "*", "+"))
+        and not line.endswith(":")
+        and not _DATE_LIKE.search(line)
+    )
+
+
+def _is_page_number(line: str, page_no: int) -> bool:
+    match = _PAGE_NUMBER.match(line)
+    if match is None:
+        return False
+    # "Page 2" is unambiguous; a bare "2" or "2/3" only when it is this page's number
+    return bool(match.group(1)) or int(match.group(2)) == page_no
+
+
+def _edge_indexes(page: List[str]) -> List[int]:
+    filled = [i for i, line in enumerate(page) if line]
+    return sorted(set(filled[:_EDGE_LINES] + filled[-_EDGE_LINES:]))
+
+
+def _clean_line(raw: str) -> Optional[str]:
+    line = _IMAGE_PLACEHOLDER.sub("", raw)
+    line = _MARKDOWN_ESCAPE.sub(r"\1", line)
+    line = _INLINE_SPACE.sub(" ", line).strip()
+    if line.startswith("|"):
+        if _TABLE_SEPARATOR.match(line):
+            return None
+        line = _collapse_table_row(line)
+    return line
+
+
+def compact_markdown(text: str, min_pages: int = 2) -> Tuple[str, CompactionStats]:
+    """
+    Compact Docling markdown for use in an LLM prompt.
+
+    Args:
+        text: Markdown exported by Docling, pages separated by ``PAGE_BREAK``
+        min_pages: Number of pages a line must open or close before it is
+            treated as a page header/footer (only the first occurrence is kept)
+
+    Returns:
+        Compacted text and the before/after statistics
+    """
+    original = text or ""
+    pages: List[List[str]] = [[]]
+    for raw in original.splitlines():
+        if raw.strip() == PAGE_BREAK:
+            pages.append([])
+            continue
+        line = _clean_line(raw)
+        if line is not None:
+            pages[-1].append(line)
+
+    # Lines at the top/bottom of a page: page numbers, and headers/footers
+    # when the same line opens or closes several pages
+    edges = [_edge_indexes(page) for page in pages]
+    page_counts = Counter(
+        line
+        for page, indexes in zip(pages, edges)
+        for line in {page[i] for i in indexes if _is_boilerplate_candidate(page[i])}
+    )
+    seen = set()
+    kept: List[str] = []
+    for page_no, (page, indexes) in enumerate(zip(pages, edges), start=1):
+        for i, line in enumerate(page):
+            if i in indexes:
+                if _is_page_number(line, page_no):
+                    continue
+                if page_counts.get(line, 0) >= min_pages:
+                    if line in seen:
+                        continue
+                    seen.add(line)
+            # Collapse runs of blank lines into one paragraph break
+            if not line and (not kept or not kept[-1]):
+                continue
+            kept.append(line)
+        if kept and kept[-1]:
+            kept.append("")
+
+    compacted = "\n".join(kept).strip()
+    stats = CompactionStats(
+        original_chars=len(original),
+        compacted_chars=len(compacted),
+        original_tokens=estimate_tokens(original),
+        compacted_tokens=estimate_tokens(compacted),
+    )
+    logger.info(
+        f"Prompt compaction: ~{stats.original_tokens} -> ~{stats.compacted_tokens} tokens "
+        f"({stats.saved_ratio:.0%} saved)"
+    )
+    return compacted, stats
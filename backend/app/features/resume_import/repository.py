@@ -1,7 +1,9 @@
 """
 Resume Import Repository - Database operations for resume uploads
 """
-from sqlalchemy.orm import Session
+from datetime import datetime
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session, undefer
 from typing import Optional, List
 from uuid import UUID
 
@@ -19,7 +21,8 @@ class ResumeImportRepository:
         profile_id: int,
         user_id: int,
         filename: str,
-        extracted_data: dict
+        extracted_data: dict,
+        import_status: str = "pending"
     ) -> UploadedResume:
         """Create a new uploaded resume record"""
         uploaded_resume = UploadedResume(
@@ -27,7 +30,7 @@ class ResumeImportRepository:
             user_id=user_id,
             original_filename=filename,
             extracted_data=extracted_data,
-            import_status="pending"
+            import_status=import_status
         )
 
         self.db.add(uploaded_resume)
@@ -35,11 +38,45 @@ class ResumeImportRepository:
         self.db.refresh(uploaded_resume)
         return uploaded_resume
 
-    def get_uploaded_resume_by_uuid(self, resume_uuid: UUID) -> Optional[UploadedResume]:
-        """Get uploaded resume by UUID"""
-        return self.db.query(UploadedResume).filter(
-            UploadedResume.uuid == resume_uuid
-        ).first()
+    def create_batch(
+        self,
+        profile_id: int,
+        user_id: int,
+        batch_id: UUID,
+        filenames: List[str],
+        import_status: str = "processing"
+    ) -> List[UploadedResume]:
+        """Create one uploaded resume record per file of a batch, in one commit"""
+        uploaded_resumes = [
+            UploadedResume(
+                profile_id=profile_id,
+                user_id=user_id,
+                batch_id=batch_id,
+                original_filename=filename,
+                extracted_data={},
+                import_status=import_status
+            )
+            for filename in filenames
+        ]
+        self.db.add_all(uploaded_resumes)
+        self.db.commit()
+        # Reload the expired instances in one query instead of one per row
+        self.get_resumes_by_batch(batch_id, user_id)
+        return uploaded_resumes
+
+    def get_uploaded_resume_by_uuid(
+        self,
+        resume_uuid: UUID,
+        with_data: bool = False,
+        with_markdown: bool = False
+    ) -> Optional[UploadedResume]:
+        """Get uploaded resume by UUID, optionally loading its deferred payloads"""
+        query = self.db.query(UploadedResume).filter(UploadedResume.uuid == resume_uuid)
+        if with_data:
+            query = query.options(undefer(UploadedResume.extracted_data))
+        if with_markdown:
+            query = query.options(undefer(UploadedResume.raw_markdown))
+        return query.first()
 
     def get_uploaded_resume_by_id(self, resume_id: int) -> Optional[UploadedResume]:
         """Get uploaded resume by ID"""
@@ -59,6 +96,30 @@ class ResumeImportRepository:
             UploadedResume.user_id == user_id
         ).order_by(UploadedResume.created_at.desc()).all()
 
+    def get_resumes_by_batch(self, batch_id: UUID, user_id: int) -> List[UploadedResume]:
+        """Get the resumes of a user's batch, in upload order"""
+        return self.db.query(UploadedResume).filter(
+            UploadedResume.batch_id == batch_id,
+            UploadedResume.user_id == user_id
+        ).order_by(UploadedResume.id).all()
+
+    def mark_batch_failed(self, resumes: List[UploadedResume]) -> None:
+        """Flag every resume of a batch that could not be queued"""
+        for resume in resumes:
+            resume.import_status = "failed"
+        self.db.commit()
+
+    def get_resume_summaries_by_user(self, user_id: int) -> List[Row]:
+        """List a user's resumes without loading their payloads"""
+        return self.db.query(
+            UploadedResume.uuid,
+            UploadedResume.original_filename,
+            UploadedResume.import_status,
+            UploadedResume.created_at
+        ).filter(
+            UploadedResume.user_id == user_id
+        ).order_by(UploadedResume.created_at.desc()).all()
+
     def update_resume_status(self, resume: UploadedResume, status: str) -> UploadedResume:
         """Update the import status of a resume"""
         resume.import_status = status
@@ -66,9 +127,38 @@ class ResumeImportRepository:
         self.db.refresh(resume)
         return resume
 
-    def update_extracted_data(self, resume: UploadedResume, extracted_data: dict) -> UploadedResume:
-        """Update the extracted data for a resume"""
+    def mark_processing(self, resume: UploadedResume) -> UploadedResume:
+        """Flag a resume as being parsed right now (restarts the stale clock)"""
+        resume.import_status = "processing"
+        resume.updated_at = datetime.utcnow()
+        self.db.commit()
+        return resume
+
+    def fail_stale_processing(self, updated_before: datetime) -> int:
+        """Mark resumes stuck in "processing" since before the cutoff as failed"""
+        count = self.db.query(UploadedResume).filter(
+            UploadedResume.import_status == "processing",
+            UploadedResume.updated_at < updated_before
+        ).update(
+            {"import_status": "failed", "updated_at": datetime.utcnow()},
+            synchronize_session=False
+        )
+        self.db.commit()
+        return count
+
+    def update_extracted_data(
+        self,
+        resume: UploadedResume,
+        extracted_data: dict,
+        status: Optional[str] = None,
+        raw_markdown: Optional[str] = None
+    ) -> UploadedResume:
+        """Update the extracted data (and optionally the status and source text) for a resume"""
         resume.extracted_data = extracted_data
+        if raw_markdown is not None:
+            resume.raw_markdown = raw_markdown
+        if status is not None:
+            resume.import_status = status
         self.db.commit()
         self.db.refresh(resume)
         return resume
@@ -1,17 +1,21 @@
 """
 Resume Import Router - API endpoints for resume upload and processing
 """
-import tempfile
-import os
-from fastapi import APIRouter, Depends, UploadFile, File, Form, status
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Query, status
 from typing import Dict, Any
 from uuid import UUID
 
 from features.users.models import User
-from features.auth.dependencies import get_current_user
+from features.auth.dependencies import get_current_user, get_current_user_read
 from .service import ResumeImportService
-from .dependencies import get_resume_import_service, validate_resume_upload
+from .dependencies import (
+    get_resume_import_service,
+    get_resume_import_read_service,
+    validate_resume_batch_upload,
+    validate_resume_upload
+)
 from .schemas import (
+    ResumeBatchResponse,
     ResumeUploadResponse,
     ResumeImportStatus,
     ResumeConfirmImport,
@@ -22,50 +26,73 @@ from .schemas import (
 router = APIRouter(prefix="/api/v1/resume-import", tags=["resume-import"])
 
 
-@router.post("/upload", response_model=ResumeUploadResponse, status_code=status.HTTP_201_CREATED)
-async def upload_resume(
-    validated_data: dict = Depends(validate_resume_upload),
+@router.post("/upload", response_model=ResumeUploadResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_resume(
     current_user: User = Depends(get_current_user),
+    validated_data: dict = Depends(validate_resume_upload),
     resume_import_service: ResumeImportService = Depends(get_resume_import_service)
 ):
     """
-    Upload and parse a resume PDF
+    Upload a resume PDF and queue it for parsing
 
-    The resume will be processed using Docling to extract structured data
-    including contact info, education, work experience, skills, etc.
+    The resume is processed in the background using Docling and the LLM to
+    extract structured data (contact info, education, work experience,
+    skills, etc.). Poll `/api/v1/tasks/{task_id}` until the task completes,
+    then fetch the extracted data from `/status/{resume_id}`.
     """
-    # Save uploaded file temporarily
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-        temp_file.write(validated_data["file_content"])
-        temp_file_path = temp_file.name
+    return resume_import_service.enqueue_resume_parsing(
+        profile_id=validated_data["profile_id"],
+        user_id=current_user.id,
+        file_path=validated_data["file_path"],
+        content_hash=validated_data["content_hash"],
+        filename=validated_data["filename"]
+    )
 
-    try:
-        # Process the resume
-        result = await resume_import_service.upload_and_parse_resume(
-            profile_id=validated_data["profile_id"],
-            user_id=current_user.id,
-            file_path=temp_file_path,
-            filename=validated_data["filename"]
-        )
 
-        return result
+@router.post("/batch", response_model=ResumeBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+def upload_resume_batch(
+    current_user: User = Depends(get_current_user),
+    validated_data: dict = Depends(validate_resume_batch_upload),
+    resume_import_service: ResumeImportService = Depends(get_resume_import_service)
+):
+    """
+    Upload many resume PDFs (or ZIP archives of PDFs) and queue them for parsing
 
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
+    Every CV becomes its own uploaded resume, parsed in parallel by the
+    workers and confirmed individually. Poll `/batch/{batch_id}` for
+    per-file progress.
+    """
+    return resume_import_service.enqueue_resume_batch(
+        profile_id=validated_data["profile_id"],
+        user_id=current_user.id,
+        uploads=validated_data["uploads"],
+        rejected_files=validated_data["rejected_files"]
+    )
+
+
+@router.get("/batch/{batch_id}", response_model=ResumeBatchResponse)
+def get_resume_batch_status(
+    batch_id: UUID,
+    current_user: User = Depends(get_current_user_read),
+    resume_import_service: ResumeImportService = Depends(get_resume_import_read_service)
+):
+    """
+    Get the aggregated parsing progress of a batch upload
+    """
+    return resume_import_service.get_batch_status(batch_id, current_user.id)
 
 
 @router.get("/status/{resume_id}", response_model=ResumeImportStatus)
 async def get_resume_status(
     resume_id: UUID,
-    current_user: User = Depends(get_current_user),
-    resume_import_service: ResumeImportService = Depends(get_resume_import_service)
+    include_markdown: bool = Query(False, description="Also return the text extracted from the PDF"),
+    current_user: User = Depends(get_current_user_read),
+    resume_import_service: ResumeImportService = Depends(get_resume_import_read_service)
 ):
     """
     Get the processing status and extracted data for an uploaded resume
     """
-    return resume_import_service.get_resume_status(resume_id, current_user.id)
+    return resume_import_service.get_resume_status(resume_id, current_user.id, include_markdown)
 
 
 @router.post("/confirm", response_model=ResumeImportStatus)
@@ -89,8 +116,8 @@ async def confirm_resume_import(
 
 @router.get("/list", response_model=ResumeListResponse)
 async def list_user_resumes(
-    current_user: User = Depends(get_current_user),
-    resume_import_service: ResumeImportService = Depends(get_resume_import_service)
+    current_user: User = Depends(get_current_user_read),
+    resume_import_service: ResumeImportService = Depends(get_resume_import_read_service)
 ):
     """
     List all resumes uploaded by the current user
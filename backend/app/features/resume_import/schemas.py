@@ -26,8 +26,9 @@ class ResumeUploadResponse(BaseModel):
 
     resume_id: UUID4 = Field(..., description="UUID of the uploaded resume")
     filename: str = Field(..., description="Original filename of uploaded resume")
-    status: str = Field(..., description="Import status (pending, confirmed, rejected)")
+    status: str = Field(..., description="Import status (processing, pending, failed, confirmed, rejected)")
     extracted_data: Optional[Dict[str, Any]] = Field(None, description="Extracted data from the resume")
+    task_id: Optional[str] = Field(None, description="Parsing task ID, pollable via /api/v1/tasks/{task_id}")
     created_at: datetime = Field(..., description="Upload timestamp")
 
     model_config = {
@@ -35,24 +36,66 @@ class ResumeUploadResponse(BaseModel):
             "example": {
                 "resume_id": "123e4567-e89b-12d3-a456-426614174001",
                 "filename": "john_doe_resume.pdf",
-                "status": "pending",
-                "extracted_data": {
-                    "contact_info": {"name": "John Doe", "email": "john@example.com"},
-                    "education": [{"institution": "MIT", "degree": "Bachelor of Science"}],
-                    "work_experience": [{"job_title": "Software Engineer", "company": "Google"}]
-                },
+                "status": "processing",
+                "extracted_data": {},
+                "task_id": "5f0c6f0e-8d3b-4b55-9a55-3c1f5d1c2b7a",
                 "created_at": "2024-01-15T10:30:00Z"
             }
         }
     }
 
 
+class ResumeBatchItem(BaseModel):
+    """One file of a batch upload"""
+
+    resume_id: UUID4 = Field(..., description="UUID of the uploaded resume")
+    filename: str = Field(..., description="Original filename")
+    status: str = Field(..., description="Import status (processing, pending, failed, confirmed, rejected)")
+
+
+class ResumeBatchResponse(BaseModel):
+    """Schema for batch upload response and batch progress"""
+
+    batch_id: UUID4 = Field(..., description="UUID of the batch, pollable via /batch/{batch_id}")
+    total: int = Field(..., description="Number of resumes in the batch")
+    completed: int = Field(..., description="Resumes whose parsing has finished (successfully or not)")
+    status_counts: Dict[str, int] = Field(..., description="Number of resumes per import status")
+    resumes: List[ResumeBatchItem] = Field(..., description="Per-file progress")
+    rejected_files: List[str] = Field(default_factory=list, description="Files that were not queued")
+    task_id: Optional[str] = Field(None, description="Celery group ID (upload response only)")
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "batch_id": "9b2f6d1e-3c4a-4e8b-9f1d-2a7c5e6b8d90",
+                "total": 2,
+                "completed": 1,
+                "status_counts": {"pending": 1, "processing": 1},
+                "resumes": [
+                    {
+                        "resume_id": "123e4567-e89b-12d3-a456-426614174001",
+                        "filename": "jane_doe.pdf",
+                        "status": "pending"
+                    },
+                    {
+                        "resume_id": "123e4567-e89b-12d3-a456-426614174002",
+                        "filename": "john_doe.pdf",
+                        "status": "processing"
+                    }
+                ],
+                "rejected_files": ["notes.txt"]
+            }
+        }
+    }
+
+
 class ResumeImportStatus(BaseModel):
     """Schema for resume import status"""
 
     resume_id: UUID4 = Field(..., description="UUID of the resume")
     status: str = Field(..., description="Current import status")
     extracted_data: Optional[Dict[str, Any]] = Field(None, description="Extracted data if available")
+    raw_markdown: Optional[str] = Field(None, description="Text extracted from the PDF (only with include_markdown=true)")
     updated_at: datetime = Field(..., description="Last update timestamp")
 
     model_config = {
@@ -1,37 +1,24 @@
 """
 Resume Import Service - Business logic for resume upload and processing.
-Refactored to be cleaner, using feature services instead of direct repository access.
+Profile population from confirmed imports lives in profile_import.py.
 """
 import logging
-from typing import Dict, Any, Optional
-from uuid import UUID
-from datetime import date
+from pathlib import Path
+from collections import Counter
+from typing import Dict, Any, List, Optional
+from uuid import UUID, uuid4
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 
 from core.exceptions import HTTPException
 from features.profiles.repository import ProfileRepository
-
-# Import Feature Services
-from features.profiles.education.service import EducationService
-from features.profiles.education.schemas import EducationCreate
-from features.profiles.work_experiences.service import WorkExperienceService
-from features.profiles.work_experiences.schemas import WorkExperienceCreate
-from features.profiles.skills.service import SkillService
-from features.profiles.skills.schemas import SkillCreate
-from features.profiles.certificates.service import CertificateService
-from features.profiles.certificates.schemas import CertificateCreate
-from features.profiles.languages.service import LanguageService
-from features.profiles.languages.schemas import LanguageCreate
-from features.profiles.projects.service import ProjectService
-from features.profiles.projects.schemas import ProjectCreate
-from features.profiles.professional_summaries.service import ProfessionalSummaryService
-from features.profiles.professional_summaries.schemas import ProfessionalSummaryCreate
-from features.profiles.custom_sections.service import CustomSectionService
-from features.profiles.custom_sections.schemas import CustomSectionCreate
+from features.llm.scheduler import llm_caller
 
 from .repository import ResumeImportRepository
 from .pdf_parser_service import PDFParserService
-from .schemas import ResumeUploadResponse, ResumeImportStatus
+from .profile_import import ProfileImporter
+from .schemas import ResumeBatchItem, ResumeBatchResponse, ResumeUploadResponse, ResumeImportStatus
+from .uploads import StoredUpload
 
 
 logger = logging.getLogger(__name__)
@@ -43,68 +30,192 @@ class ResumeImportService:
     def __init__(self, db: Session):
         self.db = db
         self.repo = ResumeImportRepository(db)
-        self.pdf_parser = PDFParserService()
+        self._pdf_parser: Optional[PDFParserService] = None
         self.profile_repo = ProfileRepository(db)
-        
-        # Initialize Feature Services
-        self.education_service = EducationService(db)
-        self.work_exp_service = WorkExperienceService(db)
-        self.skills_service = SkillService(db)
-        self.certificates_service = CertificateService(db)
-        self.languages_service = LanguageService(db)
-        self.projects_service = ProjectService(db)
-        self.summary_service = ProfessionalSummaryService(db)
-        self.custom_sections_service = CustomSectionService(db)
-
-    async def upload_and_parse_resume(
+
+    @property
+    def pdf_parser(self) -> PDFParserService:
+        """Built on first use so status/list endpoints never load the parser"""
+        if self._pdf_parser is None:
+            self._pdf_parser = PDFParserService()
+        return self._pdf_parser
+
+    def enqueue_resume_parsing(
         self,
         profile_id: UUID,
         user_id: int,
-        file_path: str,
+        file_path: Path,
+        content_hash: str,
         filename: str
     ) -> ResumeUploadResponse:
-        """Upload a resume file, parse it, and return extracted data"""
+        """Queue a stored resume upload for parsing by a Celery worker"""
         try:
             # Verify profile ownership
             profile = self.profile_repo.get_by_uuid(str(profile_id))
             if not profile or profile.user_id != user_id:
                 raise HTTPException(status_code=403, message="Access denied to this profile")
 
-            # Parse structured data from PDF
-            logger.info(f"Starting PDF parsing for: {filename}")
-            extracted_data = await self.pdf_parser.parse_cv_structure(file_path)
-
-            # Store extraction result for user confirmation
             uploaded_resume = self.repo.create_uploaded_resume(
                 profile_id=profile.id,
                 user_id=user_id,
                 filename=filename,
-                extracted_data=extracted_data
+                extracted_data={},
+                import_status="processing"
             )
 
-            return ResumeUploadResponse(
-                resume_id=uploaded_resume.uuid,
-                filename=uploaded_resume.original_filename,
-                status=uploaded_resume.import_status,
-                extracted_data=uploaded_resume.extracted_data,
-                created_at=uploaded_resume.created_at
+            try:
+                from .tasks import parse_resume_task
+
+                task = parse_resume_task.delay(uploaded_resume.id, str(file_path), content_hash)
+            except Exception as e:
+                logger.error(f"Failed to enqueue parsing for resume {uploaded_resume.uuid}: {e}")
+                self.repo.update_resume_status(uploaded_resume, "failed")
+                raise HTTPException(status_code=503, message="Resume parsing is temporarily unavailable")
+        except BaseException:
+            # Once queued the task removes the file; until then it is ours
+            Path(file_path).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Queued parsing of {filename} (resume {uploaded_resume.uuid}) → task_id={task.id}")
+        return ResumeUploadResponse(
+            resume_id=uploaded_resume.uuid,
+            filename=uploaded_resume.original_filename,
+            status=uploaded_resume.import_status,
+            extracted_data={},  # filled in by the worker
+            task_id=task.id,
+            created_at=uploaded_resume.created_at
+        )
+
+    def enqueue_resume_batch(
+        self,
+        profile_id: UUID,
+        user_id: int,
+        uploads: List[StoredUpload],
+        rejected_files: List[str]
+    ) -> ResumeBatchResponse:
+        """Queue a batch of stored resume uploads as one Celery group"""
+        try:
+            profile = self.profile_repo.get_by_uuid(str(profile_id))
+            if not profile or profile.user_id != user_id:
+                raise HTTPException(status_code=403, message="Access denied to this profile")
+
+            batch_id = uuid4()
+            resumes = self.repo.create_batch(
+                profile_id=profile.id,
+                user_id=user_id,
+                batch_id=batch_id,
+                filenames=[upload.filename for upload in uploads]
             )
 
-        except HTTPException:
+            try:
+                from celery import group
+                from .tasks import parse_resume_task
+
+                # Parallelism is bounded by the resume_parsing workers, the Docling
+                # process pool and the LLM scheduler, not by the batch size
+                result = group(
+                    parse_resume_task.s(resume.id, str(upload.path), upload.sha256)
+                    for resume, upload in zip(resumes, uploads)
+                ).apply_async()
+            except Exception as e:
+                logger.error(f"Failed to enqueue resume batch {batch_id}: {e}")
+                self.repo.mark_batch_failed(resumes)
+                raise HTTPException(status_code=503, message="Resume parsing is temporarily unavailable")
+        except BaseException:
+            # Once queued the tasks remove the files; until then they are ours
+            for upload in uploads:
+                upload.path.unlink(missing_ok=True)
             raise
-        except Exception as e:
-            logger.error(f"Error processing resume: {e}")
-            raise HTTPException(status_code=500, message=f"Failed to process resume: {str(e)}")
+
+        logger.info(f"Queued batch {batch_id} of {len(resumes)} resumes → group_id={result.id}")
+        return self._batch_response(batch_id, resumes, rejected_files, task_id=result.id)
+
+    def get_batch_status(self, batch_id: UUID, user_id: int) -> ResumeBatchResponse:
+        """Aggregated progress of a batch upload"""
+        resumes = self.repo.get_resumes_by_batch(batch_id, user_id)
+        if not resumes:
+            raise HTTPException(status_code=404, message="Batch not found")
+        return self._batch_response(batch_id, resumes)
+
+    @staticmethod
+    def _batch_response(
+        batch_id: UUID,
+        resumes: List[Any],
+        rejected_files: Optional[List[str]] = None,
+        task_id: Optional[str] = None
+    ) -> ResumeBatchResponse:
+        counts = Counter(resume.import_status for resume in resumes)
+        return ResumeBatchResponse(
+            batch_id=batch_id,
+            total=len(resumes),
+            completed=len(resumes) - counts.get("processing", 0),
+            status_counts=dict(counts),
+            resumes=[
+                ResumeBatchItem(
+                    resume_id=resume.uuid,
+                    filename=resume.original_filename,
+                    status=resume.import_status
+                )
+                for resume in resumes
+            ],
+            rejected_files=rejected_files or [],
+            task_id=task_id
+        )
+
+    async def process_uploaded_resume(
+        self, resume_id: int, file_path: str, content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Parse a queued resume and store the result for user confirmation (runs in the worker)"""
+        uploaded_resume = self.repo.get_uploaded_resume_by_id(resume_id)
+        if not uploaded_resume:
+            raise ValueError(f"Uploaded resume {resume_id} not found")
+        # Also revives a queued resume the reaper gave up on before it started
+        self.repo.mark_processing(uploaded_resume)
+
+        # Parse structured data from PDF (LLM calls are queued fairly per user)
+        logger.info(f"Starting PDF parsing for: {uploaded_resume.original_filename}")
+        caller_token = llm_caller.set(str(uploaded_resume.user_id))
+        try:
+            raw_markdown = await self.pdf_parser.extract_markdown(file_path, content_hash)
+            extracted_data = await self.pdf_parser.parse_markdown(raw_markdown)
+        finally:
+            llm_caller.reset(caller_token)
+
+        self.repo.update_extracted_data(
+            uploaded_resume, extracted_data, status="pending", raw_markdown=raw_markdown
+        )
+        return {"resume_id": str(uploaded_resume.uuid), "status": uploaded_resume.import_status}
+
+    def mark_resume_failed(self, resume_id: int) -> None:
+        """Flag a resume whose parsing task failed"""
+        uploaded_resume = self.repo.get_uploaded_resume_by_id(resume_id)
+        if uploaded_resume and uploaded_resume.import_status == "processing":
+            self.repo.update_resume_status(uploaded_resume, "failed")
+
+    def fail_stale_imports(self, stale_after: timedelta) -> int:
+        """
+        Fail resumes whose parsing never finished
+
+        A worker killed at the hard time limit (or by the OOM killer) never
+        runs the task's error handling, which would leave them "processing".
+        """
+        count = self.repo.fail_stale_processing(datetime.utcnow() - stale_after)
+        if count:
+            logger.warning(f"Marked {count} stale resume import(s) as failed")
+        return count
 
     def confirm_resume_import(self, resume_id: UUID, user_id: int, confirm: bool) -> ResumeImportStatus:
         """Confirm or reject a resume import"""
-        uploaded_resume = self.repo.get_uploaded_resume_by_uuid(resume_id)
+        uploaded_resume = self.repo.get_uploaded_resume_by_uuid(resume_id, with_data=True)
         if not uploaded_resume or uploaded_resume.user_id != user_id:
             raise HTTPException(status_code=404, message="Resume record not found")
+        if uploaded_resume.import_status == "processing":
+            raise HTTPException(status_code=409, message="Resume is still being processed")
 
         if confirm and uploaded_resume.import_status == "pending":
             logger.info(f"Importing data from resume {resume_id} into profile {uploaded_resume.profile.uuid}")
-            self._populate_profile(str(uploaded_resume.profile.uuid), uploaded_resume.extracted_data)
+            # Committed together with the status update below
+            ProfileImporter(self.db).populate(uploaded_resume.profile, uploaded_resume.extracted_data)
             status = "confirmed"
         else:
             status = "confirmed" if confirm else "rejected"
@@ -117,96 +228,24 @@ class ResumeImportService:
             updated_at=updated.updated_at
         )
 
-    def _populate_profile(self, profile_uuid: str, data: Dict[str, Any]) -> None:
-        """Populate profile sections using feature services"""
-        
-        # Mapping of data keys to their respective services and schemas
-        sections = [
-            ("education", self.education_service.create_education, EducationCreate),
-            ("work_experiences", self.work_exp_service.create_work_experience, WorkExperienceCreate),
-            ("skills", self.skills_service.create_skill, SkillCreate),
-            ("certificates", self.certificates_service.create_certificate, CertificateCreate),
-            ("languages", self.languages_service.create_language, LanguageCreate),
-            ("projects", self.projects_service.create_project, ProjectCreate),
-            ("professional_summaries", self.summary_service.create, ProfessionalSummaryCreate),
-            ("custom_sections", self.custom_sections_service.create_custom_section, CustomSectionCreate),
-        ]
-
-        # Update core profile info if available
-        contact = data.get("contact_info", {})
-        if contact:
-            from features.profiles.schemas import ProfileUpdate
-            db_profile = self.profile_repo.get_by_uuid(profile_uuid)
-            if db_profile:
-                update_data = ProfileUpdate(
-                    name=contact.get("name"),
-                    email=contact.get("email"),
-                    phone_number=contact.get("phone"),
-                    location=contact.get("location")
-                )
-                self.profile_repo.update(db_profile, update_data)
-
-        # Import each section
-        for key, create_method, schema_class in sections:
-            items = data.get(key, [])
-            if not isinstance(items, list): continue
-            
-            for item in items:
-                try:
-                    # Validate and convert raw dict to Pydantic model
-                    # This handles date string -> date object conversion automatically
-                    validated_item = schema_class.model_validate(item)
-                    create_method(profile_uuid, validated_item)
-                except Exception as e:
-                    # Log detailed field-level errors for Pydantic ValidationErrors
-                    try:
-                        from pydantic import ValidationError
-                        if isinstance(e, ValidationError):
-                            for err in e.errors():
-                                logger.warning(
-                                    f"  → {key} field '{'.'.join(str(l) for l in err['loc'])}': "
-                                    f"{err['msg']} (type={err['type']}, input={err.get('input')})"
-                                )
-                    except Exception:
-                        pass
-                    logger.warning(f"Skipping {key} item due to validation error: {e}")
-                    self.db.rollback()  # Reset transaction after failed item
-                    
-                    # Do not fall back if the item is already a custom section
-                    if key == "custom_sections":
-                        continue
-                        
-                    # ULTIMATE FAILSAFE: Convert failed item to a Custom Section to avoid data loss
-                    try:
-                        details = []
-                        for k, v in item.items():
-                            if v is not None:
-                                label = k.replace("_", " ").title()
-                                details.append(f"**{label}**: {v}")
-                        
-                        title = f"Unresolved {key.replace('_', ' ').title()} (Imported)"
-                        content = "\n".join(details)
-                        
-                        custom_schema = CustomSectionCreate(title=title, content=content)
-                        self.custom_sections_service.create_custom_section(profile_uuid, custom_schema)
-                        logger.info(f"Gracefully recovered failed {key} item into custom sections")
-                    except Exception as fallback_err:
-                        logger.error(f"Failed to save fallback custom section: {fallback_err}")
-                        self.db.rollback()
-
-    def get_resume_status(self, resume_id: UUID, user_id: int) -> ResumeImportStatus:
-        res = self.repo.get_uploaded_resume_by_uuid(resume_id)
+    def get_resume_status(
+        self, resume_id: UUID, user_id: int, include_markdown: bool = False
+    ) -> ResumeImportStatus:
+        res = self.repo.get_uploaded_resume_by_uuid(
+            resume_id, with_data=True, with_markdown=include_markdown
+        )
         if not res or res.user_id != user_id:
             raise HTTPException(status_code=404, message="Resume not found")
         return ResumeImportStatus(
             resume_id=res.uuid,
             status=res.import_status,
             extracted_data=res.extracted_data,
+            raw_markdown=res.raw_markdown if include_markdown else None,
             updated_at=res.updated_at
         )
 
     def get_user_resumes(self, user_id: int) -> Dict[str, Any]:
-        resumes = self.repo.get_resumes_by_user(user_id)
+        resumes = self.repo.get_resume_summaries_by_user(user_id)
         return {"resumes": [
             {
                 "resume_id": str(r.uuid),
@@ -0,0 +1,69 @@
+"""Celery tasks for resume parsing."""
+import logging
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+
+from core.celery_app import celery_app, run_async
+from core.config import get_settings
+from db.session import SessionLocal
+from .service import ResumeImportService
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(
+    name="resume_import.parse_resume",
+    bind=True,
+    time_limit=600,
+    soft_time_limit=550,
+)
+def parse_resume_task(self, resume_id: int, file_path: str, content_hash: Optional[str] = None) -> dict:
+    """
+    Parse an uploaded resume (Docling + LLM) and store the extracted data.
+
+    Args:
+        resume_id: ID of the UploadedResume in "processing" state
+        file_path: Path of the stored PDF (removed once processed)
+        content_hash: SHA-256 computed while the upload was streamed to disk
+
+    Returns:
+        Dictionary with the resume UUID and its new status
+    """
+    db = SessionLocal()
+    service = ResumeImportService(db)
+    try:
+        logger.info(f"Starting parsing of resume {resume_id}")
+        result = run_async(service.process_uploaded_resume(resume_id, file_path, content_hash))
+        logger.info(f"Resume parsing completed: {result}")
+        return result
+
+    except Exception as exc:
+        logger.error(f"Error parsing resume {resume_id}: {str(exc)}", exc_info=True)
+        db.rollback()
+        service.mark_resume_failed(resume_id)
+        raise
+
+    finally:
+        db.close()
+        Path(file_path).unlink(missing_ok=True)
+
+
+@celery_app.task(name="resume_import.fail_stale_imports")
+def fail_stale_imports_task() -> dict:
+    """
+    Mark resumes stuck in "processing" as failed (run periodically by beat).
+
+    The ``except`` in ``parse_resume_task`` does not run when the worker is
+    killed at the hard time limit, so without this the upload never leaves
+    "processing".
+
+    Returns:
+        Dictionary with the number of resumes marked failed
+    """
+    db = SessionLocal()
+    try:
+        stale_after = timedelta(seconds=get_settings().RESUME_PARSE_STALE_SECONDS)
+        return {"failed": ResumeImportService(db).fail_stale_imports(stale_after)}
+    finally:
+        db.close()
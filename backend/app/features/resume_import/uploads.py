@@ -0,0 +1,154 @@
+"""
+Streaming storage of uploaded resumes.
+
+Uploads are copied to ``RESUME_UPLOAD_DIR`` in fixed-size chunks while the
+size limit is enforced and the SHA-256 is computed, so a request never holds
+the whole file in memory and oversized files are rejected as soon as they
+cross the limit. The hash doubles as the conversion cache key. Batch uploads
+may also be ZIP archives, whose PDFs are extracted the same way.
+"""
+
+import asyncio
+import hashlib
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, List, Tuple, Union
+from uuid import uuid4
+
+from fastapi import UploadFile
+
+CHUNK_SIZE = 256 * 1024
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB
+
+
+class UploadTooLarge(Exception):
+    """The upload exceeded the size limit (nothing is left on disk)"""
+
+
+@dataclass
+class StoredUpload:
+    """An uploaded file persisted for the parsing worker"""
+
+    path: Path
+    filename: str
+    size: int
+    sha256: str
+
+
+async def store_upload(
+    upload: UploadFile,
+    directory: Union[str, Path],
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = CHUNK_SIZE,
+    suffix: str = ".pdf",
+) -> StoredUpload:
+    """
+    Copy an upload to ``directory`` chunk by chunk.
+
+    Args:
+        upload: File received by the endpoint
+        directory: Destination directory (created if missing)
+        max_bytes: Size limit; the partial file is removed when exceeded
+        chunk_size: Bytes read per iteration
+        suffix: Extension of the stored file
+
+    Returns:
+        Where the file was stored, with its size and SHA-256
+    """
+    # Multipart parsing already knows the size: reject before copying anything
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLarge(f"{upload.filename} is {upload.size} bytes")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{uuid4()}{suffix}"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := await upload.read(chunk_size):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLarge(f"{upload.filename} exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                await asyncio.to_thread(f.write, chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+
+    return StoredUpload(path=path, filename=upload.filename, size=size, sha256=digest.hexdigest())
+
+
+def _copy_member(
+    source: BinaryIO, directory: Path, filename: str, max_bytes: int, chunk_size: int
+) -> StoredUpload:
+    path = directory / f"{uuid4()}.pdf"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := source.read(chunk_size):
+                size += len(chunk)
+                # Count real bytes: the sizes in the ZIP directory can lie
+                if size > max_bytes:
+                    raise UploadTooLarge(f"{filename} exceeds {max_bytes} bytes")
+                digest.update(chunk)
+                f.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return StoredUpload(path=path, filename=filename, size=size, sha256=digest.hexdigest())
+
+
+def extract_pdfs(
+    zip_path: Union[str, Path],
+    directory: Union[str, Path],
+    max_files: int,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = CHUNK_SIZE,
+) -> Tuple[List[StoredUpload], List[str]]:
+    """
+    Extract the PDFs of a ZIP archive into ``directory``.
+
+    Args:
+        zip_path: Stored archive
+        directory: Destination directory
+        max_files: Maximum number of PDFs to extract; extra ones are rejected
+        max_bytes: Per-file size limit
+        chunk_size: Bytes copied per iteration
+
+    Returns:
+        The extracted PDFs and the names of rejected entries
+
+    Raises:
+        zipfile.BadZipFile: If the archive cannot be read
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stored: List[StoredUpload] = []
+    rejected: List[str] = []
+    try:
+        with zipfile.ZipFile(zip_path) as archive:
+            for info in archive.infolist():
+                name = PurePosixPath(info.filename).name
+                if info.is_dir() or info.filename.startswith("__MACOSX/") or name.startswith("."):
+                    continue
+                if (
+                    not name.lower().endswith(".pdf")
+                    or info.file_size > max_bytes
+                    or len(stored) >= max_files
+                ):
+                    rejected.append(name)
+                    continue
+                try:
+                    with archive.open(info) as source:
+                        stored.append(_copy_member(source, directory, name, max_bytes, chunk_size))
+                except (UploadTooLarge, zipfile.BadZipFile, RuntimeError, NotImplementedError):
+                    # Oversized, corrupt, encrypted or unsupported compression
+                    rejected.append(name)
+    except BaseException:
+        for upload in stored:
+            upload.path.unlink(missing_ok=True)
+        raise
+    return stored, rejected
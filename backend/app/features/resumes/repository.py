@@ -5,112 +5,121 @@ Handles all database operations for resumes and resume components.
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from .models import GeneratedResume
 from .models import ResumeComponent
 from .schemas import GeneratedResumeCreate, GeneratedResumeUpdate, ResumeComponentCreate, ResumeComponentUpdate
 
 
+def _as_uuid(value: str) -> Optional[UUID]:
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
 class ResumeRepository:
-    """Repository for resume database operations"""
+    """Repository for resume database operations (async, flushes and never commits)"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def create_resume(self, user_id: int, resume_data: GeneratedResumeCreate) -> GeneratedResume:
+    async def create_resume(self, user_id: int, resume_data: GeneratedResumeCreate) -> GeneratedResume:
         """Create a new resume"""
         db_resume = GeneratedResume(
             user_id=user_id,
             **resume_data.model_dump()
         )
         self.db.add(db_resume)
-        self.db.commit()
-        self.db.refresh(db_resume)
+        await self.db.flush()
         return db_resume
     
-    def get_resume_by_uuid(self, resume_uuid: str) -> Optional[GeneratedResume]:
+    async def get_resume_by_uuid(self, resume_uuid: str) -> Optional[GeneratedResume]:
         """Get resume by UUID with components"""
-        return (
-            self.db.query(GeneratedResume)
-            .options(joinedload(GeneratedResume.components))
-            .filter(GeneratedResume.uuid == resume_uuid)
-            .first()
+        return await self.db.scalar(
+            select(GeneratedResume)
+            .options(selectinload(GeneratedResume.components))
+            .where(GeneratedResume.uuid == _as_uuid(resume_uuid))
         )
     
-    def get_user_resumes(self, user_id: int, skip: int = 0, limit: int = 100) -> List[GeneratedResume]:
+    async def get_user_resumes(self, user_id: int, skip: int = 0, limit: int = 100) -> List[GeneratedResume]:
         """Get all resumes for a user, ordered by creation date (most recent first)"""
-        return (
-            self.db.query(GeneratedResume)
-            .options(joinedload(GeneratedResume.components))
-            .filter(GeneratedResume.user_id == user_id)
+        result = await self.db.scalars(
+            select(GeneratedResume)
+            .options(selectinload(GeneratedResume.components))
+            .where(GeneratedResume.user_id == user_id)
             .order_by(GeneratedResume.created_at.desc())
             .offset(skip)
             .limit(limit)
-            .all()
         )
+        return list(result)
     
-    def update_resume(self, db_resume: GeneratedResume, resume_update: GeneratedResumeUpdate) -> GeneratedResume:
+    async def update_resume(self, db_resume: GeneratedResume, resume_update: GeneratedResumeUpdate) -> GeneratedResume:
         """Update an existing resume"""
         update_data = resume_update.model_dump(exclude_unset=True)
         
         for field, value in update_data.items():
             setattr(db_resume, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_resume)
+        await self.db.flush()
         return db_resume
     
-    def delete_resume(self, db_resume: GeneratedResume) -> bool:
+    async def delete_resume(self, db_resume: GeneratedResume) -> bool:
         """Delete a resume and its components"""
-        self.db.delete(db_resume)
-        self.db.commit()
+        await self.db.delete(db_resume)
+        await self.db.flush()
         return True
     
-    def create_component(self, resume_id: int, component_data: ResumeComponentCreate) -> ResumeComponent:
+    async def create_component(self, resume_id: int, component_data: ResumeComponentCreate) -> ResumeComponent:
         """Create a new resume component"""
         db_component = ResumeComponent(
             resume_id=resume_id,
             **component_data.model_dump()
         )
         self.db.add(db_component)
-        self.db.commit()
-        self.db.refresh(db_component)
+        await self.db.flush()
         return db_component
     
-    def get_component_by_uuid(self, component_uuid: str) -> Optional[ResumeComponent]:
-        """Get resume component by UUID"""
-        return self.db.query(ResumeComponent).filter(ResumeComponent.uuid == component_uuid).first()
+    async def get_component_by_uuid(self, component_uuid: str) -> Optional[ResumeComponent]:
+        """Get resume component by UUID, with its resume (no lazy load on the async session)"""
+        return await self.db.scalar(
+            select(ResumeComponent)
+            .options(selectinload(ResumeComponent.generated_resume))
+            .where(ResumeComponent.uuid == _as_uuid(component_uuid))
+        )
     
-    def get_resume_components(self, resume_id: int) -> List[ResumeComponent]:
+    async def get_resume_components(self, resume_id: int) -> List[ResumeComponent]:
         """Get all components for a resume, ordered by order_index"""
-        return (
-            self.db.query(ResumeComponent)
-            .filter(ResumeComponent.resume_id == resume_id)
+        result = await self.db.scalars(
+            select(ResumeComponent)
+            .where(ResumeComponent.resume_id == resume_id)
             .order_by(ResumeComponent.order_index)
-            .all()
         )
+        return list(result)
     
-    def update_component(self, db_component: ResumeComponent, component_update: ResumeComponentUpdate) -> ResumeComponent:
+    async def update_component(self, db_component: ResumeComponent, component_update: ResumeComponentUpdate) -> ResumeComponent:
         """Update an existing resume component"""
         update_data = component_update.model_dump(exclude_unset=True)
         
         for field, value in update_data.items():
             setattr(db_component, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_component)
+        await self.db.flush()
         return db_component
     
-    def delete_component(self, db_component: ResumeComponent) -> bool:
+    async def delete_component(self, db_component: ResumeComponent) -> bool:
         """Delete a resume component"""
-        self.db.delete(db_component)
-        self.db.commit()
+        await self.db.delete(db_component)
+        await self.db.flush()
         return True
     
-    def get_resume_by_job_title(self, user_id: int, job_title: str) -> Optional[GeneratedResume]:
+    async def get_resume_by_job_title(self, user_id: int, job_title: str) -> Optional[GeneratedResume]:
         """Get resume by job title for a user"""
-        return (
-            self.db.query(GeneratedResume)
-            .filter(GeneratedResume.user_id == user_id, GeneratedResume.job_title == job_title)
-            .first()
+        return await self.db.scalar(
+            select(GeneratedResume)
+            .where(GeneratedResume.user_id == user_id, GeneratedResume.job_title == job_title)
+            .limit(1)
         )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -37,6 +37,11 @@ class User(Base):
     job_descriptions = relationship("JobDescription", back_populates="user")
     uploaded_resumes = relationship("UploadedResume", back_populates="user")
     
+    # Keyset pagination of the admin user listing
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
+    
     @property
     def is_admin(self) -> bool:
         """Check if user has admin role"""
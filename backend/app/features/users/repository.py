@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
 import uuid
+from core.pagination import DEFAULT_PAGE_SIZE, Page, keyset_page
 from .models import User
 from .schemas import UserCreate, UserUpdate
 
@@ -34,6 +35,10 @@ class UserRepository:
     def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         return self.db.query(User).offset(skip).limit(limit).all()
     
+    def get_page(self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        """One page of users, newest first (keyset paginated on created_at, id)"""
+        return keyset_page(self.db.query(User), User.created_at, User.id, cursor, limit)
+    
     def update(self, user_id: int, user_data: UserUpdate) -> Optional[User]:
         user = self.get_by_id(user_id)
         if user:
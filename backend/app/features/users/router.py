@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from core.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import List
@@ -6,6 +6,7 @@ from typing import List
 from features.auth.service import AuthService
 from features.auth.schemas import TokenData, UserRegister
 from features.users.models import User, UserRole
+from core.pagination import PageParams, page_params, set_next_cursor
 from db.session import  get_db
 from features.auth.dependencies import get_current_user_from_token, require_admin_from_token
 from features.users.service import UserService
@@ -74,10 +75,10 @@ def create_user(user_data: UserCreate, db: Session = Depends(get_db), admin_user
         raise HTTPException(status_code=400, message=str(e))
     
 @router.get("/", response_model=List[UserResponse])
-def list_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), admin_user: TokenData = Depends(require_admin_from_token)):
-    """List all users with pagination - Admin only"""
+def list_users(response: Response, page: PageParams = Depends(page_params), db: Session = Depends(get_db), admin_user: TokenData = Depends(require_admin_from_token)):
+    """List all users, newest first - Admin only (keyset paginated, see X-Next-Cursor)"""
     service = UserService(db)
-    return service.list_users(skip, limit)
+    return set_next_cursor(response, service.list_users_page(page.cursor, page.limit))
 @router.get("/{user_uuid}", response_model=UserResponse)
 def get_user_by_uuid_admin(user_uuid: str, db: Session = Depends(get_db), admin_user: TokenData = Depends(require_admin_from_token)):
     """Get user by UUID - Admin only"""
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List, Union
 import uuid
+from core.pagination import DEFAULT_PAGE_SIZE, Page
 from .repository import UserRepository
 from .schemas import UserCreate, UserUpdate, UserResponse
 
@@ -35,6 +36,10 @@ class UserService:
         users = self.repository.get_all(skip, limit)
         return [UserResponse.model_validate(user) for user in users]
     
+    def list_users_page(self, cursor: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+        page = self.repository.get_page(cursor, limit)
+        return Page(items=[UserResponse.model_validate(user) for user in page.items], next_cursor=page.next_cursor)
+    
     def update_user(self, user_id: int, user_data: UserUpdate) -> Optional[UserResponse]:
         user = self.repository.update(user_id, user_data)
         return UserResponse.model_validate(user) if user else None
@@ -3,11 +3,10 @@ import logging
 from typing import Optional
 from datetime import datetime
 import uuid
-import asyncio
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.celery_app import celery_app
+from core.celery_app import celery_app, run_async
 from core.config import get_settings
 from db.session import get_async_session
 from .service import EmbeddingService
@@ -23,19 +22,6 @@ async def _get_session() -> AsyncSession:
     return async_session()
 
 
-def _run_async(coro):
-    """Run an async coroutine safely, handling event loop conflicts."""
-    try:
-        loop = asyncio.get_running_loop()
-        if loop.is_running():
-            import nest_asyncio
-            nest_asyncio.apply()
-            return loop.run_until_complete(coro)
-    except RuntimeError:
-        pass
-    return asyncio.run(coro)
-
-
 @celery_app.task(
     name="embedding.index_profile",
     bind=True,
@@ -55,7 +41,7 @@ def index_profile_task(self, profile_uuid: str) -> dict:
     """
     try:
         logger.info(f"Starting profile indexing for profile {profile_uuid}")
-        result = _run_async(_index_profile_async(profile_uuid))
+        result = run_async(_index_profile_async(profile_uuid))
         logger.info(f"Profile indexing completed: {result}")
         return result
 
@@ -237,7 +223,7 @@ def index_entity_task(
     """
     try:
         logger.info(f"Generating embedding for entity {entity_uuid} ({entity_type})")
-        result = _run_async(_index_entity_async(entity_uuid, entity_type, text))
+        result = run_async(_index_entity_async(entity_uuid, entity_type, text))
         logger.info(f"Entity embedding completed: {result}")
         return result
 
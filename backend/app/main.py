@@ -8,6 +8,9 @@ import logging
 from core.config import get_settings
 from core.logging import setup_logging
 from core.exceptions import setup_exception_handlers
+from core.pagination import NEXT_CURSOR_HEADER
+from db.router import router as db_router
+from db.routing import DatabaseRoutingMiddleware
 from features import feature_routers
 
 # Setup
@@ -29,13 +32,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Tracks writes per request so replica reads fall back to the primary afterwards
+app.add_middleware(DatabaseRoutingMiddleware)
+
 # Exception handlers
 setup_exception_handlers(app)
 
 for router in feature_routers:
     app.include_router(router)
+app.include_router(db_router)
 
 @app.get("/health")
 async def health_check():
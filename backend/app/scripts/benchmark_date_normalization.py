@@ -0,0 +1,104 @@
+"""
+Benchmark date normalization against the previous per-call implementation.
+
+Usage (from backend/app):
+    python scripts/benchmark_date_normalization.py [--rounds 2000]
+
+The corpus mirrors the date formats seen in LLM-extracted resumes and job
+postings; each round normalizes every entry, like one batch of CVs would.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from shared.utils.date_normalization import _normalize_text, normalize_date_str  # noqa: E402
+
+CORPUS = [
+    "2021-03-15", "2019-09", "09/2019", "9/2019", "03-2020", "03.2020", "2020/11",
+    "2018.07", "2015", "Jan 2020", "January 2020", "Sept. 2019", "Sep 2019",
+    "septembre 2017", "janvier 2018", "Février 2016", "août 2014", "Mai 2022",
+    "Dec 2023", "décembre 2012", "Summer 2019", "Q3 2021", "Present", "present",
+    "Current", "en cours", "Now", "", "N/A", "2010 - 2014", "since 2016",
+    "March 2021", "Mar-2021", "04/2022 – Present", "Fall 2018", "1998",
+]
+
+
+def legacy_normalize_date_str(val: Any) -> Optional[str]:
+    """The implementation that used to live in pdf_parser_service.py"""
+    import re
+
+    if not val:
+        return None
+    val_str = str(val).strip()
+    if not val_str:
+        return None
+    if val_str.lower() in ("present", "current", "ongoing", "now", "active", "en cours", "today"):
+        return None
+    match = re.search(r"\b(19\d{2}|20\d{2})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b", val_str)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+    match = re.search(r"\b(0?[1-9]|1[0-2])[-/.\s]+(19\d{2}|20\d{2})\b", val_str)
+    if match:
+        return f"{match.group(2)}-{int(match.group(1)):02d}-01"
+    match = re.search(r"\b(19\d{2}|20\d{2})[-/.\s]+(0?[1-9]|1[0-2])\b", val_str)
+    if match:
+        return f"{match.group(1)}-{int(match.group(2)):02d}-01"
+    months_map = {
+        "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+        "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+        "janvier": 1, "fevrier": 2, "février": 2, "mars": 3, "avril": 4,
+        "mai": 5, "juin": 6, "juillet": 7, "aout": 8, "août": 8,
+        "septembre": 9, "octobre": 10, "novembre": 11, "decembre": 12, "décembre": 12
+    }
+    val_lower = val_str.lower()
+    for name, num in months_map.items():
+        if name in val_lower:
+            year_match = re.search(r"\b(19\d{2}|20\d{2})\b", val_str)
+            if year_match:
+                return f"{year_match.group(1)}-{num:02d}-01"
+    year_match = re.search(r"\b(19\d{2}|20\d{2})\b", val_str)
+    if year_match:
+        return f"{year_match.group(1)}-01-01"
+    return None
+
+
+def run(fn: Callable[[Any], Optional[str]], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for value in CORPUS:
+            fn(value)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    calls = args.rounds * len(CORPUS)
+
+    differences = [
+        (v, legacy_normalize_date_str(v), normalize_date_str(v))
+        for v in CORPUS
+        if legacy_normalize_date_str(v) != normalize_date_str(v)
+    ]
+    for value, old, new in differences:
+        print(f"  differs: {value!r}: {old} -> {new}")
+
+    legacy = run(legacy_normalize_date_str, args.rounds)
+    _normalize_text.cache_clear()
+    current = run(normalize_date_str, args.rounds)
+    _normalize_text.cache_clear()
+    uncached = run(_normalize_text.__wrapped__, args.rounds)
+
+    print(f"{calls} calls over {len(CORPUS)} formats")
+    print(f"  legacy     {legacy * 1e6 / calls:7.2f} µs/call")
+    print(f"  uncached   {uncached * 1e6 / calls:7.2f} µs/call")
+    print(f"  cached     {current * 1e6 / calls:7.2f} µs/call ({legacy / current:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
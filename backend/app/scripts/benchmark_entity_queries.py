@@ -0,0 +1,175 @@
+"""
+Benchmark Entity queries with and without blanket polymorphic loading.
+
+Usage (from backend/app):
+    python scripts/benchmark_entity_queries.py [--sections 200] [--rounds 50]
+        [--database-url postgresql://...]
+
+Without ``--database-url`` the queries run against an in-memory SQLite
+database. Against PostgreSQL the sample rows are created in a transaction
+that is rolled back at the end, and plans come from ``EXPLAIN ANALYZE``.
+
+Each query runs in these variants:
+    joined *   what every Entity query did with ``'with_polymorphic': '*'``
+    base       the default now: only the entities table is read
+    base+lazy  the default, then a subclass column is read (one SELECT per row)
+    selectin   opt-in ``selectin_polymorphic``: one extra SELECT per subclass
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import create_engine, event, select  # noqa: E402
+from sqlalchemy.orm import Session, joinedload, selectin_polymorphic, with_polymorphic  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from shared.models.registry import Base  # noqa: E402
+from shared.models.entity import Entity  # noqa: E402
+from features.users.models import User  # noqa: E402
+from features.profiles.models import Profile  # noqa: E402
+from features.profiles.certificates.models import Certificate  # noqa: E402
+from features.profiles.education.models import Education  # noqa: E402
+from features.profiles.skills.models import Skill  # noqa: E402
+from features.profiles.work_experiences.models import WorkExperience  # noqa: E402
+from features.vector_embeddings.models import Embedding  # noqa: E402
+
+SECTION_CLASSES = [WorkExperience, Education, Skill, Certificate]
+SECTION_FACTORIES = (
+    lambda i: WorkExperience(job_title=f"Engineer {i}", company="Acme", description="Built things"),
+    lambda i: Education(institution=f"University {i}", degree="MSc"),
+    lambda i: Skill(name=f"Skill {i}", category="Programming"),
+    lambda i: Certificate(name=f"Certificate {i}", issuing_organization="Vendor"),
+)
+
+
+def seed(session: Session, sections: int) -> Dict[str, List]:
+    user = User(email="benchmark@example.com", password_hash="x", first_name="Bench", last_name="Mark")
+    session.add(user)
+    session.flush()
+    profile = Profile(user_id=user.id)
+    session.add(profile)
+    session.flush()
+
+    rows = [SECTION_FACTORIES[i % len(SECTION_FACTORIES)](i) for i in range(sections)]
+    for row in rows:
+        row.profile_id = profile.id
+    session.add_all(rows)
+    session.flush()
+    session.add_all(
+        Embedding(entity_uuid=row.uuid, embedding_type="full_text", text_preview=f"row {i}")
+        for i, row in enumerate(rows)
+    )
+    session.flush()
+    return {"profile_id": profile.id, "uuids": [row.uuid for row in rows]}
+
+
+def scenarios(data: Dict) -> Dict[str, Dict[str, Callable[[Session], None]]]:
+    everything = with_polymorphic(Entity, "*", flat=True)
+    uuids = data["uuids"]
+
+    def read(entities, column: str) -> None:
+        for entity in entities:
+            getattr(entity, column)
+
+    def embedding_lookup(option, column: str = "profile_id"):
+        def run(session: Session) -> None:
+            embeddings = session.scalars(
+                select(Embedding).options(option).where(Embedding.entity_uuid.in_(uuids))
+            ).unique().all()
+            read((e.entity for e in embeddings), column)
+        return run
+
+    def entity_read(stmt, column: str = "profile_id"):
+        def run(session: Session) -> None:
+            read(session.scalars(stmt).all(), column)
+        return run
+
+    by_uuid = select(Entity).where(Entity.uuid.in_(uuids))
+    return {
+        "embeddings with their entity": {
+            "joined *": embedding_lookup(joinedload(Embedding.entity.of_type(everything))),
+            "base": embedding_lookup(joinedload(Embedding.entity), "entity_type"),
+            "base+lazy": embedding_lookup(joinedload(Embedding.entity)),
+            "selectin": embedding_lookup(
+                joinedload(Embedding.entity).selectin_polymorphic(SECTION_CLASSES)
+            ),
+        },
+        "sections read through Entity": {
+            "joined *": entity_read(select(everything).where(everything.uuid.in_(uuids))),
+            "base": entity_read(by_uuid, "entity_type"),
+            "base+lazy": entity_read(by_uuid),
+            "selectin": entity_read(by_uuid.options(selectin_polymorphic(Entity, SECTION_CLASSES))),
+        },
+        "one section type": {
+            "base": entity_read(select(WorkExperience).where(WorkExperience.profile_id == data["profile_id"])),
+        },
+    }
+
+
+class StatementLog:
+    """Records the statements a variant sends, to count them and explain the first"""
+
+    def __init__(self, engine):
+        self.statements: List[tuple] = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+
+
+def explain(session: Session, statement: str, parameters) -> List[str]:
+    connection = session.connection()
+    prefix = "EXPLAIN QUERY PLAN " if connection.dialect.name == "sqlite" else "EXPLAIN ANALYZE "
+    rows = connection.exec_driver_sql(prefix + statement, parameters).all()
+    return [" ".join(str(value) for value in row[-1:]) for row in rows]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--plans", action="store_true", help="Print the plan of each variant's first statement")
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_engine(args.database_url)
+    else:
+        engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+
+    session = Session(engine, autoflush=False)
+    log = StatementLog(engine)
+    try:
+        data = seed(session, args.sections)
+        print(f"{args.sections} sections, {args.rounds} rounds on {engine.dialect.name}")
+        for title, variants in scenarios(data).items():
+            print(title)
+            for name, run in variants.items():
+                session.expunge_all()
+                log.statements.clear()
+                run(session)
+                statements = list(log.statements)
+                joins = statements[0][0].upper().count(" JOIN ")
+
+                started = time.perf_counter()
+                for _ in range(args.rounds):
+                    session.expunge_all()
+                    run(session)
+                elapsed = (time.perf_counter() - started) * 1e3 / args.rounds
+
+                print(f"  {name:9} {elapsed:8.2f} ms/query  {len(statements):4} statements  {joins:2} joins")
+                if args.plans:
+                    for line in explain(session, *statements[0]):
+                        print(f"      {line}")
+    finally:
+        session.rollback()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
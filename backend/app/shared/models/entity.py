@@ -1,18 +1,22 @@
-from sqlalchemy import Column, Integer, DateTime, String, ForeignKey
+from sqlalchemy import Column, Integer, DateTime, String, ForeignKey, insert
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship
 from datetime import datetime
+from typing import Any, Dict, List, Sequence, Type, TypeVar
 import uuid
 from features.vector_embeddings.models import Embedding
 
 from shared.models.base import Base
 
+E = TypeVar('E', bound='Entity')
+
 class Entity(Base):
     """Main entity table - all domain entities inherit from this."""
     __tablename__ = 'entities'
     
     id = Column(Integer, primary_key=True)
-    uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4)
+    # Client-generated and unique: lets the ORM batch multi-row INSERT ... RETURNING
+    uuid = Column(UUID(as_uuid=True), unique=True, nullable=False, default=uuid.uuid4, insert_sentinel=True)
     entity_type = Column(String(50), nullable=False)  # Discriminator for entity type
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
@@ -20,10 +24,14 @@ class Entity(Base):
     # Relationship to embeddings - using string reference to avoid circular imports
     embeddings = relationship("Embedding", back_populates="entity", cascade="all, delete-orphan")
     
+    # Polymorphic loading is opt-in per query: a blanket 'with_polymorphic': '*'
+    # LEFT OUTER JOINs every subclass table into each Entity SELECT (including
+    # Embedding.entity). Rows still come back as their subclass; use
+    # with_polymorphic(Entity, [...]) or selectin_polymorphic() when a query
+    # needs subclass columns up front.
     __mapper_args__ = {
         'polymorphic_identity': 'entity',
         'polymorphic_on': entity_type,
-        'with_polymorphic': '*'
     }
 
 class BaseEntity(Entity):
@@ -34,3 +42,25 @@ class BaseEntity(Entity):
     def entity_name(self):
         """Return the entity type name for this entity."""
         return self.__tablename__
+
+
+def bulk_insert_entities(session: Session, model: Type[E], rows: Sequence[Dict[str, Any]]) -> List[E]:
+    """
+    Insert entities of one subclass in two statements, whatever their number.
+
+    One multi-row ``INSERT INTO entities ... RETURNING`` creates the parent rows,
+    matched back to the input by the ``uuid`` sentinel, then one multi-row INSERT
+    creates the subclass rows. Nothing is committed.
+
+    Args:
+        session: Session to insert with
+        model: Entity subclass, e.g. ``Skill``
+        rows: Column values per row; rows with the same keys share a statement
+
+    Returns:
+        The inserted instances, persistent in ``session``, in the order of ``rows``
+    """
+    if not rows:
+        return []
+    statement = insert(model).returning(model, sort_by_parameter_order=True)
+    return list(session.scalars(statement, list(rows)).all())
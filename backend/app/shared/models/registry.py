@@ -16,6 +16,7 @@ from features.outbox_events.models import OutboxEvent
 from features.profiles.professional_summaries.models import ProfessionalSummary
 from features.vector_embeddings.models import Embedding
 from features.resumes.models import GeneratedResume, ResumeComponent
+from features.llm.models import LLMCall
 from shared.models.base import Base
 
 # Export all models for easy import
@@ -39,5 +40,5 @@ __all__ = [
     "GeneratedResume",
     "ResumeComponent",
     "Embedding",
-    
+    "LLMCall",
 ]
@@ -0,0 +1,3 @@
+from .date_normalization import normalize_date_str
+
+__all__ = ["normalize_date_str"]
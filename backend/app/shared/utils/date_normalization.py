@@ -0,0 +1,79 @@
+"""
+Normalization of free-form dates found in resumes and job descriptions.
+
+LLM output and scraped postings carry dates as "03/2021", "2019-09",
+"Sept. 2020", "janvier 2018", "Present"... Everything is reduced to an ISO
+``YYYY-MM-DD`` string (day and month default to 01) or None for ongoing /
+unparseable values. Patterns are compiled once and results for repeated
+strings are cached, since the same few dates recur across a document.
+"""
+
+from datetime import date, datetime
+from functools import lru_cache
+import re
+from typing import Any, Optional
+
+PRESENT_WORDS = frozenset(
+    ("present", "current", "ongoing", "now", "active", "en cours", "today")
+)
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+    "janvier": 1, "fevrier": 2, "février": 2, "mars": 3, "avril": 4,
+    "mai": 5, "juin": 6, "juillet": 7, "aout": 8, "août": 8,
+    "septembre": 9, "octobre": 10, "novembre": 11, "decembre": 12, "décembre": 12
+}
+
+_YEAR = r"(19\d{2}|20\d{2})"
+_ISO_DATE = re.compile(rf"\b{_YEAR}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])\b")
+_MONTH_YEAR = re.compile(rf"\b(0?[1-9]|1[0-2])[-/.\s]+{_YEAR}\b")
+_YEAR_MONTH = re.compile(rf"\b{_YEAR}[-/.\s]+(0?[1-9]|1[0-2])\b")
+_YEAR_ONLY = re.compile(rf"\b{_YEAR}\b")
+# Longest names first so "septembre" wins over "sep"; month names must start
+# a word ("Sept.", "January" and "janvier" match, "summary" does not)
+_MONTH_NAME = re.compile(
+    r"(?<![^\W\d_])(" + "|".join(sorted(map(re.escape, MONTHS), key=len, reverse=True)) + ")",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_text(text: str) -> Optional[str]:
+    if text.lower() in PRESENT_WORDS:
+        return None
+
+    match = _ISO_DATE.search(text)
+    if match:
+        return match.group(0)
+
+    # MM/YYYY, M/YYYY, MM-YYYY, MM.YYYY
+    match = _MONTH_YEAR.search(text)
+    if match:
+        return f"{match.group(2)}-{int(match.group(1)):02d}-01"
+
+    # YYYY/MM, YYYY-MM, YYYY.MM
+    match = _YEAR_MONTH.search(text)
+    if match:
+        return f"{match.group(1)}-{int(match.group(2)):02d}-01"
+
+    year = _YEAR_ONLY.search(text)
+    if not year:
+        return None
+    month = _MONTH_NAME.search(text)
+    if month:
+        return f"{year.group(1)}-{MONTHS[month.group(1).lower()]:02d}-01"
+    return f"{year.group(1)}-01-01"
+
+
+def normalize_date_str(val: Any) -> Optional[str]:
+    """Normalize a date-like value to ``YYYY-MM-DD``, or None if absent/ongoing"""
+    if not val:
+        return None
+    if isinstance(val, (date, datetime)):
+        return val.strftime("%Y-%m-%d")
+    text = str(val).strip()
+    if not text:
+        return None
+    return _normalize_text(text)
+
@@ -0,0 +1,161 @@
+"""
+Unit tests for connection pool configuration and metrics
+"""
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from core.config import get_settings
+from db import pool as pool_module
+from db.pool import TimedAsyncQueuePool, TimedQueuePool, engine_options, instrument_engine, pool_snapshots
+
+
+@pytest.fixture(autouse=True)
+def engines(monkeypatch):
+    registry = {}
+    monkeypatch.setattr(pool_module, "_engines", registry)
+    return registry
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    created = []
+
+    def make(**options):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=TimedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            **options,
+        )
+        created.append(engine)
+        return engine
+
+    yield make
+    for engine in created:
+        engine.dispose()
+
+
+class TestPoolMetrics:
+    """Checkouts are timed and pool exhaustion is counted"""
+
+    def test_records_checkouts_and_timeouts(self, make_engine):
+        engine = make_engine(pool_timeout=0.05)
+        metrics = instrument_engine("test", engine, ping="never")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["checkouts"] == 1
+        assert snapshot["timeouts"] == 1
+        assert snapshot["checkout_wait_max_ms"] >= 0
+
+    def test_metrics_survive_pool_recreation(self, make_engine):
+        engine = make_engine()
+        metrics = instrument_engine("test", engine, ping="never")
+        with engine.connect():
+            pass
+
+        engine.dispose()
+        with engine.connect():
+            pass
+
+        assert engine.pool.metrics is metrics
+        assert metrics.snapshot()["checkouts"] == 2
+
+    def test_snapshot_reports_pool_usage(self, make_engine):
+        engine = make_engine()
+        instrument_engine("test", engine, ping="never")
+
+        with engine.connect():
+            [snapshot] = pool_snapshots()
+
+        assert snapshot["name"] == "test"
+        assert snapshot["pool_size"] == 1
+        assert snapshot["checked_out"] == 1
+        assert snapshot["checkouts"] == 1
+
+
+class TestIdlePing:
+    """The idle strategy pings only connections that sat in the pool"""
+
+    def test_pings_idle_connections_only(self, make_engine):
+        engine = make_engine()
+        metrics = instrument_engine("test", engine, ping="idle", idle_seconds=3600)
+        for _ in range(3):
+            with engine.connect():
+                pass
+        assert metrics.snapshot()["pings"] == 0
+
+        engine2 = make_engine()
+        metrics2 = instrument_engine("test2", engine2, ping="idle", idle_seconds=0)
+        for _ in range(3):
+            with engine2.connect():
+                pass
+        # The first checkout opens a new connection, the next two reuse it
+        assert metrics2.snapshot()["pings"] == 2
+
+    def test_stale_connection_is_replaced(self, make_engine, monkeypatch):
+        engine = make_engine()
+        metrics = instrument_engine("test", engine, ping="idle", idle_seconds=0)
+        with engine.connect():
+            pass
+
+        failures = [RuntimeError("server closed the connection")]
+        ping = engine.dialect.do_ping
+
+        def dead_once(dbapi_connection):
+            if failures:
+                raise failures.pop()
+            return ping(dbapi_connection)
+
+        monkeypatch.setattr(engine.dialect, "do_ping", dead_once)
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT 1")).scalar() == 1
+
+        assert metrics.snapshot()["stale_connections"] == 1
+
+
+class TestEngineOptions:
+    """Settings map to engine arguments"""
+
+    def test_pool_settings(self):
+        settings = get_settings().model_copy(update={
+            "DB_POOL_SIZE": 7, "DB_MAX_OVERFLOW": 3, "DB_POOL_TIMEOUT_SECONDS": 2.5, "DB_POOL_PING": "always",
+        })
+        options = engine_options(settings)
+
+        assert options["poolclass"] is TimedQueuePool
+        assert (options["pool_size"], options["max_overflow"], options["pool_timeout"]) == (7, 3, 2.5)
+        assert options["pool_pre_ping"] is True
+        assert "connect_args" not in options
+
+    def test_pgbouncer_mode_disables_asyncpg_statement_caches(self):
+        settings = get_settings().model_copy(update={"DB_PGBOUNCER_MODE": True, "DB_POOL_PING": "idle"})
+        options = engine_options(settings, is_async=True)
+
+        assert options["poolclass"] is TimedAsyncQueuePool
+        assert options["pool_pre_ping"] is False
+        assert options["connect_args"]["statement_cache_size"] == 0
+        assert options["connect_args"]["prepared_statement_cache_size"] == 0
+        name = options["connect_args"]["prepared_statement_name_func"]
+        assert name() != name()
+
+
+class TestPoolEndpoint:
+    """GET /api/v1/db/pools is admin only"""
+
+    def test_requires_admin(self, client, auth_headers):
+        assert client.get("/api/v1/db/pools", headers=auth_headers).status_code == 403
+
+    def test_lists_pools(self, client, created_user, auth_service, make_engine):
+        instrument_engine("test", make_engine(), ping="never")
+        token = auth_service.create_access_token(data={"sub": str(created_user.uuid), "role": "admin"})
+
+        response = client.get("/api/v1/db/pools", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        assert [pool["name"] for pool in response.json()["pools"]] == ["test"]
@@ -0,0 +1,149 @@
+"""
+Unit tests for read-replica routing
+"""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
+
+from db.routing import DatabaseRoutingMiddleware, ReplicaLagMonitor, RoutingSession
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    text: Mapped[str]
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    for engine in (primary, replica):
+        Base.metadata.create_all(engine)
+    # Tell the databases apart: the replica has three notes, the primary none
+    with replica.begin() as conn:
+        conn.execute(insert(Note), [{"text": "replicated"}] * 3)
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def make_session(engines):
+    primary, replica = engines
+
+    def make(monitor=None):
+        return sessionmaker(
+            class_=RoutingSession, primary=primary, replica=replica, monitor=monitor, expire_on_commit=False
+        )()
+
+    return make
+
+
+def count_notes(db) -> int:
+    return db.scalar(select(func.count(Note.id)))
+
+
+class StubMonitor(ReplicaLagMonitor):
+    def __init__(self, engine, lags, max_lag_seconds=5.0, check_interval=60.0):
+        super().__init__(engine, max_lag_seconds, check_interval)
+        self.lags = list(lags)
+
+    def _measure(self):
+        return self.lags.pop(0)
+
+
+class TestRoutingSession:
+    """Reads go to the replica until something writes"""
+
+    def test_reads_from_the_replica(self, make_session):
+        with make_session() as db:
+            assert count_notes(db) == 3
+
+    def test_writes_go_to_the_primary_and_later_reads_follow(self, make_session, engines):
+        with make_session() as db:
+            db.add(Note(text="new"))
+            db.flush()
+            assert count_notes(db) == 1
+            db.commit()
+
+        with engines[0].connect() as conn:
+            assert conn.scalar(select(Note.text)) == "new"
+
+    def test_bulk_statements_go_to_the_primary(self, make_session, engines):
+        with make_session() as db:
+            db.execute(insert(Note), [{"text": "a"}, {"text": "b"}])
+            assert count_notes(db) == 2
+            db.commit()
+
+    def test_without_replica_everything_uses_the_primary(self, engines):
+        with sessionmaker(class_=RoutingSession, primary=engines[0])() as db:
+            assert count_notes(db) == 0
+
+
+class TestReplicaLagMonitor:
+    """A lagging or unreachable replica is not read from"""
+
+    def test_stale_replica_falls_back_to_the_primary(self, make_session, engines):
+        monitor = StubMonitor(engines[1], lags=[10.0])
+        with make_session(monitor) as db:
+            assert count_notes(db) == 0
+        assert monitor.lag_seconds == 10.0
+
+    def test_lag_is_measured_once_per_interval(self, engines):
+        monitor = StubMonitor(engines[1], lags=[0.5, 10.0])
+        assert monitor.is_fresh()
+        assert monitor.is_fresh()
+        assert monitor.lags == [10.0]
+
+    def test_unreachable_replica_counts_as_stale(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        monitor = ReplicaLagMonitor(engine, max_lag_seconds=5.0)
+
+        assert not monitor.is_fresh()
+        assert monitor.lag_seconds is None
+
+
+class TestRequestWrites:
+    """A write anywhere in a request sends the rest of its reads to the primary"""
+
+    @pytest.fixture
+    def client(self, make_session):
+        app = FastAPI()
+        app.add_middleware(DatabaseRoutingMiddleware)
+
+        def get_write_db():
+            with make_session() as db:
+                yield db
+                db.commit()
+
+        def get_read_db():
+            with make_session() as db:
+                yield db
+
+        @app.post("/notes")
+        def create_and_count(write_db=Depends(get_write_db), read_db=Depends(get_read_db)):
+            write_db.add(Note(text="new"))
+            write_db.flush()
+            return {"count": count_notes(read_db)}
+
+        @app.get("/notes")
+        def count(read_db=Depends(get_read_db)):
+            return {"count": count_notes(read_db)}
+
+        return TestClient(app)
+
+    def test_read_after_write_uses_the_primary(self, client):
+        # The other session's insert is not committed yet, but the read is on the primary
+        assert client.post("/notes").json() == {"count": 0}
+
+    def test_state_does_not_leak_into_the_next_request(self, client):
+        client.post("/notes")
+        assert client.get("/notes").json() == {"count": 3}
@@ -0,0 +1,89 @@
+"""
+Unit tests for the tolerant LLM JSON parser
+"""
+import json
+
+import pytest
+
+from features.llm.json_repair import loads_tolerant, repair_json
+from features.llm.providers.groq import parse_tool_call_json
+
+
+SAMPLE = {
+    "contact_info": {"name": "Jane O'Neil", "email": "jane@example.com", "phone": None},
+    "work_experiences": [
+        {
+            "job_title": "Engineer",
+            "company": "Acme \"Labs\"",
+            "start_date": "2020-01-01",
+            "current": True,
+            "description": "Line one\nLine two é",
+            "years": 3.5,
+        },
+        {"job_title": "Intern", "current": False, "years": -1},
+    ],
+    "skills": ["Python", "SQL", []],
+}
+
+
+class TestLoadsTolerant:
+    """Test cases for loads_tolerant / repair_json"""
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            ('```json\n{"a": 1}\n```', {"a": 1}),
+            ('<function=extract>{"a": [1, 2,],}</function>', {"a": [1, 2]}),
+            ("{\"name\": \"O\\'Neil\"}", {"name": "O'Neil"}),
+            ('Here you go: {"a": "x"} hope it helps {"b": 2}', {"a": "x"}),
+            ('{"a": 1 "b": 2}', {"a": 1, "b": 2}),
+            ('{"a": True, "b": None}', {"a": True, "b": None}),
+            ('{"text": "line\nbreak"}', {"text": "line\nbreak"}),
+            ('{"a": {"b": [1, {"c": "tru', {"a": {"b": [1, {"c": "tru"}]}}),
+            ('{"a": tr', {"a": True}),
+            ('{"a": 12.', {"a": 12}),
+            ('{"a": 1, "b', {"a": 1}),
+            ('{"a": 1, "b":', {"a": 1, "b": None}),
+            ('{"a": "x\\u00', {"a": "x"}),
+            ('{"a": "x\\\n y"}', {"a": "x\\\n y"}),
+            ('{"a": "x\\\t\\\x01"}', {"a": "x\\\t\\\x01"}),
+        ],
+    )
+    def test_repairs_common_llm_output(self, raw, expected):
+        assert loads_tolerant(raw) == expected
+
+    def test_roots_restrict_the_top_level_value(self):
+        raw = '[TOOL_CALLS] {"a": 1}'
+        assert loads_tolerant(raw) == ["TOOL_CALLS"]
+        assert loads_tolerant(raw, roots="{") == {"a": 1}
+
+    def test_valid_json_takes_fast_path(self):
+        text = json.dumps(SAMPLE)
+        assert loads_tolerant(text) == SAMPLE
+
+    def test_no_json_returns_none(self):
+        assert loads_tolerant("Sorry, I cannot help with that.") is None
+        assert loads_tolerant("") is None
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_every_truncation_point_recovers_a_prefix(self, indent):
+        text = json.dumps(SAMPLE, indent=indent)
+        for cut in range(1, len(text)):
+            repaired = repair_json(text[:cut])
+            data = json.loads(repaired)  # must always be valid JSON
+            assert isinstance(data, dict)
+            assert set(data) <= set(SAMPLE)
+
+        # A cut just before the final brace loses nothing
+        assert loads_tolerant(text[:-1]) == SAMPLE
+
+    def test_truncated_fenced_tool_call_keeps_data(self):
+        text = "```json\n" + json.dumps(SAMPLE)
+        cut = text.index('"skills"')
+        data = parse_tool_call_json(text[:cut])
+        assert data["contact_info"] == SAMPLE["contact_info"]
+        assert data["work_experiences"] == SAMPLE["work_experiences"]
+
+    def test_parse_tool_call_json_rejects_non_objects(self):
+        assert parse_tool_call_json("[1, 2]") == {}
+        assert parse_tool_call_json("") == {}
@@ -0,0 +1,199 @@
+"""
+Unit tests for the LLM rate-limit-aware scheduler
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from features.llm.scheduler import LLMScheduler
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class FakeAPIError(Exception):
+    """Mimics the status_code/response attributes of provider SDK errors"""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = FakeResponse(headers or {})
+
+
+def make_scheduler(**overrides):
+    options = dict(
+        requests_per_minute=100,
+        tokens_per_minute=100_000,
+        max_concurrency=10,
+        max_retries=3,
+        base_delay=0.01,
+        max_delay=0.5,
+        window_seconds=0.2,
+    )
+    options.update(overrides)
+    return LLMScheduler("test", **options)
+
+
+class TestLLMScheduler:
+    """Test cases for LLMScheduler budgeting, retries and fairness"""
+
+    def test_retries_rate_limited_call_honouring_retry_after(self):
+        scheduler = make_scheduler()
+        attempts = []
+
+        async def call():
+            attempts.append(time.monotonic())
+            if len(attempts) < 3:
+                raise FakeAPIError(429, {"retry-after": "0.05"})
+            return "ok"
+
+        assert asyncio.run(scheduler.submit(call)) == "ok"
+        assert len(attempts) == 3
+        assert attempts[1] - attempts[0] >= 0.05
+        snapshot = scheduler.snapshot()
+        assert snapshot["rate_limited"] == 2
+        assert snapshot["retries"] == 2
+        assert snapshot["completed"] == 1
+
+    def test_non_retryable_error_is_raised_immediately(self):
+        scheduler = make_scheduler()
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise FakeAPIError(400)
+
+        with pytest.raises(FakeAPIError):
+            asyncio.run(scheduler.submit(call))
+        assert len(attempts) == 1
+        assert scheduler.snapshot()["failed"] == 1
+
+    def test_gives_up_after_max_retries(self):
+        scheduler = make_scheduler(max_retries=2)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            raise FakeAPIError(503)
+
+        with pytest.raises(FakeAPIError):
+            asyncio.run(scheduler.submit(call))
+        assert len(attempts) == 3
+
+    def test_requests_per_minute_budget_delays_excess_calls(self):
+        scheduler = make_scheduler(requests_per_minute=2)
+        started = []
+
+        async def call():
+            started.append(time.monotonic())
+            return True
+
+        async def run():
+            return await asyncio.gather(*(scheduler.submit(call) for _ in range(4)))
+
+        assert asyncio.run(run()) == [True] * 4
+        started.sort()
+        assert started[1] - started[0] < 0.1
+        assert started[2] - started[0] >= 0.19
+
+    def test_tokens_per_minute_budget_delays_excess_calls(self):
+        scheduler = make_scheduler(tokens_per_minute=100)
+        started = []
+
+        async def call():
+            started.append(time.monotonic())
+            return True
+
+        async def run():
+            await asyncio.gather(
+                scheduler.submit(call, estimated_tokens=80),
+                scheduler.submit(call, estimated_tokens=80),
+            )
+
+        asyncio.run(run())
+        assert started[1] - started[0] >= 0.19
+
+    def test_actual_usage_settles_reservation(self):
+        scheduler = make_scheduler()
+
+        async def call():
+            return {"total_tokens": 42}
+
+        asyncio.run(
+            scheduler.submit(call, estimated_tokens=500, usage=lambda r: r["total_tokens"])
+        )
+        assert scheduler.snapshot()["tokens_in_window"] == 42
+
+    def test_callers_are_served_round_robin(self):
+        scheduler = make_scheduler(max_concurrency=1)
+        order = []
+
+        def job(name):
+            async def call():
+                order.append(name)
+                await asyncio.sleep(0.01)
+            return call
+
+        async def run():
+            await asyncio.gather(
+                scheduler.submit(job("a1"), caller="alice"),
+                scheduler.submit(job("a2"), caller="alice"),
+                scheduler.submit(job("a3"), caller="alice"),
+                scheduler.submit(job("b1"), caller="bob"),
+            )
+
+        asyncio.run(run())
+        assert order == ["a1", "a2", "b1", "a3"]
+        snapshot = scheduler.snapshot()
+        assert snapshot["queue_depth"] == 0
+        assert snapshot["in_flight"] == 0
+
+    def test_waiters_on_other_threads_loops_are_woken(self):
+        # Celery's threads pool: every task runs its own asyncio.run in its own thread
+        scheduler = make_scheduler(requests_per_minute=1, window_seconds=0.5)
+        results = {}
+
+        def run(name):
+            async def call():
+                return name
+
+            results[name] = asyncio.run(scheduler.submit(call))
+
+        first = threading.Thread(target=run, args=("A",), daemon=True)
+        first.start()
+        first.join()
+        started = time.monotonic()
+        # B waits for A's window slot; A's loop is closed by then
+        second = threading.Thread(target=run, args=("B",), daemon=True)
+        second.start()
+        second.join(timeout=5)
+
+        assert results == {"A": "A", "B": "B"}
+        assert 0.3 <= time.monotonic() - started < 5
+
+    def test_threads_share_the_budget(self):
+        scheduler = make_scheduler(requests_per_minute=2, window_seconds=0.5, max_concurrency=1)
+        finished = []
+
+        def run(name):
+            async def call():
+                await asyncio.sleep(0.01)
+                return name
+
+            finished.append((asyncio.run(scheduler.submit(call)), time.monotonic()))
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=run, args=(name,), daemon=True) for name in "ABCD"]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert sorted(name for name, _ in finished) == ["A", "B", "C", "D"]
+        # Two requests per window: the last two wait for the first window to pass
+        assert max(at for _, at in finished) - started >= 0.5
+        assert scheduler.snapshot()["in_flight"] == 0
@@ -0,0 +1,85 @@
+"""
+Unit tests for LLM call telemetry
+"""
+import asyncio
+
+import pytest
+
+from features.llm import telemetry
+from features.llm.scheduler import LLMScheduler
+from features.llm.telemetry import TokenUsage, estimate_cost, submit_tracked
+
+
+class FakeAPIError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture
+def records(monkeypatch):
+    captured = []
+    monkeypatch.setattr(telemetry, "record_llm_call", lambda **fields: captured.append(fields))
+    return captured
+
+
+def make_scheduler():
+    return LLMScheduler(
+        "test", requests_per_minute=100, tokens_per_minute=100_000,
+        max_retries=3, base_delay=0.01, max_delay=0.05,
+    )
+
+
+class TestSubmitTracked:
+    """Test cases for submit_tracked"""
+
+    def test_records_usage_retries_and_cost(self, records):
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise FakeAPIError(503)
+            return {"prompt": 1000, "completion": 200, "cached": 600}
+
+        result = asyncio.run(
+            submit_tracked(
+                make_scheduler(),
+                call,
+                provider="groq",
+                model="llama-3.3-70b-versatile",
+                tool_name="extract_resume",
+                usage=lambda r: TokenUsage(r["prompt"], r["completion"], r["cached"]),
+            )
+        )
+
+        assert result["prompt"] == 1000
+        [record] = records
+        assert record["outcome"] == "success"
+        assert record["retries"] == 1
+        assert record["tool_name"] == "extract_resume"
+        assert record["prompt_tokens"] == 1000
+        assert record["completion_tokens"] == 200
+        assert record["cache_hit"] is True
+        assert record["cost_usd"] == pytest.approx((1000 * 0.59 + 200 * 0.79) / 1_000_000)
+        assert record["total_ms"] >= record["latency_ms"] >= 0
+
+    def test_records_failures(self, records):
+        async def call():
+            raise FakeAPIError(400)
+
+        with pytest.raises(FakeAPIError):
+            asyncio.run(
+                submit_tracked(
+                    make_scheduler(), call, provider="groq", model="m", usage=lambda r: TokenUsage()
+                )
+            )
+
+        [record] = records
+        assert record["outcome"] == "error"
+        assert record["error_type"] == "FakeAPIError"
+        assert record["retries"] == 0
+
+    def test_unknown_model_has_no_cost(self):
+        assert estimate_cost("some-model", TokenUsage(10, 10)) is None
+        assert estimate_cost("llama-3.1-8b-instant", TokenUsage()) is None
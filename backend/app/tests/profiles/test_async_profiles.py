@@ -0,0 +1,154 @@
+"""
+Unit tests for the async session dependency and the async profile service
+"""
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.pool import StaticPool
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+import db.session as db_session_module  # noqa: E402
+from core.exceptions import HTTPException  # noqa: E402
+from features.auth.dependencies import get_current_user_async  # noqa: E402
+from features.auth.service import AuthService  # noqa: E402
+from features.profiles import router as profiles_router  # noqa: E402
+from features.profiles.models import Profile  # noqa: E402
+from features.profiles.repository import AsyncProfileRepository  # noqa: E402
+from features.profiles.schemas import ProfileCreate, ProfileUpdate  # noqa: E402
+from features.profiles.service import AsyncProfileService  # noqa: E402
+from features.profiles.work_experiences.models import WorkExperience  # noqa: E402
+from features.users.models import User  # noqa: E402
+from shared.models.registry import Base  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False, autoflush=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def user_id(session_factory):
+    async with session_factory() as db:
+        user = User(email="async@example.com", password_hash="x", first_name="A", last_name="Sync")
+        db.add(user)
+        await db.commit()
+        return user.id
+
+
+def _service(db: AsyncSession) -> AsyncProfileService:
+    return AsyncProfileService(AsyncProfileRepository(db))
+
+
+@pytest.mark.asyncio
+class TestAsyncProfileService:
+    """Profile endpoints run on the async session"""
+
+    async def test_create_and_read(self, session_factory, user_id):
+        async with session_factory() as db:
+            created = await _service(db).create_profile(user_id, ProfileCreate(name="Ada"))
+            await db.commit()
+
+        async with session_factory() as db:
+            service = _service(db)
+            assert (await service.get_profile_by_uuid(str(created.uuid))).name == "Ada"
+            assert await service.check_profile_ownership(str(created.uuid), user_id)
+            assert not await service.check_profile_ownership(str(created.uuid), user_id + 1)
+            assert await service.get_profile_by_uuid("not-a-uuid") is None
+            with pytest.raises(ValueError):
+                await service.create_profile(user_id, ProfileCreate(name="Again"))
+
+    async def test_update_and_delete(self, session_factory, user_id):
+        async with session_factory() as db:
+            created = await _service(db).create_profile(user_id, ProfileCreate(name="Ada"))
+            updated = await _service(db).update_profile(str(created.uuid), ProfileUpdate(location="London"))
+            await db.commit()
+        assert updated.location == "London" and updated.name == "Ada"
+
+        async with session_factory() as db:
+            assert await _service(db).delete_profile(str(created.uuid))
+            await db.commit()
+        async with session_factory() as db:
+            assert await db.scalar(select(func.count(Profile.id))) == 0
+
+    async def test_full_profile_loads_sections(self, session_factory, user_id):
+        async with session_factory() as db:
+            created = await _service(db).create_profile(user_id, ProfileCreate(name="Ada"))
+            profile_id = await db.scalar(select(Profile.id).where(Profile.uuid == created.uuid))
+            db.add(WorkExperience(profile_id=profile_id, job_title="Engineer", company="Acme",
+                                  start_date=date(2020, 1, 1)))
+            await db.commit()
+
+        async with session_factory() as db:
+            full = await _service(db).get_full_profile(str(created.uuid), user_id)
+            with pytest.raises(PermissionError):
+                await _service(db).get_full_profile(str(created.uuid), user_id + 1)
+        assert [w.job_title for w in full.work_experiences] == ["Engineer"]
+
+
+@pytest.mark.asyncio
+class TestAsyncRoutes:
+    """Async routes use the async session for everything, including the user"""
+
+    async def test_current_user_is_loaded_on_the_async_session(self, session_factory, user_id):
+        async with session_factory() as db:
+            user_uuid = str(await db.scalar(select(User.uuid).where(User.id == user_id)))
+            token = AuthService.create_access_token({"sub": user_uuid})
+            assert (await get_current_user_async(token, db)).id == user_id
+
+            with pytest.raises(HTTPException) as exc_info:
+                await get_current_user_async("not-a-token", db)
+        assert exc_info.value.status_code == 401
+
+    async def test_delete_evicts_ownership_after_commit(self, session_factory, user_id, monkeypatch):
+        async with session_factory() as db:
+            created = await _service(db).create_profile(user_id, ProfileCreate(name="Ada"))
+            user = await db.get(User, user_id)
+            await db.commit()
+
+        async with session_factory() as db:
+            pending_at_eviction = []
+            monkeypatch.setattr(
+                profiles_router,
+                "invalidate_profile_ownership",
+                lambda profile_uuid, owner_id: pending_at_eviction.append(db.in_transaction()),
+            )
+            await profiles_router.delete_profile(str(user.uuid), str(created.uuid), user, _service(db), db)
+
+        assert pending_at_eviction == [False]
+
+
+@pytest.mark.asyncio
+class TestGetAsyncDb:
+    """The async dependency commits once, or rolls back on error"""
+
+    async def test_commits_after_the_endpoint(self, session_factory, user_id, monkeypatch):
+        monkeypatch.setattr(db_session_module, "AsyncSessionLocal", session_factory)
+        dependency = db_session_module.get_async_db()
+        db = await anext(dependency)
+        db.add(Profile(user_id=user_id, name="Ada"))
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+
+        async with session_factory() as check:
+            assert await check.scalar(select(func.count(Profile.id))) == 1
+
+    async def test_rolls_back_when_the_endpoint_raises(self, session_factory, user_id, monkeypatch):
+        monkeypatch.setattr(db_session_module, "AsyncSessionLocal", session_factory)
+        dependency = db_session_module.get_async_db()
+        db = await anext(dependency)
+        db.add(Profile(user_id=user_id, name="Ada"))
+        await db.flush()
+        with pytest.raises(RuntimeError):
+            await dependency.athrow(RuntimeError("endpoint failed"))
+
+        async with session_factory() as check:
+            assert await check.scalar(select(func.count(Profile.id))) == 0
@@ -0,0 +1,52 @@
+"""
+Unit tests for bulk entity insertion
+"""
+import pytest
+from sqlalchemy import event, select
+
+from features.profiles.skills.models import Skill
+from shared.models.entity import Entity, bulk_insert_entities
+
+
+@pytest.fixture
+def statements(db_session):
+    recorded = []
+
+    def record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+class TestBulkInsertEntities:
+    """Parent and subclass rows are inserted in one statement each"""
+
+    def test_inserts_in_two_statements(self, db_session, created_user, statements):
+        profile_id = created_user.profile.id
+        statements.clear()
+
+        skills = bulk_insert_entities(
+            db_session, Skill, [{"profile_id": profile_id, "name": f"Skill {i}"} for i in range(25)]
+        )
+
+        assert len(statements) == 2
+        assert statements[0].startswith("INSERT INTO entities")
+        assert statements[1].startswith("INSERT INTO skills")
+        assert [skill.name for skill in skills] == [f"Skill {i}" for i in range(25)]
+
+    def test_rows_are_complete_entities(self, db_session, created_user):
+        skills = bulk_insert_entities(
+            db_session, Skill, [{"profile_id": created_user.profile.id, "name": "Python"}]
+        )
+        db_session.commit()
+
+        skill = skills[0]
+        assert skill.id is not None and skill.uuid is not None and skill.created_at is not None
+        assert skill.entity_type == "skill"
+        assert db_session.scalars(select(Entity).where(Entity.uuid == skill.uuid)).one() is skill
+
+    def test_empty_rows(self, db_session, statements):
+        assert bulk_insert_entities(db_session, Skill, []) == []
+        assert statements == []
@@ -0,0 +1,82 @@
+"""
+Unit tests for opt-in polymorphic loading of entities
+"""
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import joinedload, selectin_polymorphic, with_polymorphic
+
+from features.profiles.skills.models import Skill
+from features.profiles.work_experiences.models import WorkExperience
+from features.vector_embeddings.models import Embedding
+from shared.models.entity import Entity
+
+
+@pytest.fixture
+def statements(db_session):
+    recorded = []
+
+    def record(conn, cursor, statement, *args):
+        recorded.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def sections(db_session, created_user):
+    profile_id = created_user.profile.id
+    rows = [
+        Skill(profile_id=profile_id, category="Programming", name="Python"),
+        WorkExperience(profile_id=profile_id, job_title="Engineer", company="Acme"),
+    ]
+    db_session.add_all(rows)
+    db_session.flush()
+    uuids = [row.uuid for row in rows]
+    db_session.add_all(Embedding(entity_uuid=uuid, embedding_type="full_text") for uuid in uuids)
+    db_session.commit()
+    db_session.expunge_all()
+    return uuids
+
+
+class TestEntityLoading:
+    """Entity queries read only the entities table unless asked otherwise"""
+
+    def test_entity_query_does_not_join_subclass_tables(self, db_session, sections, statements):
+        entities = db_session.scalars(select(Entity).order_by(Entity.id)).all()
+
+        assert len(statements) == 1
+        assert "JOIN" not in statements[0].upper()
+        # Rows still come back as their subclass
+        assert [type(e) for e in entities] == [Skill, WorkExperience]
+
+    def test_embedding_entity_joins_only_entities(self, db_session, sections, statements):
+        embeddings = db_session.scalars(
+            select(Embedding).options(joinedload(Embedding.entity)).order_by(Embedding.id)
+        ).unique().all()
+
+        assert len(statements) == 1
+        assert statements[0].upper().count("JOIN") == 1
+        assert [e.entity.entity_type for e in embeddings] == ["skill", "work_experience"]
+
+    def test_subclass_columns_load_on_access(self, db_session, sections):
+        skill = db_session.scalars(select(Entity).where(Entity.uuid == sections[0])).one()
+
+        assert skill.name == "Python"
+
+    def test_with_polymorphic_is_opt_in(self, db_session, sections, statements):
+        entity = with_polymorphic(Entity, [Skill, WorkExperience])
+        rows = db_session.scalars(select(entity).order_by(entity.id)).all()
+        names = [row.name if isinstance(row, Skill) else row.job_title for row in rows]
+
+        assert len(statements) == 1
+        assert names == ["Python", "Engineer"]
+
+    def test_selectin_polymorphic_loads_one_select_per_subclass(self, db_session, sections, statements):
+        rows = db_session.scalars(
+            select(Entity).options(selectin_polymorphic(Entity, [Skill, WorkExperience])).order_by(Entity.id)
+        ).all()
+        names = [row.name if isinstance(row, Skill) else row.job_title for row in rows]
+
+        assert len(statements) == 3
+        assert names == ["Python", "Engineer"]
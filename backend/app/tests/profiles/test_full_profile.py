@@ -0,0 +1,59 @@
+"""
+Unit tests for the aggregated profile read
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from features.profiles.education.models import Education
+from features.profiles.repository import ProfileRepository
+from features.profiles.service import ProfileService
+from features.profiles.skills.models import Skill
+from features.profiles.work_experiences.models import WorkExperience
+
+
+@pytest.fixture
+def filled_profile(db_session, created_user):
+    profile = created_user.profile
+    db_session.add_all([
+        WorkExperience(profile_id=profile.id, job_title="Junior", company="A", start_date=date(2015, 1, 1)),
+        WorkExperience(profile_id=profile.id, job_title="Senior", company="B", start_date=date(2020, 1, 1)),
+        Education(profile_id=profile.id, institution="Done", degree="BSc",
+                  start_date=date(2011, 9, 1), end_date=date(2014, 6, 1)),
+        Education(profile_id=profile.id, institution="Ongoing", degree="PhD",
+                  start_date=date(2020, 9, 1), end_date=None),
+        *[Skill(profile_id=profile.id, category="Programming", name=f"Skill {i}") for i in range(5)],
+    ])
+    db_session.commit()
+    return profile.uuid, created_user.id
+
+
+class TestFullProfile:
+    """Test cases for ProfileService.get_full_profile"""
+
+    def test_loads_all_sections_in_constant_queries(self, db_session, filled_profile):
+        profile_uuid, user_id = filled_profile
+        db_session.expunge_all()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        try:
+            full = ProfileService(ProfileRepository(db_session)).get_full_profile(profile_uuid, user_id)
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", record)
+
+        # The profile plus one query per section, however many items there are
+        assert len(statements) == 10
+        assert [w.job_title for w in full.work_experiences] == ["Senior", "Junior"]
+        assert [e.institution for e in full.education] == ["Ongoing", "Done"]
+        assert len(full.skills) == 5
+        assert full.languages == [] and full.links == []
+
+    def test_other_users_profile_is_forbidden(self, db_session, filled_profile):
+        profile_uuid, user_id = filled_profile
+        with pytest.raises(PermissionError):
+            ProfileService(ProfileRepository(db_session)).get_full_profile(profile_uuid, user_id + 1)
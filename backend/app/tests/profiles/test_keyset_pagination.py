@@ -0,0 +1,127 @@
+"""
+Tests for keyset pagination of section and user listings
+"""
+import base64
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from core.pagination import InvalidCursor, decode_cursor, encode_cursor
+from features.profiles.education.models import Education
+from features.profiles.education.service import EducationService
+from features.profiles.work_experiences.models import WorkExperience
+from features.users.models import User
+from features.users.repository import UserRepository
+
+
+def _raw_token(payload) -> str:
+    """A hand-made (tampered) cursor token"""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _collect(fetch, limit):
+    """Follow next cursors until the last page"""
+    pages, cursor = [], None
+    while True:
+        page = fetch(cursor, limit)
+        pages.append(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+class TestCursor:
+    """Test cases for cursor tokens"""
+
+    @pytest.mark.parametrize("key", [date(2020, 1, 31), datetime(2024, 5, 1, 12, 30, 15), None, "text"])
+    def test_round_trip(self, key):
+        assert decode_cursor(encode_cursor(key, 42)) == (key, 42)
+
+    @pytest.mark.parametrize("token", ["garbage", encode_cursor("a", 1)[:-3], "W10"])
+    def test_malformed_token_is_rejected(self, token):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(token)
+
+    @pytest.mark.parametrize("key", ["2020-01-31", 20200131, {"dt": "2020-01-31T08:00:00"}, {"x": 1}, [2020]])
+    def test_key_of_another_type_is_rejected(self, key):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(_raw_token([key, 1]), date)
+
+    @pytest.mark.parametrize("row_id", [True, 2 ** 63, "1", 1.5])
+    def test_bad_row_id_is_rejected(self, row_id):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(_raw_token([None, row_id]))
+
+    def test_matching_key_is_accepted(self):
+        assert decode_cursor(encode_cursor(date(2020, 1, 31), 7), date) == (date(2020, 1, 31), 7)
+        assert decode_cursor(encode_cursor(None, 7), date) == (None, 7)
+
+
+class TestSectionPagination:
+    """Test cases for paginated section listings"""
+
+    def test_pages_cover_all_rows_in_order(self, db_session, created_user):
+        profile_id = created_user.profile.id
+        end_dates = [date(2010 + i % 4, 6, 1) for i in range(9)] + [None, None]
+        db_session.add_all([
+            Education(profile_id=profile_id, institution=f"School {i}", degree="BSc",
+                      start_date=date(2005, 9, 1), end_date=d)
+            for i, d in enumerate(end_dates)
+        ])
+        db_session.commit()
+        service = EducationService(db_session)
+
+        pages = _collect(lambda cursor, limit: service.get_education_page(profile_id, cursor, limit), 3)
+
+        assert [len(p) for p in pages] == [3, 3, 3, 2]
+        items = [item for page in pages for item in page]
+        assert len({item.uuid for item in items}) == 11
+        # Ongoing entries first (as PostgreSQL sorts NULLs in DESC), then most recent first
+        keys = [item.end_date for item in items]
+        assert keys[:2] == [None, None]
+        assert keys[2:] == sorted(keys[2:], reverse=True)
+
+    def test_endpoint_returns_next_cursor_header(self, client, db_session, auth_headers, created_user):
+        profile = created_user.profile
+        db_session.add_all([
+            WorkExperience(profile_id=profile.id, job_title=f"Job {i}", company="Acme", start_date=date(2015 + i, 1, 1))
+            for i in range(3)
+        ])
+        db_session.commit()
+        url = f"/api/v1/profiles/{profile.uuid}/work-experiences/"
+
+        first = client.get(url, params={"limit": 2}, headers=auth_headers)
+        second = client.get(url, params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]}, headers=auth_headers)
+
+        assert [w["job_title"] for w in first.json()] == ["Job 2", "Job 1"]
+        assert [w["job_title"] for w in second.json()] == ["Job 0"]
+        assert "X-Next-Cursor" not in second.headers
+
+    @pytest.mark.parametrize("cursor", ["garbage", _raw_token(["not a date", 1])])
+    def test_invalid_cursor_is_a_bad_request(self, client, auth_headers, created_user, cursor):
+        response = client.get(
+            f"/api/v1/profiles/{created_user.profile.uuid}/work-experiences/",
+            params={"cursor": cursor}, headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+
+class TestUserPagination:
+    """Test cases for UserRepository.get_page"""
+
+    def test_pages_are_ordered_newest_first(self, db_session):
+        created = datetime(2024, 1, 1)
+        db_session.add_all([
+            User(email=f"user{i}@example.com", password_hash="x", first_name="U", last_name=str(i),
+                 created_at=created + timedelta(days=i // 2))
+            for i in range(7)
+        ])
+        db_session.commit()
+        repo = UserRepository(db_session)
+
+        pages = _collect(repo.get_page, 2)
+
+        users = [user for page in pages for user in page]
+        assert [len(p) for p in pages] == [2, 2, 2, 1]
+        assert [(u.created_at, u.id) for u in users] == sorted(((u.created_at, u.id) for u in users), reverse=True)
@@ -0,0 +1,119 @@
+"""
+Unit tests for the shared profile ownership dependency
+"""
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from core.cache import TTLCache
+from core.exceptions import HTTPException
+from db.session import get_db
+from main import app
+from features.profiles import dependencies
+from features.profiles.dependencies import get_owned_profile, invalidate_profile_ownership
+from features.profiles.skills.schemas import SkillCreate
+from features.profiles.skills.service import SkillService
+
+
+@pytest.fixture(autouse=True)
+def ownership_cache(monkeypatch):
+    cache = TTLCache(maxsize=100, ttl_seconds=60)
+    monkeypatch.setattr(dependencies, "_ownership_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def count_statements(db_session):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield statements
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+class TestGetOwnedProfile:
+    """Test cases for get_owned_profile"""
+
+    def test_resolves_once_then_uses_cache(self, db_session, created_user, count_statements):
+        profile = created_user.profile
+        profile_uuid, profile_id = profile.uuid, profile.id
+        count_statements.clear()
+
+        first = get_owned_profile(str(profile_uuid), current_user=created_user, db=db_session)
+        assert len(count_statements) == 1
+        second = get_owned_profile(str(profile_uuid), current_user=created_user, db=db_session)
+        assert len(count_statements) == 1
+        assert first == second
+        assert first.id == profile_id and first.uuid == profile_uuid
+
+    def test_other_users_profile_is_forbidden(self, db_session, created_user, ownership_cache):
+        profile_uuid = str(created_user.profile.uuid)
+        other_user = SimpleNamespace(id=created_user.id + 1)
+        with pytest.raises(HTTPException) as exc:
+            get_owned_profile(profile_uuid, current_user=other_user, db=db_session)
+        assert exc.value.status_code == 403
+        assert len(ownership_cache) == 0
+
+    @pytest.mark.parametrize("profile_uuid", ["not-a-uuid", str(uuid4())])
+    def test_unknown_profile_is_forbidden(self, db_session, created_user, profile_uuid):
+        with pytest.raises(HTTPException) as exc:
+            get_owned_profile(profile_uuid, current_user=created_user, db=db_session)
+        assert exc.value.status_code == 403
+
+    def test_invalidate_forces_a_new_lookup(self, db_session, created_user, count_statements):
+        profile_uuid = created_user.profile.uuid
+        get_owned_profile(str(profile_uuid), current_user=created_user, db=db_session)
+        invalidate_profile_ownership(profile_uuid, created_user.id)
+        count_statements.clear()
+
+        get_owned_profile(str(profile_uuid), current_user=created_user, db=db_session)
+        assert len(count_statements) == 1
+
+    def test_section_service_uses_resolved_id(self, db_session, created_user):
+        owned = get_owned_profile(str(created_user.profile.uuid), current_user=created_user, db=db_session)
+        service = SkillService(db_session)
+
+        service.create_skill(owned.id, SkillCreate(category="Programming", name="Python"))
+        assert [s.name for s in service.get_skills_by_profile(owned.id)] == ["Python"]
+
+
+class TestReadEndpoints:
+    """GET section endpoints resolve the user and the profile on the read session"""
+
+    @pytest.mark.parametrize("section", ["skills", "work-experiences", "languages", "links"])
+    def test_list_never_opens_a_primary_session(self, client, auth_headers, created_user, section):
+        def no_primary():
+            raise AssertionError("primary session opened by a read endpoint")
+            yield
+
+        app.dependency_overrides[get_db] = no_primary
+        response = client.get(f"/api/v1/profiles/{created_user.profile.uuid}/{section}/", headers=auth_headers)
+
+        assert response.status_code == 200
+
+
+class TestTTLCache:
+    """Test cases for the in-process TTL cache"""
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("core.cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl_seconds=5)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        now[0] += 5
+        assert cache.get("a") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
@@ -0,0 +1,140 @@
+"""
+Tests for the batch section endpoints
+"""
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+
+from core.cache import TTLCache
+from features.profiles import dependencies
+from features.profiles.skills.models import Skill
+
+
+@pytest.fixture(autouse=True)
+def ownership_cache(monkeypatch):
+    monkeypatch.setattr(dependencies, "_ownership_cache", TTLCache(maxsize=100, ttl_seconds=60))
+
+
+@pytest.fixture
+def section_url(created_user):
+    profile_uuid = created_user.profile.uuid
+    return lambda section: f"/api/v1/profiles/{profile_uuid}/{section}:batch"
+
+
+def _skills(count):
+    return [{"category": "Programming", "name": f"Skill {i}"} for i in range(count)]
+
+
+class TestSectionBatch:
+    """Test cases for POST/PATCH/DELETE <section>:batch"""
+
+    def test_create_inserts_all_items_at_once(self, client, db_session, auth_headers, section_url):
+        inserts = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("INSERT"):
+                inserts.append(statement)
+
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        try:
+            response = client.post(section_url("skills"), json={"items": _skills(40)}, headers=auth_headers)
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", record)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["succeeded"] == 40 and body["failed"] == 0
+        assert [r["index"] for r in body["results"]] == list(range(40))
+        assert all(r["status"] == "created" and r["item"]["name"] == f"Skill {r['index']}" for r in body["results"])
+        # One multi-row INSERT for ``entities`` and one for ``skills``
+        assert len(inserts) == 2
+        assert db_session.query(Skill).count() == 40
+
+    def test_update_reports_unknown_items(self, client, auth_headers, section_url):
+        created = client.post(section_url("skills"), json={"items": _skills(2)}, headers=auth_headers).json()
+        first, second = (r["uuid"] for r in created["results"])
+
+        response = client.patch(section_url("skills"), headers=auth_headers, json={"items": [
+            {"uuid": second, "name": "Renamed", "proficiency": "Expert"},
+            {"uuid": str(uuid4()), "name": "Missing"},
+        ]})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert (body["succeeded"], body["failed"]) == (1, 1)
+        assert body["results"][0]["item"]["name"] == "Renamed"
+        assert body["results"][0]["item"]["category"] == "Programming"
+        assert body["results"][1]["status"] == "not_found"
+
+    def test_delete_removes_only_own_items(self, client, db_session, auth_headers, section_url):
+        created = client.post(section_url("skills"), json={"items": _skills(3)}, headers=auth_headers).json()
+        uuids = [r["uuid"] for r in created["results"]]
+
+        response = client.request(
+            "DELETE", section_url("skills"), headers=auth_headers,
+            json={"uuids": uuids[:2] + [str(uuid4())]},
+        )
+
+        body = response.json()
+        assert [r["status"] for r in body["results"]] == ["deleted", "deleted", "not_found"]
+        assert [str(s.uuid) for s in db_session.query(Skill).all()] == uuids[2:]
+
+    def test_duplicate_languages_are_conflicts(self, client, auth_headers, section_url):
+        items = [
+            {"language": "English", "proficiency": "Native"},
+            {"language": "French", "proficiency": "Fluent"},
+            {"language": "English", "proficiency": "Fluent"},
+        ]
+
+        body = client.post(section_url("languages"), json={"items": items}, headers=auth_headers).json()
+
+        assert [r["status"] for r in body["results"]] == ["created", "created", "conflict"]
+
+    def test_duplicate_languages_ignore_case(self, client, auth_headers, section_url):
+        client.post(section_url("languages"), json={"items": [{"language": "English", "proficiency": "Native"}]},
+                    headers=auth_headers)
+        items = [{"language": "english", "proficiency": "Fluent"}, {"language": " ENGLISH ", "proficiency": "Fluent"}]
+
+        body = client.post(section_url("languages"), json={"items": items}, headers=auth_headers).json()
+
+        assert [r["status"] for r in body["results"]] == ["conflict", "conflict"]
+
+    def test_renaming_to_an_existing_language_is_a_conflict(self, client, db_session, auth_headers, section_url):
+        items = [{"language": name, "proficiency": "Fluent"} for name in ("English", "French", "German")]
+        english, french, german = (
+            r["uuid"] for r in
+            client.post(section_url("languages"), json={"items": items}, headers=auth_headers).json()["results"]
+        )
+
+        response = client.patch(section_url("languages"), headers=auth_headers, json={"items": [
+            {"uuid": french, "language": "English"},
+            {"uuid": german, "language": "french"},
+            {"uuid": german, "language": "Spanish"},
+            {"uuid": english, "language": "Spanish"},
+            {"uuid": english, "language": "ENGLISH"},
+        ]})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["status"] for r in body["results"]] == ["conflict", "conflict", "updated", "conflict", "updated"]
+        assert body["results"][0]["uuid"] == french
+
+    def test_first_summary_becomes_default(self, client, auth_headers, section_url):
+        items = [{"title": f"Summary {i}", "content": "..."} for i in range(3)]
+
+        body = client.post(section_url("professional-summaries"), json={"items": items}, headers=auth_headers).json()
+
+        assert [r["item"]["is_default"] for r in body["results"]] == [True, False, False]
+
+    def test_invalid_item_rejects_the_batch(self, client, auth_headers, section_url):
+        response = client.post(
+            section_url("skills"), json={"items": _skills(1) + [{"category": ""}]}, headers=auth_headers
+        )
+        assert response.status_code == 422
+
+    def test_requires_profile_ownership(self, client, auth_headers):
+        response = client.post(
+            f"/api/v1/profiles/{uuid4()}/skills:batch", json={"items": _skills(1)}, headers=auth_headers
+        )
+        assert response.status_code == 403
@@ -0,0 +1,93 @@
+"""
+Unit tests for the request-scoped unit of work used by section writes
+"""
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+import db.session as db_session_module
+from features.profiles.skills.models import Skill
+from features.profiles.skills.schemas import SkillCreate, SkillUpdate
+from features.profiles.skills.service import SkillService
+
+
+@pytest.fixture
+def statements(db_session):
+    recorded = []
+
+    def record(conn, cursor, statement, *args):
+        recorded.append(statement.split(None, 1)[0].upper())
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield recorded
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+class TestSectionWrites:
+    """Section repositories flush and leave the commit to the request"""
+
+    def test_create_does_not_reload_the_row(self, db_session, created_user, statements):
+        profile_id = created_user.profile.id
+        statements.clear()
+
+        skill = SkillService(db_session).create_skill(profile_id, SkillCreate(category="Programming", name="Python"))
+
+        # One INSERT for ``entities`` and one for ``skills``, no refresh SELECT
+        assert statements == ["INSERT", "INSERT"]
+        assert skill.uuid is not None and skill.created_at is not None
+
+    def test_update_does_not_reload_the_row(self, db_session, created_user, statements):
+        service = SkillService(db_session)
+        skill = service.create_skill(created_user.profile.id, SkillCreate(category="Programming", name="Python"))
+        statements.clear()
+
+        updated = service.update_skill_by_uuid(skill.uuid, SkillUpdate(name="Go"))
+
+        assert statements == ["SELECT", "UPDATE"]
+        assert updated.name == "Go"
+
+    def test_writes_are_not_committed_by_the_repository(self, db_session, created_user):
+        profile_id = created_user.profile.id
+        db_session.commit()
+        SkillService(db_session).create_skill(profile_id, SkillCreate(category="Programming", name="Python"))
+
+        db_session.rollback()
+        assert db_session.query(Skill).count() == 0
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def rollback(self):
+        self.calls.append("rollback")
+
+    def close(self):
+        self.calls.append("close")
+
+
+class TestGetDb:
+    """Test cases for the get_db unit of work"""
+
+    def test_commits_once_when_the_request_succeeds(self, monkeypatch):
+        session = _FakeSession()
+        monkeypatch.setattr(db_session_module, "SessionLocal", lambda: session)
+
+        with contextmanager(db_session_module.get_db)():
+            pass
+
+        assert session.calls == ["commit", "close"]
+
+    def test_rolls_back_when_the_request_fails(self, monkeypatch):
+        session = _FakeSession()
+        monkeypatch.setattr(db_session_module, "SessionLocal", lambda: session)
+
+        with pytest.raises(ValueError):
+            with contextmanager(db_session_module.get_db)():
+                raise ValueError("boom")
+
+        assert session.calls == ["rollback", "close"]
@@ -0,0 +1,37 @@
+"""
+Worker functions for the conversion pool tests.
+
+Kept free of application imports so spawned workers start quickly.
+"""
+import os
+import pickle
+import sys
+import time
+
+
+def echo_worker(path):
+    if path == "slow.pdf":
+        time.sleep(30)
+    if path == "crash.pdf":
+        os._exit(1)
+    if path == "fat.pdf":
+        return f"# {path}", 10_000
+    return f"# {path} from {os.getpid()}", 100
+
+
+def timed_worker(path):
+    # "sleep-<seconds>.pdf"
+    if path.startswith("sleep-"):
+        time.sleep(float(path[len("sleep-"):-len(".pdf")]))
+    return f"# {path}", 100
+
+
+def hog_worker(path):
+    data = bytearray(2 * 1024 ** 3)
+    return f"# {len(data)}", 100
+
+
+def unpickle_and_list_packages(payload):
+    # Unpickle like a worker receiving the pool's default initializer/worker_fn
+    pickle.loads(bytes.fromhex(payload))
+    return ",".join(sorted(name for name in ("features", "docling", "torch") if name in sys.modules)), 100
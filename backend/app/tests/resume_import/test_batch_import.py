@@ -0,0 +1,111 @@
+"""
+Unit tests for batch resume uploads
+"""
+import celery
+import pytest
+
+from core.exceptions import HTTPException
+from features.resume_import.models import UploadedResume
+from features.resume_import.service import ResumeImportService
+from features.resume_import.uploads import StoredUpload
+
+
+class FakeGroup:
+    """Records the signatures of a Celery group instead of sending them"""
+
+    sent = []
+
+    def __init__(self, signatures):
+        self.signatures = list(signatures)
+
+    def apply_async(self):
+        FakeGroup.sent.append(self.signatures)
+        return type("GroupResult", (), {"id": "group-1"})()
+
+
+class BrokenGroup(FakeGroup):
+    def apply_async(self):
+        raise ConnectionError("broker down")
+
+
+def _service(db_session, user):
+    service = ResumeImportService(db_session)
+    # get_by_uuid binds a string UUID, which only PostgreSQL accepts
+    service.profile_repo.get_by_uuid = lambda uuid: user.profile
+    return service
+
+
+def _uploads(tmp_path, count):
+    uploads = []
+    for i in range(count):
+        path = tmp_path / f"{i}.pdf"
+        path.write_bytes(b"%PDF")
+        uploads.append(StoredUpload(path=path, filename=f"cv-{i}.pdf", size=4, sha256=f"hash{i}"))
+    return uploads
+
+
+class TestResumeBatch:
+    """Test cases for enqueue_resume_batch and get_batch_status"""
+
+    def test_enqueues_one_task_per_file(self, db_session, created_user, tmp_path, monkeypatch):
+        monkeypatch.setattr(celery, "group", FakeGroup)
+        FakeGroup.sent = []
+        service = _service(db_session, created_user)
+
+        response = service.enqueue_resume_batch(
+            created_user.profile.uuid, created_user.id, _uploads(tmp_path, 3), ["notes.txt"]
+        )
+
+        assert response.total == 3
+        assert response.completed == 0
+        assert response.status_counts == {"processing": 3}
+        assert response.rejected_files == ["notes.txt"]
+        assert response.task_id == "group-1"
+        [signatures] = FakeGroup.sent
+        assert [sig.args[2] for sig in signatures] == ["hash0", "hash1", "hash2"]
+
+        rows = db_session.query(UploadedResume).filter_by(batch_id=response.batch_id).all()
+        assert sorted(r.original_filename for r in rows) == ["cv-0.pdf", "cv-1.pdf", "cv-2.pdf"]
+
+        rows[0].import_status = "pending"
+        rows[1].import_status = "failed"
+        db_session.commit()
+        status = service.get_batch_status(response.batch_id, created_user.id)
+        assert status.completed == 2
+        assert status.status_counts == {"pending": 1, "failed": 1, "processing": 1}
+
+    def test_broker_failure_marks_batch_failed(self, db_session, created_user, tmp_path, monkeypatch):
+        monkeypatch.setattr(celery, "group", BrokenGroup)
+        uploads = _uploads(tmp_path, 2)
+        service = _service(db_session, created_user)
+
+        with pytest.raises(HTTPException) as exc:
+            service.enqueue_resume_batch(created_user.profile.uuid, created_user.id, uploads, [])
+
+        assert exc.value.status_code == 503
+        assert {r.import_status for r in db_session.query(UploadedResume)} == {"failed"}
+        assert not any(u.path.exists() for u in uploads)
+
+    def test_other_users_batch_is_not_found(self, db_session, created_user, tmp_path, monkeypatch):
+        monkeypatch.setattr(celery, "group", FakeGroup)
+        service = _service(db_session, created_user)
+        response = service.enqueue_resume_batch(
+            created_user.profile.uuid, created_user.id, _uploads(tmp_path, 1), []
+        )
+
+        with pytest.raises(HTTPException) as exc:
+            service.get_batch_status(response.batch_id, created_user.id + 1)
+        assert exc.value.status_code == 404
+
+    def test_failure_before_queueing_removes_the_files(self, db_session, created_user, tmp_path):
+        uploads = _uploads(tmp_path, 2)
+        service = _service(db_session, created_user)
+
+        def broken_create_batch(**kwargs):
+            raise RuntimeError("database unavailable")
+
+        service.repo.create_batch = broken_create_batch
+        with pytest.raises(RuntimeError):
+            service.enqueue_resume_batch(created_user.profile.uuid, created_user.id, uploads, [])
+
+        assert not any(u.path.exists() for u in uploads)
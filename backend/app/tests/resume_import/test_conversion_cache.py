@@ -0,0 +1,89 @@
+"""
+Unit tests for the content-addressed conversion cache
+"""
+import asyncio
+import hashlib
+
+from features.resume_import.conversion_cache import ConversionCache, file_sha256
+from features.resume_import.pdf_parser_service import PDFParserService
+
+
+class FakeRedis:
+    """In-memory stand-in for the few Redis commands the cache uses"""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+
+class BrokenRedis:
+    def get(self, key):
+        raise ConnectionError("redis down")
+
+    def setex(self, key, ttl, value):
+        raise ConnectionError("redis down")
+
+
+class TestConversionCache:
+    """Test cases for ConversionCache"""
+
+    def test_round_trip_is_compressed_with_ttl(self):
+        client = FakeRedis()
+        cache = ConversionCache(client, ttl_seconds=60)
+        text = "## Experience\n" + "Built data pipelines in Python. " * 50
+
+        cache.set("abc", text)
+
+        key = cache.key("abc")
+        assert key.startswith("conversion:md:abc:")
+        assert client.ttls[key] == 60
+        assert len(client.store[key]) < len(text)
+        assert cache.get("abc") == text
+        assert cache.get("missing") is None
+
+    def test_key_changes_with_fingerprint(self):
+        cache = ConversionCache(FakeRedis(), ttl_seconds=60)
+        assert cache.key("abc", "v1") != cache.key("abc", "v2")
+
+    def test_redis_errors_are_misses(self):
+        cache = ConversionCache(BrokenRedis(), ttl_seconds=60)
+        cache.set("abc", "text")
+        assert cache.get("abc") is None
+
+    def test_file_sha256(self, tmp_path):
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"%PDF-1.4 sample")
+        assert file_sha256(path) == hashlib.sha256(b"%PDF-1.4 sample").hexdigest()
+
+
+class TestParserUsesCache:
+    """The parser converts each distinct PDF only once"""
+
+    def test_second_extraction_is_served_from_cache(self, tmp_path, monkeypatch):
+        cache = ConversionCache(FakeRedis(), ttl_seconds=60)
+        monkeypatch.setattr(
+            "features.resume_import.pdf_parser_service.get_conversion_cache", lambda: cache
+        )
+        calls = []
+
+        async def fake_convert(pdf_path):
+            calls.append(pdf_path)
+            return "# Jane Doe"
+
+        parser = PDFParserService()
+        monkeypatch.setattr(parser, "_convert", fake_convert)
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        first.write_bytes(b"same bytes")
+        second.write_bytes(b"same bytes")
+
+        assert asyncio.run(parser._extract_text(first)) == "# Jane Doe"
+        assert asyncio.run(parser._extract_text(second)) == "# Jane Doe"
+        assert calls == [first]
@@ -0,0 +1,134 @@
+"""
+Unit tests for the Docling conversion process pool
+"""
+import asyncio
+import multiprocessing
+import os
+import pickle
+import time
+
+import pytest
+
+from features.resume_import.conversion_pool import ConversionPool, ConversionTimeout
+from features.resume_import.pdf_parser_service import PDFParserService
+
+from .pool_workers import echo_worker, hog_worker, timed_worker, unpickle_and_list_packages
+
+
+def make_pool(**overrides):
+    options = dict(max_workers=1, timeout=20, max_tasks_per_child=10, max_rss_mb=1000,
+                   worker_fn=echo_worker, initializer=None)
+    options.update(overrides)
+    return ConversionPool(**options)
+
+
+class TestConversionPool:
+    """Test cases for ConversionPool timeouts and recycling"""
+
+    def test_converts_in_another_process(self):
+        pool = make_pool()
+        try:
+            markdown = asyncio.run(pool.convert("cv.pdf"))
+            assert markdown.startswith("# cv.pdf from ")
+            assert not markdown.endswith(str(os.getpid()))
+        finally:
+            pool.shutdown()
+
+    def test_timeout_kills_worker_and_pool_recovers(self):
+        pool = make_pool()
+        try:
+            # Spawn the worker first so the timeout only measures the conversion
+            asyncio.run(pool.convert("cv.pdf"))
+            pool.timeout = 0.5
+            with pytest.raises(ConversionTimeout):
+                asyncio.run(pool.convert("slow.pdf"))
+            assert pool.restarts == 1
+
+            pool.timeout = 20
+            assert asyncio.run(pool.convert("cv.pdf")).startswith("# cv.pdf")
+        finally:
+            pool.shutdown()
+
+    def test_crashed_worker_is_replaced(self):
+        pool = make_pool()
+        try:
+            with pytest.raises(Exception):
+                asyncio.run(pool.convert("crash.pdf"))
+            assert pool.restarts == 2  # retried once on a fresh pool
+            assert asyncio.run(pool.convert("cv.pdf")).startswith("# cv.pdf")
+        finally:
+            pool.shutdown()
+
+    def test_pool_recycled_when_worker_exceeds_rss_limit(self):
+        pool = make_pool()
+        try:
+            assert asyncio.run(pool.convert("fat.pdf")) == "# fat.pdf"
+            assert pool.restarts == 1
+            assert pool._executor is None
+        finally:
+            pool.shutdown()
+
+    def test_timeout_only_kills_the_stuck_worker(self):
+        # Processes left behind by other tests are not this pool's
+        earlier = set(multiprocessing.active_children())
+        pool = make_pool(max_workers=2, worker_fn=timed_worker)
+        try:
+            pool.warm_up()
+
+            async def start_both():
+                await asyncio.gather(pool.convert("a.pdf"), pool.convert("b.pdf"))
+
+            asyncio.run(start_both())
+            pool.timeout = 3
+
+            async def convert_both():
+                stuck = asyncio.ensure_future(pool.convert("sleep-60.pdf"))
+                await asyncio.sleep(2)
+                # Still running when the first conversion times out
+                other = await pool.convert("sleep-2.pdf")
+                with pytest.raises(ConversionTimeout):
+                    await stuck
+                return other
+
+            assert asyncio.run(convert_both()) == "# sleep-2.pdf"
+            assert pool.restarts == 1
+
+            # The stuck worker is killed once the other conversion is done
+            def own_children():
+                return [p for p in multiprocessing.active_children() if p not in earlier]
+
+            deadline = time.monotonic() + 20
+            while own_children() and time.monotonic() < deadline:
+                time.sleep(0.1)
+            assert own_children() == []
+        finally:
+            pool.shutdown()
+
+    def test_memory_limit_fails_the_conversion(self):
+        pool = make_pool(worker_fn=hog_worker, max_memory_mb=512)
+        try:
+            with pytest.raises(MemoryError):
+                asyncio.run(pool.convert("hog.pdf"))
+            assert pool.restarts == 1
+        finally:
+            pool.shutdown()
+
+    def test_timeout_reaches_the_parser_caller(self, monkeypatch):
+        parser = PDFParserService()
+
+        async def timed_out(pdf_path, content_hash=None):
+            raise ConversionTimeout("Conversion of cv.pdf timed out")
+
+        monkeypatch.setattr(parser, "_extract_text", timed_out)
+        with pytest.raises(ConversionTimeout):
+            asyncio.run(parser.extract_markdown("cv.pdf"))
+
+    def test_default_worker_functions_do_not_import_the_app(self):
+        defaults = ConversionPool()
+        payload = pickle.dumps((defaults.initializer, defaults.worker_fn)).hex()
+        pool = make_pool(worker_fn=unpickle_and_list_packages)
+        try:
+            # Docling itself is only imported when the models are loaded
+            assert asyncio.run(pool.convert(payload)) == ""
+        finally:
+            pool.shutdown()
@@ -0,0 +1,40 @@
+"""
+Unit tests for the shared Docling converter
+"""
+import threading
+
+import pypdfium2
+
+from core import docling_converter
+
+
+class TestDocumentConverter:
+    """Test cases for the process-wide converter and its warm-up document"""
+
+    def test_warmup_pdf_is_valid(self):
+        pdf = pypdfium2.PdfDocument(docling_converter._tiny_pdf())
+        try:
+            assert len(pdf) == 1
+            assert pdf[0].get_textpage().get_text_range() == "Warm-up"
+        finally:
+            pdf.close()
+
+    def test_converter_is_built_once_across_threads(self, monkeypatch):
+        built = []
+        monkeypatch.setattr(docling_converter, "_converter", None)
+        monkeypatch.setattr(
+            docling_converter, "_build_converter", lambda: built.append(object()) or built[-1]
+        )
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(docling_converter.get_document_converter()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(result is built[0] for result in results)
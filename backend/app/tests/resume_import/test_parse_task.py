@@ -0,0 +1,141 @@
+"""
+Unit tests for the resume parsing Celery tasks
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from features.resume_import import service as service_module
+from features.resume_import import tasks
+from features.resume_import.models import UploadedResume
+from features.resume_import.pdf_parser_service import PDFParserService, ResumeParsingError
+from features.resume_import.repository import ResumeImportRepository
+
+
+class FakeParser:
+    """Parser returning canned results, or failing like a broken PDF / LLM"""
+
+    error = None
+
+    async def extract_markdown(self, file_path, content_hash=None):
+        return "# Jane Doe\n\nEngineer"
+
+    async def parse_markdown(self, raw_text):
+        if self.error is not None:
+            raise self.error
+        return {"contact_info": {"name": "Jane Doe"}}
+
+
+@pytest.fixture
+def worker_db(db_session, monkeypatch):
+    """The tasks open their own sessions on the test database"""
+    monkeypatch.setattr(tasks, "SessionLocal", sessionmaker(bind=db_session.bind, expire_on_commit=False))
+    monkeypatch.setattr(service_module, "PDFParserService", FakeParser)
+    FakeParser.error = None
+    return db_session
+
+
+@pytest.fixture
+def queued(worker_db, created_user, tmp_path):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(b"%PDF")
+    resume = ResumeImportRepository(worker_db).create_uploaded_resume(
+        profile_id=created_user.profile.id,
+        user_id=created_user.id,
+        filename="cv.pdf",
+        extracted_data={},
+        import_status="processing",
+    )
+    return resume, path
+
+
+def _status(db_session, resume):
+    db_session.expire_all()
+    return db_session.get(UploadedResume, resume.id).import_status
+
+
+class TestParseResumeTask:
+    """parse_resume_task stores the result, or marks the resume failed"""
+
+    def test_success(self, worker_db, queued):
+        resume, path = queued
+
+        result = tasks.parse_resume_task.apply(args=(resume.id, str(path), "hash"))
+
+        assert result.successful()
+        assert result.result == {"resume_id": str(resume.uuid), "status": "pending"}
+        assert _status(worker_db, resume) == "pending"
+        assert not path.exists()
+
+    def test_failure_marks_resume_failed(self, worker_db, queued):
+        resume, path = queued
+        FakeParser.error = ResumeParsingError("Structured extraction failed: LLM unavailable")
+
+        result = tasks.parse_resume_task.apply(args=(resume.id, str(path), "hash"))
+
+        assert result.failed()
+        assert isinstance(result.result, ResumeParsingError)
+        assert _status(worker_db, resume) == "failed"
+        assert not path.exists()
+
+    def test_worker_killed_at_time_limit_is_reaped(self, worker_db, queued, created_user):
+        stuck, _ = queued
+        stuck.updated_at = datetime.utcnow() - timedelta(hours=1)
+        recent = ResumeImportRepository(worker_db).create_uploaded_resume(
+            profile_id=created_user.profile.id,
+            user_id=created_user.id,
+            filename="recent.pdf",
+            extracted_data={},
+            import_status="processing",
+        )
+        worker_db.commit()
+
+        result = tasks.fail_stale_imports_task.apply()
+
+        assert result.result == {"failed": 1}
+        assert _status(worker_db, stuck) == "failed"
+        assert _status(worker_db, recent) == "processing"
+
+    def test_reaped_resume_is_parsed_when_its_task_starts(self, worker_db, queued):
+        resume, path = queued
+        ResumeImportRepository(worker_db).update_resume_status(resume, "failed")
+
+        tasks.parse_resume_task.apply(args=(resume.id, str(path), "hash"))
+
+        assert _status(worker_db, resume) == "pending"
+
+
+class TestParserFailures:
+    """Conversion and LLM errors are raised, not turned into empty results"""
+
+    def test_conversion_error_is_raised(self, monkeypatch):
+        parser = PDFParserService()
+
+        async def broken(pdf_path, content_hash=None):
+            raise RuntimeError("Docling crashed")
+
+        monkeypatch.setattr(parser, "_extract_text", broken)
+        with pytest.raises(ResumeParsingError):
+            asyncio.run(parser.extract_markdown("cv.pdf"))
+
+    def test_empty_text_is_an_error(self, monkeypatch):
+        parser = PDFParserService()
+
+        async def empty(pdf_path, content_hash=None):
+            return "  \n"
+
+        monkeypatch.setattr(parser, "_extract_text", empty)
+        with pytest.raises(ResumeParsingError):
+            asyncio.run(parser.extract_markdown("cv.pdf"))
+
+    def test_llm_error_is_raised(self, monkeypatch):
+        parser = PDFParserService()
+
+        async def broken(**kwargs):
+            raise TimeoutError("LLM timed out")
+
+        monkeypatch.setattr(parser.llm_service, "parse_to_model_with_function_calling", broken)
+        with pytest.raises(ResumeParsingError):
+            asyncio.run(parser.parse_markdown("# Jane Doe\n\nEngineer at Acme since 2019"))
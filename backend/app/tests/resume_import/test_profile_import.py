@@ -0,0 +1,114 @@
+"""
+Unit tests for the bulk profile importer
+"""
+from sqlalchemy import event
+
+from features.profiles.custom_sections.models import CustomSection
+from features.profiles.education.models import Education
+from features.profiles.languages.models import Language
+from features.profiles.professional_summaries.models import ProfessionalSummary
+from features.profiles.skills.models import Skill
+from features.resume_import.profile_import import ProfileImporter
+
+EXTRACTED = {
+    "contact_info": {"name": "Jane Doe", "email": "jane@example.com"},
+    "education": [
+        {"institution": "MIT", "degree": "BSc", "field_of_study": "CS", "start_date": "2015-09-01"},
+        {"institution": "ETH", "degree": "MSc", "field_of_study": "CS", "start_date": "2019-09-01"},
+    ],
+    "skills": [
+        {"category": "Programming", "name": f"Skill {i}"} for i in range(20)
+    ],
+    "work_experiences": [
+        # Missing company and start date: kept as a custom section
+        {"job_title": "Engineer", "description": "Built things"},
+    ],
+    "professional_summaries": [
+        {"title": "Summary", "content": "Engineer"},
+        {"title": "Alt", "content": "Builder"},
+    ],
+}
+
+
+class TestProfileImporter:
+    """Test cases for ProfileImporter"""
+
+    def test_populates_profile_in_batches_without_committing(self, db_session, created_user):
+        profile = created_user.profile
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        def commit(conn):
+            committed.append(True)
+
+        committed = []
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        event.listen(db_session.bind, "commit", commit)
+        try:
+            summary = ProfileImporter(db_session).populate(profile, EXTRACTED)
+            db_session.flush()
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", record)
+            event.remove(db_session.bind, "commit", commit)
+
+        assert committed == []
+        assert summary.inserted["skills"] == 20
+        assert summary.inserted["education"] == 2
+        assert summary.recovered == 1
+        assert summary.dropped == 0
+
+        # entities + section table, once per section (education, skills,
+        # summaries, fallback custom section) rather than once per item
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        assert len(inserts) == 8
+
+        assert profile.name == "Jane Doe"
+        assert db_session.query(Skill).filter_by(profile_id=profile.id).count() == 20
+        assert db_session.query(Education).filter_by(profile_id=profile.id).count() == 2
+        fallback = db_session.query(CustomSection).filter_by(profile_id=profile.id).one()
+        assert fallback.title == "Unresolved Work Experiences (Imported)"
+        assert "**Job Title**: Engineer" in fallback.content
+        defaults = [
+            s.is_default
+            for s in db_session.query(ProfessionalSummary).order_by(ProfessionalSummary.id)
+        ]
+        assert defaults == [True, False]
+
+    def test_failed_batch_falls_back_to_row_by_row(self, db_session, created_user, monkeypatch):
+        profile = created_user.profile
+        importer = ProfileImporter(db_session)
+        real_add_all = db_session.add_all
+
+        def failing_add_all(objects):
+            real_add_all(objects)
+            # Break the batch: a second row with the first row's primary key
+            duplicate = Skill(id=-1, profile_id=profile.id, category="x", name="dup")
+            db_session.add(duplicate)
+            db_session.add(Skill(id=-1, profile_id=profile.id, category="y", name="dup2"))
+
+        monkeypatch.setattr(db_session, "add_all", failing_add_all)
+        summary = importer.populate(profile, {"skills": EXTRACTED["skills"][:3]})
+
+        assert summary.inserted["skills"] == 3
+        names = {s.name for s in db_session.query(Skill).filter_by(profile_id=profile.id)}
+        assert names == {"Skill 0", "Skill 1", "Skill 2"}
+
+    def test_duplicate_languages_become_custom_sections(self, db_session, created_user):
+        profile = created_user.profile
+        importer = ProfileImporter(db_session)
+        importer.populate(profile, {"languages": [{"language": "English", "proficiency": "Native"}]})
+
+        summary = importer.populate(profile, {"languages": [
+            {"language": "english ", "proficiency": "Fluent"},
+            {"language": "German", "proficiency": "Basic"},
+            {"language": "GERMAN", "proficiency": "Basic"},
+        ]})
+
+        languages = [lang.language for lang in db_session.query(Language).filter_by(profile_id=profile.id)]
+        assert sorted(languages) == ["English", "German"]
+        assert summary.inserted["languages"] == 1
+        assert summary.recovered == 2
+        titles = [c.title for c in db_session.query(CustomSection).filter_by(profile_id=profile.id)]
+        assert titles == ["Unresolved Languages (Imported)"] * 2
@@ -0,0 +1,71 @@
+"""
+Unit tests for Docling markdown prompt compaction
+"""
+from features.resume_import.prompt_compaction import PAGE_BREAK, compact_markdown
+
+
+class TestCompactMarkdown:
+    """Test cases for compact_markdown"""
+
+    def test_collapses_tables_into_compact_rows(self):
+        text = (
+            "| Degree        | School      | School      | Year |\n"
+            "|---------------|-------------|-------------|------|\n"
+            "| BSc Computing | MIT         | MIT         | 2019 |\n"
+            "|               |             |             |      |\n"
+        )
+        compacted, _ = compact_markdown(text)
+        assert compacted == "Degree | School | Year\nBSc Computing | MIT | 2019"
+
+    def test_normalizes_whitespace_and_strips_placeholders(self):
+        text = "## Jane   Doe\n\n\n\n<!-- image -->\n\n\tjane\\_doe@mail.com   \n"
+        compacted, _ = compact_markdown(text)
+        assert compacted == "## Jane Doe\n\njane_doe@mail.com"
+
+    def test_drops_repeated_page_headers_and_page_numbers(self):
+        pages = [
+            f"Jane Doe - Curriculum Vitae\n\n{content}\n\nResponsibilities:\n\nPage {n} of 3"
+            for n, content in enumerate(["Summary", "Experience", "Education"], start=1)
+        ]
+        compacted, _ = compact_markdown(f"\n\n{PAGE_BREAK}\n\n".join(pages))
+        lines = compacted.splitlines()
+        assert lines.count("Jane Doe - Curriculum Vitae") == 1
+        assert not any(line.startswith("Page ") for line in lines)
+        assert PAGE_BREAK not in compacted
+        # Labels and real content are kept even though they repeat
+        assert lines.count("Responsibilities:") == 3
+        assert "Education" in lines
+
+    def test_keeps_dates_of_every_job(self):
+        jobs = [("Acme", "2019 - 2021"), ("Globex", "2017 - 2019"), ("Initech", "2015 - 2017")]
+        pages = [
+            f"Jane Doe\n\n{company}\n\nEngineer\n\n{dates}\n\n{n}"
+            for n, (company, dates) in enumerate(jobs, start=1)
+        ]
+        compacted, _ = compact_markdown(f"\n\n{PAGE_BREAK}\n\n".join(pages))
+        lines = compacted.splitlines()
+        for company, dates in jobs:
+            assert company in lines and dates in lines
+        assert lines.count("Engineer") == 3
+        assert lines.count("Jane Doe") == 1
+        assert not any(line in ("1", "2", "3") for line in lines)
+
+    def test_keeps_numbers_and_lines_repeated_within_a_page(self):
+        text = "Jane Doe\n\nLanguages\n\n3\n\nTeam size\n\n12\n\nSee above\n\nSee above\n\nSee above"
+        compacted, _ = compact_markdown(text)
+        lines = compacted.splitlines()
+        assert "3" in lines and "12" in lines
+        assert lines.count("See above") == 3
+
+    def test_reports_token_savings(self):
+        text = "|  a  |  b  |\n|-----|-----|\n|  1  |  2  |\n" * 20
+        compacted, stats = compact_markdown(text)
+        assert stats.original_chars == len(text)
+        assert stats.compacted_chars == len(compacted)
+        assert stats.compacted_tokens < stats.original_tokens
+        assert 0 < stats.saved_ratio < 1
+
+    def test_empty_input(self):
+        compacted, stats = compact_markdown("")
+        assert compacted == ""
+        assert stats.saved_ratio == 0.0
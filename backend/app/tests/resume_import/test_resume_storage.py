@@ -0,0 +1,90 @@
+"""
+Unit tests for deferred loading of uploaded resume payloads
+"""
+import asyncio
+
+from sqlalchemy import event, inspect
+
+from features.resume_import.repository import ResumeImportRepository
+from features.resume_import.service import ResumeImportService
+
+BIG_PAYLOAD = {"custom_sections": [{"title": f"Section {i}", "content": "x" * 1000} for i in range(50)]}
+
+
+class RecordingStatements:
+    """Collects the SQL sent on a connection while active"""
+
+    def __init__(self, bind):
+        self.bind = bind
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, *args):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.bind, "before_cursor_execute", self._record)
+        return self.statements
+
+    def __exit__(self, *exc):
+        event.remove(self.bind, "before_cursor_execute", self._record)
+
+
+def _create(db_session, user):
+    return ResumeImportRepository(db_session).create_uploaded_resume(
+        profile_id=user.profile.id,
+        user_id=user.id,
+        filename="cv.pdf",
+        extracted_data=BIG_PAYLOAD,
+    )
+
+
+class TestResumePayloadLoading:
+    """Payloads are only read when a single resume is requested"""
+
+    def test_list_projects_summary_columns(self, db_session, created_user):
+        _create(db_session, created_user)
+        user_id = created_user.id
+        db_session.expunge_all()
+
+        with RecordingStatements(db_session.bind) as statements:
+            result = ResumeImportService(db_session).get_user_resumes(user_id)
+
+        assert [r["filename"] for r in result["resumes"]] == ["cv.pdf"]
+        assert len(statements) == 1
+        assert "extracted_data" not in statements[0]
+        assert "raw_markdown" not in statements[0]
+
+    def test_status_loads_payload_in_one_query(self, db_session, created_user):
+        resume = _create(db_session, created_user)
+        resume_uuid, user_id = resume.uuid, created_user.id
+        db_session.expunge_all()
+        repo = ResumeImportRepository(db_session)
+
+        plain = repo.get_uploaded_resume_by_uuid(resume_uuid)
+        assert "extracted_data" in inspect(plain).unloaded
+        db_session.expunge_all()
+
+        with RecordingStatements(db_session.bind) as statements:
+            status = ResumeImportService(db_session).get_resume_status(resume_uuid, user_id)
+            assert status.extracted_data == BIG_PAYLOAD
+            assert status.raw_markdown is None
+        assert len(statements) == 1
+
+    def test_worker_stores_raw_markdown(self, db_session, created_user):
+        resume = _create(db_session, created_user)
+
+        class FakeParser:
+            async def extract_markdown(self, file_path, content_hash=None):
+                return "# Jane Doe\n\nEngineer"
+
+            async def parse_markdown(self, raw_text):
+                return {"contact_info": {"name": "Jane Doe"}}
+
+        service = ResumeImportService(db_session)
+        service._pdf_parser = FakeParser()
+        asyncio.run(service.process_uploaded_resume(resume.id, "unused.pdf"))
+
+        status = service.get_resume_status(resume.uuid, created_user.id, include_markdown=True)
+        assert status.status == "pending"
+        assert status.extracted_data == {"contact_info": {"name": "Jane Doe"}}
+        assert status.raw_markdown == "# Jane Doe\n\nEngineer"
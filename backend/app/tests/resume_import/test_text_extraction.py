@@ -0,0 +1,34 @@
+"""
+Unit tests for the fast text-layer extractor
+"""
+from pathlib import Path
+
+from core.docling_converter import _tiny_pdf
+from features.resume_import.text_extraction import extract_text_layer, score_text
+
+SAMPLE_CV = Path(__file__).resolve().parents[2] / "scripts" / "FekiAymanCV.pdf"
+
+
+class TestTextLayerExtraction:
+    """Test cases for extract_text_layer and its quality score"""
+
+    def test_born_digital_cv_is_usable(self):
+        result = extract_text_layer(SAMPLE_CV)
+        assert result.page_count >= 1
+        assert result.scanned_pages == []
+        assert "EDUCATION" in result.text
+        assert result.is_usable(0.7)
+
+    def test_short_text_without_images_is_not_scanned(self, tmp_path):
+        pdf = tmp_path / "tiny.pdf"
+        pdf.write_bytes(_tiny_pdf())
+        result = extract_text_layer(pdf)
+        assert result.text == "Warm-up"
+        assert result.scanned_pages == []
+
+    def test_score_penalizes_garbage(self):
+        clean = "Senior Software Engineer at Acme, 2019 - 2023. Built data pipelines in Python."
+        garbled = "��  �# %% ��"
+        assert score_text(clean) > 0.8
+        assert score_text(garbled) == 0.0
+        assert score_text("") == 0.0
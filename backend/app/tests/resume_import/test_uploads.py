@@ -0,0 +1,164 @@
+"""
+Unit tests for streaming resume uploads to disk
+"""
+import asyncio
+import hashlib
+import zipfile
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+
+from features.resume_import.uploads import UploadTooLarge, extract_pdfs, store_upload
+
+
+class CountingFile(BytesIO):
+    """BytesIO that records the size of every read"""
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+class TestStoreUpload:
+    """Test cases for store_upload"""
+
+    def test_streams_in_chunks_and_hashes(self, tmp_path):
+        data = b"%PDF-1.4\n" + b"x" * 5000
+        source = CountingFile(data)
+        upload = UploadFile(source, filename="cv.pdf")
+
+        stored = asyncio.run(store_upload(upload, tmp_path / "uploads", chunk_size=1024))
+
+        assert stored.path.parent == tmp_path / "uploads"
+        assert stored.path.read_bytes() == data
+        assert stored.size == len(data)
+        assert stored.sha256 == hashlib.sha256(data).hexdigest()
+        assert stored.filename == "cv.pdf"
+        assert all(0 < size <= 1024 for size in source.reads)
+
+    def test_oversized_upload_is_rejected_midway(self, tmp_path):
+        source = CountingFile(b"x" * 10_000)
+        upload = UploadFile(source, filename="big.pdf")
+
+        with pytest.raises(UploadTooLarge):
+            asyncio.run(store_upload(upload, tmp_path, max_bytes=4096, chunk_size=1024))
+
+        assert list(tmp_path.iterdir()) == []
+        assert source.tell() <= 5 * 1024
+
+    def test_known_size_is_rejected_before_reading(self, tmp_path):
+        source = CountingFile(b"x" * 10_000)
+        upload = UploadFile(source, filename="big.pdf", size=10_000)
+
+        with pytest.raises(UploadTooLarge):
+            asyncio.run(store_upload(upload, tmp_path, max_bytes=4096))
+
+        assert source.reads == []
+        assert list(tmp_path.iterdir()) == []
+
+
+def _zip(path, members):
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return path
+
+
+class TestExtractPdfs:
+    """Test cases for extract_pdfs"""
+
+    def test_extracts_pdfs_and_reports_rejected_entries(self, tmp_path):
+        archive = _zip(tmp_path / "cvs.zip", {
+            "team/jane.pdf": b"%PDF jane",
+            "john.PDF": b"%PDF john",
+            "notes.txt": b"hello",
+            "__MACOSX/team/._jane.pdf": b"junk",
+            "huge.pdf": b"x" * 5000,
+        })
+
+        stored, rejected = extract_pdfs(archive, tmp_path / "out", max_files=10, max_bytes=1024)
+
+        assert [s.filename for s in stored] == ["jane.pdf", "john.PDF"]
+        assert stored[0].path.read_bytes() == b"%PDF jane"
+        assert stored[0].sha256 == hashlib.sha256(b"%PDF jane").hexdigest()
+        assert rejected == ["notes.txt", "huge.pdf"]
+        assert len(list((tmp_path / "out").iterdir())) == 2
+
+    def test_file_limit(self, tmp_path):
+        archive = _zip(tmp_path / "cvs.zip", {f"{i}.pdf": b"%PDF" for i in range(3)})
+
+        stored, rejected = extract_pdfs(archive, tmp_path / "out", max_files=2)
+
+        assert len(stored) == 2
+        assert rejected == ["2.pdf"]
+
+    def test_bad_archive(self, tmp_path):
+        bogus = tmp_path / "bogus.zip"
+        bogus.write_bytes(b"not a zip")
+        with pytest.raises(zipfile.BadZipFile):
+            extract_pdfs(bogus, tmp_path / "out", max_files=10)
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    from core.config import get_settings
+
+    directory = tmp_path / "uploads"
+    monkeypatch.setattr(get_settings(), "RESUME_UPLOAD_DIR", str(directory))
+    return directory
+
+
+def _stored_files(directory):
+    return list(directory.iterdir()) if directory.exists() else []
+
+
+class TestUploadCleanup:
+    """Uploads are never left on disk by a request that does not queue them"""
+
+    def test_anonymous_upload_is_not_stored(self, client, upload_dir):
+        response = client.post(
+            "/api/v1/resume-import/upload",
+            data={"profile_id": "00000000-0000-0000-0000-000000000000"},
+            files={"resume": ("cv.pdf", b"%PDF-1.4", "application/pdf")},
+        )
+
+        assert response.status_code in (401, 403)
+        assert _stored_files(upload_dir) == []
+
+    def test_failure_before_queueing_removes_the_file(self, db_session, created_user, tmp_path):
+        from features.resume_import.service import ResumeImportService
+
+        path = tmp_path / "cv.pdf"
+        path.write_bytes(b"%PDF")
+        service = ResumeImportService(db_session)
+        service.profile_repo.get_by_uuid = lambda uuid: created_user.profile
+
+        def broken_create(**kwargs):
+            raise RuntimeError("database unavailable")
+
+        service.repo.create_uploaded_resume = broken_create
+        with pytest.raises(RuntimeError):
+            service.enqueue_resume_parsing(created_user.profile.uuid, created_user.id, path, "hash", "cv.pdf")
+
+        assert not path.exists()
+
+    def test_anonymous_batch_is_not_stored(self, client, upload_dir):
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("a.pdf", b"%PDF-1.4")
+        response = client.post(
+            "/api/v1/resume-import/batch",
+            data={"profile_id": "00000000-0000-0000-0000-000000000000"},
+            files=[
+                ("files", ("cv.pdf", b"%PDF-1.4", "application/pdf")),
+                ("files", ("cvs.zip", archive.getvalue(), "application/zip")),
+            ],
+        )
+
+        assert response.status_code in (401, 403)
+        assert _stored_files(upload_dir) == []
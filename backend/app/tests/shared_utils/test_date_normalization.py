@@ -0,0 +1,46 @@
+"""
+Unit tests for shared date normalization
+"""
+from datetime import date
+
+import pytest
+
+from shared.utils.date_normalization import normalize_date_str
+
+
+class TestNormalizeDateStr:
+    """Test cases for normalize_date_str"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2021-03-15", "2021-03-15"),
+            ("09/2019", "2019-09-01"),
+            ("3.2020", "2020-03-01"),
+            ("2020/11", "2020-11-01"),
+            ("2015", "2015-01-01"),
+            ("Sept. 2019", "2019-09-01"),
+            ("January 2020", "2020-01-01"),
+            ("septembre 2017", "2017-09-01"),
+            ("Février 2016", "2016-02-01"),
+            ("août 2014", "2014-08-01"),
+            ("04/2022 – Present", "2022-04-01"),
+            ("Summer 2019", "2019-01-01"),
+            (date(2020, 5, 17), "2020-05-17"),
+        ],
+    )
+    def test_formats(self, value, expected):
+        assert normalize_date_str(value) == expected
+
+    @pytest.mark.parametrize("value", [None, "", "   ", "Present", "en cours", "N/A", "May"])
+    def test_ongoing_or_unparseable(self, value):
+        assert normalize_date_str(value) is None
+
+    def test_month_names_must_start_a_word(self):
+        # "mar" inside "Summary" is not March
+        assert normalize_date_str("Summary 2019") == "2019-01-01"
+
+    def test_parser_module_reexports(self):
+        from features.resume_import.pdf_parser_service import normalize_date_str as reexported
+
+        assert reexported is normalize_date_str
@@ -1,5 +1,5 @@
 // filepath: frontend/app/api/profile.ts
-import type { Profile, ProfileCreate, ProfileUpdate } from '~/types/profile'
+import type { Profile, ProfileCreate, ProfileFull, ProfileUpdate } from '~/types/profile'
 
 export interface IndexingResponse {
   task_id: string
@@ -45,6 +45,14 @@ export const profileApi = {
     })
   },
 
+  // Profile plus every section in one request
+  async getFullProfile(profileId: string): Promise<ProfileFull> {
+    return await $fetch<ProfileFull>(getApiUrl(`/api/v1/profiles/${profileId}/full`), {
+      method: 'GET',
+      headers: getAuthHeaders(),
+    })
+  },
+
   async createProfile(userId: string, data: ProfileCreate): Promise<Profile> {
     return await $fetch<Profile>(getApiUrl('/api/v1/profiles/'), {
       method: 'POST',
@@ -16,14 +16,31 @@ const getAuthHeaders = (): Record<string, string> => {
   return {}
 }
 
+// Keyset-paginated lists (education, work experiences, certificates) return one
+// page at a time and the cursor of the next one in this header
+const NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+// Fetch every page of a list endpoint by following the next cursor
+async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = []
+  let cursor: string | null = null
+  do {
+    const response = await $fetch.raw<T[]>(url, {
+      headers: getAuthHeaders(),
+      query: cursor ? { cursor } : undefined
+    })
+    items.push(...(response._data ?? []))
+    cursor = response.headers.get(NEXT_CURSOR_HEADER)
+  } while (cursor)
+  return items
+}
+
 // Generalized API hook for hitting nested profile endpoints
 function createSectionApi<T>(endpoint: string) {
   return {
     // Note: profileUuid must be the UUID string
     getAll: (profileUuid: string) => 
-      $fetch<T[]>(getApiUrl(`/api/v1/profiles/${profileUuid}/${endpoint}`), {
-        headers: getAuthHeaders()
-      }),
+      fetchAllPages<T>(getApiUrl(`/api/v1/profiles/${profileUuid}/${endpoint}`)),
       
     create: (profileUuid: string, data: Omit<T, 'uuid'>) => 
       $fetch<T>(getApiUrl(`/api/v1/profiles/${profileUuid}/${endpoint}/`), {
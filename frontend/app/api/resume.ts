@@ -1,5 +1,5 @@
 // filepath: frontend/app/api/resume.ts
-import type { ResumeImportResponse, ResumeImportStatus } from '~/types/resume'
+import type { ResumeImportResponse, ResumeImportStatus, ResumeParseTaskStatus } from '~/types/resume'
 
 const getApiUrl = (endpoint: string) => {
   const config = useRuntimeConfig()
@@ -16,7 +16,7 @@ const getAuthHeaders = (): Record<string, string> => {
 
 export const resumeApi = {
   /**
-   * Upload a PDF resume and trigger AI extraction.
+   * Upload a PDF resume and queue AI extraction (returns a task_id to poll).
    * Form fields must match backend: profile_id (string) + resume (File).
    */
   async uploadResume(profileId: string, file: File): Promise<ResumeImportResponse> {
@@ -31,6 +31,14 @@ export const resumeApi = {
     })
   },
 
+  /** Poll the background parsing task of an uploaded resume. */
+  async getParseTaskStatus(taskId: string): Promise<ResumeParseTaskStatus> {
+    return await $fetch<ResumeParseTaskStatus>(getApiUrl(`/api/v1/tasks/${taskId}`), {
+      method: 'GET',
+      headers: getAuthHeaders(),
+    })
+  },
+
   /** Poll the status / extracted data of a previously uploaded resume. */
   async getResumeStatus(resumeId: string): Promise<ResumeImportStatus> {
     return await $fetch<ResumeImportStatus>(getApiUrl(`/api/v1/resume-import/status/${resumeId}`), {
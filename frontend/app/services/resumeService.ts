@@ -18,6 +18,29 @@ export const resumeService = {
     }
   },
 
+  /**
+   * Wait for the background parsing task, then return the extracted data.
+   * Polls every `intervalMs` for up to `timeoutMs`.
+   */
+  async waitForParsing(
+    upload: ResumeImportResponse,
+    intervalMs: number = 2000,
+    timeoutMs: number = 10 * 60 * 1000,
+  ): Promise<ResumeImportStatus> {
+    if (!upload.task_id) return resumeApi.getResumeStatus(upload.resume_id)
+
+    const deadline = Date.now() + timeoutMs
+    while (Date.now() < deadline) {
+      const task = await resumeApi.getParseTaskStatus(upload.task_id)
+      if (task.status === 'completed') return resumeApi.getResumeStatus(upload.resume_id)
+      if (task.status === 'failed' || task.status === 'cancelled') {
+        throw new Error(task.error || 'Resume parsing failed. Please try again or fill your profile manually.')
+      }
+      await new Promise(resolve => setTimeout(resolve, intervalMs))
+    }
+    throw new Error('Resume parsing is taking too long. Please try again later.')
+  },
+
   /** Poll status until the resume is no longer "pending", or return current state. */
   async getResumeStatus(resumeId: string): Promise<ResumeImportStatus> {
     return resumeApi.getResumeStatus(resumeId)
@@ -110,5 +110,17 @@ export interface CustomSection {
   updated_at?: string
 }
 
+export interface ProfileFull extends Profile {
+  professional_summaries: ProfessionalSummary[]
+  work_experiences: WorkExperience[]
+  education: Education[]
+  skills: Skill[]
+  projects: Project[]
+  certificates: Certificate[]
+  languages: Language[]
+  links: ProfileLink[]
+  custom_sections: CustomSection[]
+}
+
 export type ProfileCreate = Omit<Profile, 'uuid' | 'user_id' | 'created_at' | 'updated_at'>
 export type ProfileUpdate = Partial<ProfileCreate>
@@ -1,7 +1,8 @@
 export interface ResumeImportResponse {
   resume_id: string
   filename: string
-  status: 'pending' | 'confirmed' | 'rejected' | string
+  status: 'processing' | 'pending' | 'failed' | 'confirmed' | 'rejected' | string
+  task_id?: string | null
   extracted_data: {
     contact_info?: {
       name?: string
@@ -69,7 +70,14 @@ export interface ResumeImportResponse {
 
 export interface ResumeImportStatus {
   resume_id: string
-  status: 'pending' | 'confirmed' | 'rejected' | string
+  status: 'processing' | 'pending' | 'failed' | 'confirmed' | 'rejected' | string
   extracted_data?: ResumeImportResponse['extracted_data']
   updated_at: string
 }
+
+export interface ResumeParseTaskStatus {
+  task_id: string
+  status: 'pending' | 'in_progress' | 'completed' | 'failed' | 'retrying' | 'cancelled' | string
+  result: { resume_id: string; status: string } | null
+  error: string | null
+}